@@ -0,0 +1,57 @@
+"""
+반도체 소자 시뮬레이션 라이브러리.
+
+소자 모델(MOSFET, BJT)은 NumPy만 사용하므로 Streamlit 없이 배치 작업이나 워커에서 바로 import 할 수 있다.
+그래프 등 무거운 의존성이 필요한 하위 모듈은 처음 접근할 때만 로딩된다.
+
+    >>> import semisim
+    >>> semisim.calculate_id(2.0, [0.5, 1.0, 2.0], W=10, L=10, N_D=1e19, N_A=1e16)
+"""
+import importlib
+
+from semisim.bjt import calculate_ic, calculate_ie
+from semisim.mosfet import (
+    calculate_id,
+    calculate_iv_family,
+    calculate_mobility_sic,
+    effective_mobility,
+)
+
+__all__ = [
+    "calculate_mobility_sic",
+    "effective_mobility",
+    "calculate_id",
+    "calculate_iv_family",
+    "calculate_ie",
+    "calculate_ic",
+]
+
+# 처음 접근할 때 import 되는 하위 모듈
+_LAZY_SUBMODULES = {
+    "cache",
+    "charts",
+    "circuits",
+    "diffusion",
+    "fitting",
+    "mobility_map",
+    "mobility_table",
+    "plotting",
+    "process_flow",
+    "profiling",
+    "stages",
+    "store",
+    "sweep",
+    "wafer",
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_SUBMODULES:
+        module = importlib.import_module(f"{__name__}.{name}")
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_LAZY_SUBMODULES))
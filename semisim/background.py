@@ -0,0 +1,220 @@
+"""
+무거운 계산의 백그라운드 실행과 점진적 결과 공개.
+
+Streamlit 스크립트 스레드에서 큰 스윕을 직접 계산하면 계산이 끝날 때까지 페이지가 멈추고, 그 사이의 슬라이더
+조작은 뒤에 줄을 선다. ProgressiveJob은 제너레이터 함수를 작업 스레드에서 실행하면서 제너레이터가 내놓는 값
+(거친 결과 → 세밀한 결과, 또는 청크별 부분 결과)을 하나씩 공개한다. 스크립트는 가장 최근 값을 바로 그리고,
+새 값이 나올 때마다 자리 표시자(st.empty)를 갱신한다.
+
+JobSlots는 세션마다 하나씩 두며 슬롯 이름마다 최신 작업 하나만 유지한다. 같은 슬롯에 다른 키(파라미터)로
+작업을 제출하면 이전 작업은 취소된다. 취소된 제너레이터는 진행 중인 단계가 끝나는 즉시 닫히므로 남은 단계는
+계산되지 않는다.
+
+    >>> jobs = JobSlots()
+    >>> job = jobs.submit("surface", key, bjt_pipeline.refine, (params, "em_input_figure", "surface_points", levels))
+    >>> for update in job.updates(poll=POLL_SECONDS):
+    ...     if update is not None:
+    ...         placeholder.pyplot(update.value[1])
+"""
+import os
+import threading
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+# 스크립트가 새 값을 기다리는 동안 요소를 다시 그려 재실행 요청을 확인하는 간격 (초)
+POLL_SECONDS = 0.1
+
+# 작업이 공개한 값과 그 순번 (0부터)
+Update = namedtuple("Update", ["value", "step"])
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def default_executor():
+    """프로세스 전체가 공유하는 작업 스레드 풀 (처음 사용할 때 만든다)."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            # NumPy 연산은 GIL을 놓으므로 코어 수만큼 스레드를 둔다 (세션이 많을 때를 위해 최소 2개)
+            _executor = ThreadPoolExecutor(max_workers=max(2, os.cpu_count() or 1), thread_name_prefix="semisim-job")
+        return _executor
+
+
+def refinement_levels(points, coarsest=100, factor=4):
+    """
+    점진적으로 세밀해지는 격자 해상도 목록. 마지막 값은 항상 points이다.
+
+        >>> refinement_levels(1000)
+        [100, 400, 1000]
+    """
+    levels = []
+    n = coarsest
+    while n * 2 <= points:
+        levels.append(n)
+        n *= factor
+    levels.append(points)
+    return levels
+
+
+class ProgressiveJob:
+    """
+    제너레이터 함수 하나를 작업 스레드에서 실행하고 내놓는 값을 차례로 공개하는 작업.
+
+    Parameters:
+    - key: 작업을 구분하는 값 (보통 파라미터 튜플). JobSlots가 같은 작업인지 판단하는 데 쓴다.
+    - func: 값을 차례로 내놓는 제너레이터(또는 이터러블)를 돌려주는 함수
+    - args, kwargs: func에 전달할 인자
+    """
+
+    def __init__(self, key, func, args=(), kwargs=None):
+        self.key = key
+        self._func = func
+        self._args = tuple(args)
+        self._kwargs = dict(kwargs or {})
+        self._cond = threading.Condition()
+        self._latest = None
+        self._done = False
+        self._error = None
+        self._cancelled = threading.Event()
+
+    def start(self, executor=None):
+        """작업을 executor (None이면 default_executor())에 제출하고 자기 자신을 돌려준다."""
+        (executor or default_executor()).submit(self._run)
+        return self
+
+    def _run(self):
+        step = 0
+        try:
+            if self._cancelled.is_set():  # 시작하기 전에 취소됨
+                return
+            iterator = iter(self._func(*self._args, **self._kwargs))
+            try:
+                while not self._cancelled.is_set():
+                    try:
+                        value = next(iterator)
+                    except StopIteration:
+                        break
+                    with self._cond:
+                        self._latest = Update(value, step)
+                        self._cond.notify_all()
+                    step += 1
+            finally:
+                # 제너레이터의 finally 블록(예: 남은 프로세스 풀 작업 취소)을 실행한다
+                close = getattr(iterator, "close", None)
+                if close is not None:
+                    close()
+        except Exception as exc:
+            with self._cond:
+                self._error = exc
+        finally:
+            with self._cond:
+                self._done = True
+                self._cond.notify_all()
+
+    def cancel(self):
+        """작업을 취소한다. 진행 중인 단계가 끝나면 제너레이터를 닫고 더 이상 값을 공개하지 않는다."""
+        self._cancelled.set()
+
+    @property
+    def cancelled(self):
+        return self._cancelled.is_set()
+
+    @property
+    def done(self):
+        """작업이 끝났는지 (완료, 취소, 예외 모두 포함)."""
+        with self._cond:
+            return self._done
+
+    @property
+    def error(self):
+        """작업 중 발생한 예외 (없으면 None)."""
+        with self._cond:
+            return self._error
+
+    @property
+    def latest(self):
+        """가장 최근에 공개된 Update (아직 없으면 None)."""
+        with self._cond:
+            return self._latest
+
+    def wait(self, timeout=None):
+        """작업이 끝날 때까지 기다린다. 끝났으면 True."""
+        with self._cond:
+            return self._cond.wait_for(lambda: self._done, timeout)
+
+    def updates(self, poll=None):
+        """
+        새로 공개되는 값을 작업이 끝날 때까지 차례로 내놓는 제너레이터.
+
+        호출 시점에 이미 공개된 값이 있으면 가장 최근 값부터 시작한다. 소비가 늦으면 중간 값은 건너뛰고 항상
+        최신 값만 내놓는다. 작업이 예외로 끝나면 마지막에 그 예외를 다시 발생시킨다.
+
+        poll (초)을 주면 그 시간 동안 새 값이 없을 때 None을 내놓는다. Streamlit은 스크립트가 다음 st.* 요소를
+        호출할 때에만 새 재실행 요청(슬라이더 조작)을 처리하므로, 스크립트는 None을 받으면 자리 표시자를 다시
+        그려 다음 청크/해상도가 끝나기 전에도 입력이 반영되게 한다.
+        """
+        last = None
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: self._done or self._latest is not last, poll)
+                latest, done, error = self._latest, self._done, self._error
+            if latest is not last:
+                last = latest
+                yield latest
+            elif done:
+                if error is not None:
+                    raise error
+                return
+            else:
+                yield None
+
+
+class JobSlots:
+    """
+    슬롯 이름마다 최신 작업 하나를 유지하는 작업 관리자 (세션마다 하나씩 둔다).
+
+    Parameters:
+    - executor: 작업을 실행할 executor (None이면 default_executor())
+    """
+
+    def __init__(self, executor=None):
+        self._executor = executor
+        self._jobs = {}
+        self._lock = threading.Lock()
+
+    def submit(self, slot, key, func, args=(), kwargs=None):
+        """
+        slot에 작업을 제출한다.
+
+        같은 key의 작업이 이미 있으면(진행 중이든 끝났든) 그 작업을 그대로 돌려주고, key가 다르면 이전 작업을
+        취소한 뒤 새 작업을 시작한다. 예외로 끝난 작업은 다시 실행한다.
+        """
+        with self._lock:
+            job = self._jobs.get(slot)
+            if job is not None and job.key == key and not job.cancelled and job.error is None:
+                return job
+            if job is not None:
+                job.cancel()
+            job = ProgressiveJob(key, func, args, kwargs).start(self._executor)
+            self._jobs[slot] = job
+            return job
+
+    def current(self, slot, key):
+        """slot의 작업이 key와 같으면 그 작업을, 다르면 (더 이상 유효하지 않으므로) 취소하고 None을 돌려준다."""
+        with self._lock:
+            job = self._jobs.get(slot)
+            if job is None or job.key == key:
+                return job
+            job.cancel()
+            del self._jobs[slot]
+            return None
+
+    def cancel(self, slot=None):
+        """slot의 작업을 (None이면 모든 작업을) 취소한다."""
+        with self._lock:
+            slots = list(self._jobs) if slot is None else [slot]
+            for name in slots:
+                job = self._jobs.pop(name, None)
+                if job is not None:
+                    job.cancel()
@@ -0,0 +1,287 @@
+"""
+헤드리스 배치 모드: 스윕 명세를 읽어 특성 데이터셋을 파일로 생성한다.
+
+앱과 같은 MOSFET/BJT 식을 사용한다. 명세에 적은 파라미터 축들의 격자(데카르트 곱)를 고정 크기 청크로
+나누어 계산하고, 청크마다 출력 디렉터리에 파일 하나(part-00000.npz / .csv / .parquet)를 쓴다. 한 번에
+메모리에 올라가는 것은 청크 하나뿐이므로 전체 스윕 크기와 관계없이 메모리 사용량이 일정하다.
+
+진행 상황은 출력 디렉터리의 manifest.json에 청크마다 기록되므로, 중단된 실행은 --resume으로 이어서 할 수 있다.
+
+명세 (JSON):
+
+    {
+        "model": "mosfet",
+        "parameters": {
+            "Vgs": {"start": 0, "stop": 5, "num": 51},
+            "Vds": {"start": 0, "stop": 5, "num": 101},
+            "N_A": {"start": 1e15, "stop": 1e17, "num": 21, "scale": "log"},
+            "T": {"values": [250, 300, 350]},
+            "W": 10
+        }
+    }
+
+축은 {"start", "stop", "num", "scale": "linear"|"log"} 또는 {"values": [...]}로, 고정 값은 숫자로 적는다.
+명세에 없는 파라미터는 MODELS에 정한 배치 모드 고유의 기본값을 사용한다. 이 값은 앱의 기본 슬라이더 값과
+같지 않으므로 (예: BJT V_T 0.025 V, I_S 1e-12 A, MOSFET W 10 µm), 앱의 동작점과 맞춰야 하는 파라미터는
+명세에 직접 적는다.
+
+    $ python -m semisim.batch sweep.json out/ --format parquet --chunk-size 200000
+    $ python -m semisim.batch sweep.json out/ --resume
+"""
+import argparse
+import hashlib
+import json
+import os
+import sys
+import tempfile
+import time
+from collections import OrderedDict, namedtuple
+
+import numpy as np
+
+from semisim.bjt import calculate_ic, calculate_ie
+from semisim.mosfet import calculate_id, calculate_mobility_sic, effective_mobility
+
+MANIFEST = "manifest.json"
+FORMATS = ("npz", "csv", "parquet")
+DEFAULT_CHUNK_SIZE = 100_000
+
+Model = namedtuple("Model", ["defaults", "outputs", "func"])
+
+
+def _mosfet(Vgs, Vds, W, L, N_D, N_A, T):
+    return (calculate_id(Vgs, Vds, W, L, N_D, N_A, T),)
+
+
+def _bjt_input(V_BE, V_CB, I_S, V_T):
+    return (calculate_ie(V_BE, V_CB, I_S, V_T),)
+
+
+def _bjt_output(I_E, V_CB, V_T):
+    return (calculate_ic(I_E, V_CB, V_T),)
+
+
+def _mobility(N_D, N_A, T):
+    mu_e, mu_h = calculate_mobility_sic(N_D, N_A, T)
+    return mu_e, mu_h, effective_mobility(mu_e, mu_h)
+
+
+# 모델 이름 -> (파라미터 기본값, 출력 열 이름, 계산 함수). 단위는 semisim.mosfet / semisim.bjt 와 같다 (I_S, I_E는 A).
+# 기본값은 배치 모드 고유의 값이다 (앱의 I_S 슬라이더는 pA 단위이며 기본 슬라이더 값과 일치하지 않는다).
+MODELS = {
+    "mosfet": Model(
+        OrderedDict(Vgs=1.5, Vds=5.0, W=10.0, L=10.0, N_D=1e19, N_A=1e16, T=300.0), ("Id",), _mosfet),
+    "bjt_input": Model(OrderedDict(V_BE=0.7, V_CB=0.0, I_S=1e-12, V_T=0.025), ("I_E",), _bjt_input),
+    "bjt_output": Model(OrderedDict(I_E=1e-3, V_CB=5.0, V_T=0.025), ("I_C",), _bjt_output),
+    "mobility": Model(OrderedDict(N_D=1e19, N_A=1e16, T=300.0), ("mu_e", "mu_h", "mu_eff"), _mobility),
+}
+
+
+def _axis_values(name, axis):
+    if "values" in axis:
+        values = np.asarray(axis["values"], dtype=float).ravel()
+    else:
+        start, stop, num = float(axis["start"]), float(axis["stop"]), int(axis["num"])
+        scale = axis.get("scale", "linear")
+        if scale == "linear":
+            values = np.linspace(start, stop, num)
+        elif scale == "log":
+            if start <= 0 or stop <= 0:
+                raise ValueError(f"parameter {name!r}: log scale requires positive start/stop")
+            values = np.logspace(np.log10(start), np.log10(stop), num)
+        else:
+            raise ValueError(f"parameter {name!r}: unknown scale {scale!r}")
+    if values.size == 0:
+        raise ValueError(f"parameter {name!r}: axis is empty")
+    return values
+
+
+class Sweep:
+    """
+    스윕 명세를 해석한 격자.
+
+    축은 명세에 적은 순서를 따르며, 마지막 축이 가장 빠르게 변한다 (C 순서). 평탄화한 격자 인덱스
+    [start, stop) 구간을 청크로 잘라 계산한다.
+    """
+
+    def __init__(self, spec):
+        if spec.get("model") not in MODELS:
+            raise ValueError(f"unknown model {spec.get('model')!r}; expected one of {', '.join(MODELS)}")
+        self.spec = spec
+        self.model_name = spec["model"]
+        self.model = MODELS[self.model_name]
+        parameters = spec.get("parameters", {})
+        unknown = set(parameters) - set(self.model.defaults)
+        if unknown:
+            raise ValueError(f"unknown parameters for model {self.model_name!r}: {', '.join(sorted(unknown))}")
+
+        self.axes = OrderedDict()
+        self.fixed = OrderedDict()
+        for name, value in parameters.items():
+            if isinstance(value, dict):
+                self.axes[name] = _axis_values(name, value)
+            else:
+                self.fixed[name] = float(value)
+        for name, default in self.model.defaults.items():
+            if name not in parameters:
+                self.fixed[name] = default
+        self.shape = tuple(len(values) for values in self.axes.values())
+        self.size = int(np.prod(self.shape, dtype=np.int64))
+
+    @property
+    def columns(self):
+        return list(self.axes) + list(self.model.outputs)
+
+    def evaluate(self, start, stop):
+        """평탄화한 격자 인덱스 [start, stop) 구간의 축 값과 모델 출력을 열 이름 -> 배열 dict로 돌려준다."""
+        # 축이 없으면 (모든 파라미터 고정) 격자 점은 하나뿐이다
+        index = np.unravel_index(np.arange(start, stop, dtype=np.int64), self.shape) if self.shape else ()
+        columns = OrderedDict((name, values[i]) for (name, values), i in zip(self.axes.items(), index))
+        args = {name: columns.get(name, self.fixed.get(name)) for name in self.model.defaults}
+        outputs = self.model.func(**args)
+        for name, values in zip(self.model.outputs, outputs):
+            columns[name] = np.broadcast_to(values, (stop - start,))
+        return columns
+
+    def digest(self):
+        """명세의 해시 (이어서 실행할 때 같은 명세인지 확인하는 데 사용)."""
+        text = json.dumps(self.spec, sort_keys=True)
+        return hashlib.blake2b(text.encode(), digest_size=16).hexdigest()
+
+
+def _write_npz(f, columns):
+    np.savez(f, **columns)
+
+
+def _write_csv(f, columns):
+    data = np.column_stack(list(columns.values()))
+    np.savetxt(f, data, delimiter=",", header=",".join(columns), comments="", fmt="%.10g")
+
+
+def _write_parquet(f, columns):
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise ImportError("parquet 형식으로 저장하려면 pyarrow가 필요합니다 (pip install pyarrow).") from None
+    pq.write_table(pa.table({name: np.ascontiguousarray(values) for name, values in columns.items()}), f)
+
+
+_WRITERS = {"npz": _write_npz, "csv": _write_csv, "parquet": _write_parquet}
+
+
+def _atomic_write(path, write, mode="wb"):
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, mode) as f:
+            write(f)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def part_name(index, fmt):
+    return f"part-{index:05d}.{fmt}"
+
+
+def run_batch(spec, output_dir, fmt="npz", chunk_size=DEFAULT_CHUNK_SIZE, resume=False, log=None):
+    """
+    스윕을 청크 단위로 계산해 output_dir에 저장한다.
+
+    Parameters:
+    - spec: 스윕 명세 dict (모듈 설명 참고)
+    - output_dir: 출력 디렉터리 (없으면 만든다)
+    - fmt: "npz", "csv", "parquet"
+    - chunk_size: 청크 하나의 격자 점 수
+    - resume: True이면 같은 명세/형식/청크 크기로 중단된 실행을 이어서 한다.
+      False인데 출력 디렉터리에 이미 manifest가 있으면 ValueError.
+    - log: 진행 상황을 출력할 함수 (None이면 출력하지 않음)
+
+    Returns:
+    - 최종 manifest dict
+    """
+    if fmt not in _WRITERS:
+        raise ValueError(f"unknown format {fmt!r}; expected one of {', '.join(FORMATS)}")
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be positive")
+    sweep = Sweep(spec)
+    n_chunks = -(-sweep.size // chunk_size)
+    os.makedirs(output_dir, exist_ok=True)
+    manifest_path = os.path.join(output_dir, MANIFEST)
+
+    manifest = {
+        "spec": spec,
+        "spec_hash": sweep.digest(),
+        "format": fmt,
+        "chunk_size": chunk_size,
+        "shape": list(sweep.shape),
+        "n_points": sweep.size,
+        "n_chunks": n_chunks,
+        "columns": sweep.columns,
+        "fixed": sweep.fixed,
+        "completed_chunks": 0,
+    }
+    if os.path.exists(manifest_path):
+        if not resume:
+            raise ValueError(f"{output_dir!r} already contains a batch run; use resume=True to continue it")
+        with open(manifest_path, encoding="utf-8") as f:
+            previous = json.load(f)
+        for field in ("spec_hash", "format", "chunk_size"):
+            if previous[field] != manifest[field]:
+                raise ValueError(f"cannot resume: {field} differs from the interrupted run "
+                                 f"({previous[field]!r} != {manifest[field]!r})")
+        manifest["completed_chunks"] = previous["completed_chunks"]
+
+    def save_manifest():
+        _atomic_write(manifest_path, lambda f: json.dump(manifest, f, indent=2), mode="w")
+
+    save_manifest()
+    write = _WRITERS[fmt]
+    start_time = time.perf_counter()
+    first = manifest["completed_chunks"]
+    for index in range(first, n_chunks):
+        start = index * chunk_size
+        columns = sweep.evaluate(start, min(start + chunk_size, sweep.size))
+        _atomic_write(os.path.join(output_dir, part_name(index, fmt)), lambda f: write(f, columns))
+        manifest["completed_chunks"] = index + 1
+        save_manifest()
+        if log is not None:
+            elapsed = time.perf_counter() - start_time
+            done = min((index + 1) * chunk_size, sweep.size)
+            log(f"chunk {index + 1}/{n_chunks} · {done:,}/{sweep.size:,} points · "
+                f"{(index + 1 - first) / elapsed:.2f} chunks/s")
+    return manifest
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m semisim.batch", description=__doc__.strip().splitlines()[0])
+    parser.add_argument("spec", help="스윕 명세 JSON 파일")
+    parser.add_argument("output_dir", help="결과를 저장할 디렉터리")
+    parser.add_argument("--format", choices=FORMATS, default=None, help="출력 형식 (기본: 명세의 format 또는 npz)")
+    parser.add_argument("--chunk-size", type=int, default=None,
+                        help=f"청크 하나의 격자 점 수 (기본: 명세의 chunk_size 또는 {DEFAULT_CHUNK_SIZE})")
+    parser.add_argument("--resume", action="store_true", help="중단된 실행을 이어서 한다")
+    args = parser.parse_args(argv)
+
+    with open(args.spec, encoding="utf-8") as f:
+        spec = json.load(f)
+    # 명세에 적은 실행 옵션은 명령줄 옵션이 없을 때만 사용한다 (스윕 해시에는 포함하지 않는다)
+    fmt = spec.pop("format", "npz")
+    chunk_size = spec.pop("chunk_size", DEFAULT_CHUNK_SIZE)
+    fmt = args.format or fmt
+    chunk_size = args.chunk_size or chunk_size
+
+    def log(line):
+        print(line, file=sys.stderr)
+
+    try:
+        manifest = run_batch(spec, args.output_dir, fmt, chunk_size, resume=args.resume, log=log)
+    except (ValueError, ImportError) as e:
+        parser.exit(2, f"error: {e}\n")
+    log(f"{manifest['n_points']:,} points in {manifest['n_chunks']} {fmt} files → {args.output_dir}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,244 @@
+"""
+소자 모델과 앱 재실행 지연 시간 벤치마크.
+
+모델 벤치마크는 calculate_mobility_sic, effective_mobility, MOSFET I-V 곡선군, BJT 입력/출력 곡선을
+여러 격자 크기(기본 10^2 ~ 10^7 점)에서 측정한다. 페이지 벤치마크는 app.py를 별도 프로세스의 Streamlit
+서버로 띄우고, 헤드리스 세션으로 각 selected_device 페이지를 열어 스크립트 재실행에 걸린 시간을 잰다.
+
+결과는 JSON으로 저장되며 릴리스 사이의 성능 회귀를 비교하는 데 사용한다.
+
+    $ python -m semisim.bench --output bench.json
+    $ python -m semisim.bench --sizes 100,10000 --no-pages
+"""
+import argparse
+import asyncio
+import datetime
+import json
+import os
+import platform
+import sys
+import time
+
+import numpy as np
+
+from semisim.bjt import calculate_ic, calculate_ie
+from semisim.fitting import fit_mosfet
+from semisim.mosfet import calculate_id, calculate_iv_family, calculate_mobility_sic, effective_mobility
+
+DEFAULT_SIZES = [10**k for k in range(2, 8)]
+
+# 페이지 이름 -> 사이드바 버튼 라벨
+PAGES = {
+    "MOSFET_3D": "MOSFET 3D 시뮬레이터",
+    "MOSFET_DESC": "About MOSFET",
+    "BJT": "BJT 시뮬레이터",
+}
+
+DEFAULT_APP = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app.py")
+
+# 곡선군 벤치마크의 곡선 수 (나머지 점은 곡선 하나의 x축 점 수가 된다)
+N_CURVES = 10
+
+
+def time_call(func, repeat=5, min_sample_time=0.05, max_total_time=10.0):
+    """
+    func()의 1회 실행 시간을 측정한다.
+
+    먼저 한 번 실행해 대략의 시간을 잰 뒤, 한 표본이 min_sample_time 이상이 되도록 반복 횟수(number)를 정하고
+    repeat개의 표본을 모은다. 전체 시간이 max_total_time을 넘지 않도록 표본 수를 줄인다.
+
+    Returns:
+    - dict: best_s, median_s, mean_s (1회 실행 기준 초), repeat, number
+    """
+    start = time.perf_counter()
+    func()
+    first = time.perf_counter() - start
+
+    number = max(1, int(min_sample_time / max(first, 1e-9)))
+    repeat = max(1, min(repeat, int(max_total_time / max(first * number, 1e-9))))
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        samples.append((time.perf_counter() - start) / number)
+    samples = np.array(samples)
+    return {
+        "best_s": float(samples.min()),
+        "median_s": float(np.median(samples)),
+        "mean_s": float(samples.mean()),
+        "repeat": repeat,
+        "number": number,
+    }
+
+
+def _mobility_case(n):
+    N_D = np.logspace(14, 20, n)
+    T = np.linspace(250, 450, n)
+    return lambda: calculate_mobility_sic(N_D, 1e16, T)
+
+
+def _effective_mobility_case(n):
+    mu_e, mu_h = calculate_mobility_sic(np.logspace(14, 20, n), 1e16, np.linspace(250, 450, n))
+    return lambda: effective_mobility(mu_e, mu_h)
+
+
+def _mosfet_iv_case(n):
+    Vgs_values = np.linspace(0.5, 5, min(N_CURVES, n))
+    Vds_values = np.linspace(0, 5, max(1, n // len(Vgs_values)))
+    return lambda: calculate_iv_family(Vgs_values, Vds_values, 10, 10, 1e19, 1e16)
+
+
+def _mosfet_fit_case(n):
+    # 다이마다 3개 온도 × 22개 바이어스 점 (n은 전체 측정 점 수)
+    rng = np.random.default_rng(0)
+    Vgs, Vds = np.meshgrid(np.linspace(1.5, 5, 11), [0.5, 5.0])
+    Vgs, Vds = np.tile(Vgs.ravel(), 3), np.tile(Vds.ravel(), 3)
+    T = np.repeat([300.0, 375.0, 450.0], Vgs.size // 3)
+    dies = max(1, n // Vgs.size)
+    N_D = 10 ** rng.uniform(15.5, 17, (dies, 1))
+    Vth = rng.normal(1.0, 0.05, (dies, 1))
+    Id = calculate_id(Vgs, Vds, 10, 10, N_D, 1e16, T, Vth=Vth)
+    T = np.broadcast_to(T, Id.shape)  # 1차원 T는 다이별 온도로 해석되므로 점별 (다이, 점) 배열로 준다
+    return lambda: fit_mosfet(Vgs, Vds, Id, 10, 10, N_D[:, 0], 1e16, T)
+
+
+def _bjt_input_case(n):
+    V_CB_values = np.linspace(0, 10, min(N_CURVES, n))
+    V_BE_values = np.linspace(0, 1, max(1, n // len(V_CB_values)))
+    return lambda: calculate_ie(V_BE_values[None, :], V_CB_values[:, None], 1e-12, 0.025)
+
+
+def _bjt_output_case(n):
+    I_E_values = np.linspace(1e-3, 10e-3, min(N_CURVES, n))
+    V_CB_values = np.linspace(0, 10, max(1, n // len(I_E_values)))
+    return lambda: calculate_ic(I_E_values[:, None], V_CB_values[None, :], 0.025)
+
+
+MODEL_BENCHMARKS = {
+    "mobility": _mobility_case,
+    "effective_mobility": _effective_mobility_case,
+    "mosfet_iv": _mosfet_iv_case,
+    "mosfet_fit": _mosfet_fit_case,
+    "bjt_input": _bjt_input_case,
+    "bjt_output": _bjt_output_case,
+}
+
+
+def run_model_benchmarks(sizes=DEFAULT_SIZES, names=None, repeat=5, log=None):
+    """
+    모델 벤치마크를 실행한다.
+
+    Parameters:
+    - sizes: 격자 점 수 목록
+    - names: 실행할 벤치마크 이름 목록 (None이면 전체)
+    - repeat: 표본 수
+    - log: 진행 상황을 출력할 함수 (None이면 출력하지 않음)
+
+    Returns:
+    - 결과 dict의 리스트 (name, points, best_s, median_s, mean_s, repeat, number, points_per_s)
+    """
+    results = []
+    for name in names or MODEL_BENCHMARKS:
+        for n in sizes:
+            func = MODEL_BENCHMARKS[name](n)
+            timing = time_call(func, repeat=repeat)
+            result = {"name": name, "points": n, **timing, "points_per_s": n / timing["best_s"]}
+            results.append(result)
+            if log is not None:
+                log(f"{name:>20} n={n:<10d} best={timing['best_s'] * 1e3:10.3f} ms")
+            del func
+    return results
+
+
+async def _page_latencies(base_url, pages, reruns):
+    from semisim.session_client import SessionClient
+
+    results = []
+    async with SessionClient(base_url) as client:
+        await client.rerun()  # 첫 화면 (사이드바 버튼 ID를 얻는다)
+        for page in pages:
+            first = await client.rerun(click=PAGES[page])
+            samples = [(await client.rerun()).elapsed for _ in range(reruns)]
+            samples = np.array(samples)
+            results.append({
+                "page": page,
+                "first_s": first.elapsed,
+                "median_s": float(np.median(samples)),
+                "p95_s": float(np.percentile(samples, 95)),
+                "best_s": float(samples.min()),
+                "reruns": reruns,
+                "messages": first.messages,
+                "bytes": first.bytes,
+            })
+        if client.exceptions:
+            raise RuntimeError("앱 실행 중 예외가 발생했습니다: " + "; ".join(client.exceptions))
+    return results
+
+
+def run_page_benchmarks(app_path=DEFAULT_APP, pages=tuple(PAGES), reruns=20, log=None):
+    """
+    app_path를 Streamlit 서버로 띄워 각 페이지의 재실행 지연 시간을 측정한다.
+
+    페이지마다 사이드바 버튼을 눌러 처음 여는 실행(first_s)과, 입력을 바꾸지 않은 재실행 reruns번의
+    지연 시간 통계(median_s, p95_s, best_s)를 잰다. 지연 시간은 재실행 요청을 보낸 시점부터 스크립트 종료
+    메시지를 받을 때까지이다.
+    """
+    from semisim.session_client import local_server
+
+    with local_server(app_path) as (base_url, _):
+        results = asyncio.run(_page_latencies(base_url, pages, reruns))
+    if log is not None:
+        for result in results:
+            log(f"{result['page']:>20} first={result['first_s'] * 1e3:8.1f} ms "
+                f"median={result['median_s'] * 1e3:8.1f} ms")
+    return results
+
+
+def environment_info():
+    """결과를 비교할 때 필요한 실행 환경 정보."""
+    return {
+        "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m semisim.bench", description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", default=",".join(str(n) for n in DEFAULT_SIZES),
+                        help="쉼표로 구분한 격자 점 수 (기본: 100 ~ 10^7)")
+    parser.add_argument("--only", default=None,
+                        help="실행할 모델 벤치마크 (쉼표로 구분, 기본: 전체). 가능한 값: " + ", ".join(MODEL_BENCHMARKS))
+    parser.add_argument("--repeat", type=int, default=5, help="모델 벤치마크 표본 수")
+    parser.add_argument("--reruns", type=int, default=20, help="페이지마다 측정할 재실행 횟수")
+    parser.add_argument("--no-models", action="store_true", help="모델 벤치마크를 건너뛴다")
+    parser.add_argument("--no-pages", action="store_true", help="페이지 재실행 벤치마크를 건너뛴다")
+    parser.add_argument("--app", default=DEFAULT_APP, help="페이지 벤치마크에 사용할 Streamlit 앱 경로")
+    parser.add_argument("--output", "-o", default="-", help="결과 JSON 파일 (기본: 표준 출력)")
+    args = parser.parse_args(argv)
+
+    def log(line):
+        print(line, file=sys.stderr)
+
+    report = {"environment": environment_info(), "models": [], "pages": []}
+    if not args.no_models:
+        sizes = [int(float(size)) for size in args.sizes.split(",")]
+        names = args.only.split(",") if args.only else None
+        report["models"] = run_model_benchmarks(sizes, names, repeat=args.repeat, log=log)
+    if not args.no_pages:
+        report["pages"] = run_page_benchmarks(args.app, reruns=args.reruns, log=log)
+
+    text = json.dumps(report, indent=2, ensure_ascii=False)
+    if args.output == "-":
+        print(text)
+    else:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,159 @@
+"""
+공통 베이스(Common-Base) BJT 입력/출력 특성 모델.
+
+NumPy만 사용하며 Streamlit/matplotlib 없이 import 할 수 있다.
+
+지수 항은 로그 영역에서 계산한다. e^x - 1 을 (부호, log|e^x - 1|)로 다루고 포화 전류의 로그를 더한 뒤 마지막에
+한 번만 지수를 취하므로, V/V_T가 커도 중간 계산에서 오버플로가 나지 않으며 0 근처에서는 expm1의 정밀도를
+유지한다. EbersMoll은 (V_BE, V_CB) 또는 (I_E, V_CB) 평면 전체를 한 번의 브로드캐스트로 계산한다.
+"""
+from collections import namedtuple
+
+import numpy as np
+
+
+class SignedLog(namedtuple("SignedLog", ["sign", "log"])):
+    """값을 (부호, 자연로그 절댓값)으로 표현한 배열 쌍. 0은 (0, -inf)이다."""
+
+    __slots__ = ()
+
+    def value(self):
+        """실제 값. 크기가 float 범위를 넘는 경우에만 ±inf가 된다."""
+        with np.errstate(over="ignore"):
+            return self.sign * np.exp(self.log)
+
+    def log10_abs(self):
+        """log10 |값| (0은 -inf)."""
+        return self.log / np.log(10)
+
+
+def log_abs_expm1(x):
+    """
+    e^x - 1 을 SignedLog로 계산한다.
+
+    log|e^x - 1| = max(x, 0) + log(1 - e^-|x|) 이므로 큰 x에서 오버플로가 없고, 작은 |x|에서는 expm1로 정확하다.
+    """
+    x = np.asarray(x, dtype=float)
+    with np.errstate(divide="ignore"):
+        log = np.maximum(x, 0) + np.log(-np.expm1(-np.abs(x)))
+    return SignedLog(np.sign(x), log)
+
+
+def _signed_log(x):
+    """일반 배열을 SignedLog로 바꾼다."""
+    x = np.asarray(x, dtype=float)
+    with np.errstate(divide="ignore"):
+        return SignedLog(np.sign(x), np.log(np.abs(x)))
+
+
+def _log_scale(a, factor):
+    """SignedLog a에 상수(또는 배열) factor를 곱한다."""
+    factor = _signed_log(factor)
+    return SignedLog(a.sign * factor.sign, a.log + factor.log)
+
+
+def _log_add(a, b):
+    """두 SignedLog의 합 (log-sum-exp, 부호 포함)."""
+    m = np.maximum(a.log, b.log)
+    m = np.where(np.isfinite(m), m, 0.0)  # 두 항이 모두 0인 경우
+    s = a.sign * np.exp(a.log - m) + b.sign * np.exp(b.log - m)
+    with np.errstate(divide="ignore"):
+        return SignedLog(np.sign(s), m + np.log(np.abs(s)))
+
+
+def _negate(a):
+    return SignedLog(-a.sign, a.log)
+
+
+# 입력 특성: V_BE - I_E
+def calculate_ie(V_BE, V_CB, I_S, V_T):
+    """
+    공통 베이스 입력 특성의 이미터 전류 I_E (A)를 계산하는 함수.
+
+    Parameters:
+    - V_BE: 베이스-이미터 전압 (V)
+    - V_CB: 컬렉터-베이스 전압 (V)
+    - I_S: 포화 전류 (A)
+    - V_T: 열전압 (V)
+    """
+    V_BE = np.asarray(V_BE, dtype=float)
+    V_CB = np.asarray(V_CB, dtype=float)
+    I_E = _log_scale(log_abs_expm1(V_BE / V_T), I_S).value()
+    return I_E * (1 + V_CB / (V_CB + V_T))
+
+
+# 출력 특성: V_CB - I_C
+def calculate_ic(I_E, V_CB, V_T):
+    """
+    공통 베이스 출력 특성의 컬렉터 전류 I_C (A)를 계산하는 함수.
+
+    Parameters:
+    - I_E: 이미터 전류 (A)
+    - V_CB: 컬렉터-베이스 전압 (V)
+    - V_T: 열전압 (V)
+    """
+    I_E = np.asarray(I_E, dtype=float)
+    V_CB = np.asarray(V_CB, dtype=float)
+    # I_E * (1 - e^(-V_CB/V_T)) = -I_E * expm1(-V_CB/V_T)
+    return _log_scale(log_abs_expm1(-V_CB / V_T), -I_E).value()
+
+
+class EbersMoll:
+    """
+    Ebers–Moll BJT 모델 (공통 베이스, NPN 기준).
+
+        I_E = I_ES (e^(V_BE/V_T) - 1) - α_R I_CS (e^(V_BC/V_T) - 1)
+        I_C = α_F I_ES (e^(V_BE/V_T) - 1) - I_CS (e^(V_BC/V_T) - 1)
+
+    V_BC = -V_CB 이며, 상반 관계 α_F I_ES = α_R I_CS 로부터 I_CS를 정한다.
+    모든 메서드는 인자를 NumPy 브로드캐스트 규칙으로 결합하며 결과를 SignedLog로 돌려준다.
+
+    Parameters:
+    - I_ES: 이미터 접합 포화 전류 (A)
+    - alpha_F: 순방향 공통 베이스 전류 이득
+    - alpha_R: 역방향 공통 베이스 전류 이득
+    - V_T: 열전압 (V)
+    """
+
+    def __init__(self, I_ES=1e-14, alpha_F=0.99, alpha_R=0.5, V_T=0.026):
+        if not (0 < alpha_F < 1 and 0 < alpha_R < 1):
+            raise ValueError("alpha_F and alpha_R must be in (0, 1)")
+        self.I_ES = I_ES
+        self.alpha_F = alpha_F
+        self.alpha_R = alpha_R
+        self.V_T = V_T
+        self.I_CS = alpha_F * I_ES / alpha_R
+
+    def _junctions(self, V_BE, V_CB):
+        f_E = log_abs_expm1(np.asarray(V_BE, dtype=float) / self.V_T)
+        f_C = log_abs_expm1(-np.asarray(V_CB, dtype=float) / self.V_T)
+        return f_E, f_C
+
+    def emitter_current(self, V_BE, V_CB):
+        """I_E(V_BE, V_CB) (A)."""
+        f_E, f_C = self._junctions(V_BE, V_CB)
+        return _log_add(_log_scale(f_E, self.I_ES), _negate(_log_scale(f_C, self.alpha_R * self.I_CS)))
+
+    def collector_current(self, V_BE, V_CB):
+        """I_C(V_BE, V_CB) (A)."""
+        f_E, f_C = self._junctions(V_BE, V_CB)
+        return _log_add(_log_scale(f_E, self.alpha_F * self.I_ES), _negate(_log_scale(f_C, self.I_CS)))
+
+    def collector_current_from_ie(self, I_E, V_CB):
+        """
+        이미터 전류를 강제했을 때의 I_C(I_E, V_CB) (A).
+
+        두 식에서 e^(V_BE/V_T) 항을 소거하면 I_C = α_F I_E - (1 - α_F α_R) I_CS (e^(V_BC/V_T) - 1).
+        """
+        f_C = log_abs_expm1(-np.asarray(V_CB, dtype=float) / self.V_T)
+        drive = _signed_log(self.alpha_F * np.asarray(I_E, dtype=float))
+        leakage = _log_scale(f_C, (1 - self.alpha_F * self.alpha_R) * self.I_CS)
+        return _log_add(drive, _negate(leakage))
+
+    def input_surface(self, V_BE_values, V_CB_values):
+        """(V_BE, V_CB) 평면의 I_E. 결과의 행은 V_CB_values, 열은 V_BE_values에 대응한다."""
+        return self.emitter_current(np.asarray(V_BE_values)[None, :], np.asarray(V_CB_values)[:, None])
+
+    def output_surface(self, I_E_values, V_CB_values):
+        """(I_E, V_CB) 평면의 I_C. 결과의 행은 I_E_values, 열은 V_CB_values에 대응한다."""
+        return self.collector_current_from_ie(np.asarray(I_E_values)[:, None], np.asarray(V_CB_values)[None, :])
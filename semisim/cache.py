@@ -0,0 +1,185 @@
+"""
+파라미터 튜플을 키로 하는 계산 결과 캐시.
+
+프로세스 전역 캐시(default_cache)는 같은 서버 프로세스의 모든 Streamlit 세션이 공유한다.
+항목 수 상한(LRU)과 TTL로 메모리를 제한하며, 적중/실패 횟수를 stats()로 확인할 수 있다.
+
+환경 변수로 기본 캐시의 정책을 바꿀 수 있다.
+- SEMISIM_CACHE_MAX_ENTRIES: 최대 항목 수 (기본 256)
+- SEMISIM_CACHE_TTL: 항목 유효 시간 (초, 기본 없음)
+"""
+import functools
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict, namedtuple
+
+import numpy as np
+
+CacheStats = namedtuple("CacheStats", ["hits", "misses", "evictions", "expirations", "size", "max_entries", "ttl"])
+
+
+def make_key(*args, **kwargs):
+    """
+    함수 인자로부터 해시 가능한 캐시 키를 만든다.
+    NumPy 배열은 dtype, shape 및 내용의 해시로, NumPy 스칼라는 파이썬 스칼라로 변환한다.
+    """
+    return (tuple(normalize(a) for a in args),
+            tuple(sorted((k, normalize(v)) for k, v in kwargs.items())))
+
+
+def normalize(value):
+    """
+    값 하나를 해시 가능하고 repr이 안정적인 형태로 바꾼다 (make_key와 단계/저장소 키에서 쓴다).
+    NumPy 배열은 (dtype, shape, 내용 해시), NumPy 스칼라는 파이썬 스칼라, 리스트/튜플/dict는 튜플이 된다.
+    """
+    if isinstance(value, np.ndarray):
+        digest = hashlib.blake2b(np.ascontiguousarray(value).tobytes(), digest_size=16).hexdigest()
+        return ("ndarray", value.dtype.str, value.shape, digest)
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, (list, tuple)):
+        return tuple(normalize(v) for v in value)
+    if isinstance(value, dict):
+        return tuple(sorted((k, normalize(v)) for k, v in value.items()))
+    return value
+
+
+def _freeze(value):
+    # 여러 세션이 같은 결과 객체를 공유하므로 배열은 읽기 전용으로 만든다.
+    if isinstance(value, np.ndarray):
+        value.flags.writeable = False
+    elif isinstance(value, tuple):
+        for v in value:
+            _freeze(v)
+    return value
+
+
+# 캐시에 없는 항목을 나타내는 표식
+_MISSING = object()
+
+
+class ResultCache:
+    """
+    스레드 안전한 LRU + TTL 결과 캐시.
+
+    Parameters:
+    - max_entries: 보관할 최대 항목 수. 초과하면 가장 오래 사용되지 않은 항목부터 제거한다.
+    - ttl: 항목 유효 시간 (초). None이면 만료되지 않는다.
+    """
+
+    def __init__(self, max_entries=256, ttl=None):
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()  # key -> (저장 시각, 값)
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+
+    def configure(self, max_entries=None, ttl=None):
+        """캐시 정책을 변경한다. 줄어든 상한을 넘는 항목은 즉시 제거된다."""
+        with self._lock:
+            if max_entries is not None:
+                self.max_entries = max_entries
+            if ttl is not None:
+                self.ttl = ttl if ttl > 0 else None
+            self._evict_locked()
+
+    def get(self, key, default=None):
+        """저장된 값. 없으면 default (저장된 None과 구별하려면 고유한 객체를 default로 넘긴다)."""
+        with self._lock:
+            entry = self._lookup_locked(key)
+            if entry is _MISSING:
+                self._misses += 1
+                return default
+            self._hits += 1
+            return entry
+
+    def put(self, key, value):
+        with self._lock:
+            self._entries[key] = (time.monotonic(), _freeze(value))
+            self._entries.move_to_end(key)
+            self._evict_locked()
+
+    def get_or_compute(self, key, compute):
+        """캐시에 key가 있으면 저장된 값을, 없으면 compute()를 호출해 저장한 값을 반환한다."""
+        with self._lock:
+            entry = self._lookup_locked(key)
+            if entry is not _MISSING:
+                self._hits += 1
+                return entry
+            self._misses += 1
+        # 계산은 잠금 밖에서 수행한다 (동시에 같은 키가 계산될 수는 있지만 다른 세션을 막지 않는다).
+        value = compute()
+        self.put(key, value)
+        return value
+
+    def memoize(self, func):
+        """함수 인자 전체를 키로 하여 결과를 이 캐시에 저장하는 데코레이터."""
+        name = f"{func.__module__}.{func.__qualname__}"
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            key = (name, make_key(*args, **kwargs))
+            return self.get_or_compute(key, lambda: func(*args, **kwargs))
+
+        wrapper.cache = self
+        return wrapper
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def reset_stats(self):
+        with self._lock:
+            self._hits = self._misses = self._evictions = self._expirations = 0
+
+    def stats(self):
+        with self._lock:
+            return CacheStats(self._hits, self._misses, self._evictions, self._expirations,
+                              len(self._entries), self.max_entries, self.ttl)
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
+
+    def _lookup_locked(self, key):
+        # 없거나 만료된 항목은 _MISSING (값이 None인 항목과 구별한다)
+        entry = self._entries.get(key)
+        if entry is None:
+            return _MISSING
+        stored_at, value = entry
+        if self.ttl is not None and time.monotonic() - stored_at > self.ttl:
+            del self._entries[key]
+            self._expirations += 1
+            return _MISSING
+        self._entries.move_to_end(key)
+        return value
+
+    def _evict_locked(self):
+        if self.ttl is not None:
+            now = time.monotonic()
+            expired = [k for k, (stored_at, _) in self._entries.items() if now - stored_at > self.ttl]
+            for k in expired:
+                del self._entries[k]
+            self._expirations += len(expired)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self._evictions += 1
+
+
+def env_number(name, cast, default):
+    """환경 변수 name을 cast(int, float 등)로 변환한 값. 없거나 비어 있으면 default."""
+    value = os.environ.get(name)
+    return cast(value) if value else default
+
+
+# 프로세스 전역 캐시 (모든 세션이 공유)
+default_cache = ResultCache(
+    max_entries=env_number("SEMISIM_CACHE_MAX_ENTRIES", int, 256),
+    ttl=env_number("SEMISIM_CACHE_TTL", float, None),
+)
+memoize = default_cache.memoize
@@ -0,0 +1,107 @@
+"""
+브라우저에서 그려지는 인터랙티브 차트 (Vega-Lite 명세).
+
+서버는 화면 해상도에 맞게 줄인 숫자 배열만 명세에 담아 보내고, 그리기·확대·이동·툴팁은 모두 브라우저에서
+처리된다. 명세는 순수 dict이므로 st.vega_lite_chart(spec=...)로 바로 표시할 수 있으며, 이 모듈은 NumPy만 사용한다.
+"""
+import numpy as np
+
+# 곡선 하나당 보낼 최대 점 수 (일반적인 차트 폭의 약 2배: 픽셀 열마다 최솟값/최댓값)
+DEFAULT_MAX_POINTS = 1000
+
+
+def decimate(x, y, max_points=DEFAULT_MAX_POINTS):
+    """
+    곡선을 최대 max_points개 점으로 줄인다.
+
+    점들을 max_points // 2개의 구간으로 나누고 각 구간의 최솟값과 최댓값 점만 남기므로(min-max 축소)
+    화면에서 보이는 피크와 급격한 변화는 그대로 유지된다. 첫 점과 마지막 점은 항상 포함된다.
+    """
+    x = np.asarray(x)
+    y = np.asarray(y)
+    n = y.shape[-1]
+    if n <= max_points:
+        return x, y
+    buckets = max(max_points // 2 - 1, 1)
+    size = -(-n // buckets)  # 올림 나눗셈
+    padded = np.pad(y, (0, buckets * size - n), mode="edge").reshape(buckets, size)
+    offsets = np.arange(buckets) * size
+    keep = np.concatenate([[0, n - 1], offsets + padded.argmin(axis=1), offsets + padded.argmax(axis=1)])
+    keep = np.unique(np.minimum(keep, n - 1))
+    return x[keep], y[keep]
+
+
+def line_chart_spec(x, curves, labels, x_title, y_title, title=None, legend_title=None,
+                    max_points=DEFAULT_MAX_POINTS, log_y=False):
+    """
+    여러 곡선을 그리는 Vega-Lite 선 그래프 명세를 만든다.
+
+    Parameters:
+    - x: 공통 x 값 (1차원 배열)
+    - curves: 곡선별 y 값 (각 행이 labels의 한 항목에 대응)
+    - labels: 범례에 표시할 곡선 이름
+    - x_title, y_title: 축 제목
+    - title: 그래프 제목
+    - legend_title: 범례 제목
+    - max_points: 곡선 하나당 보낼 최대 점 수 (decimate 참고)
+    - log_y: True이면 y축을 로그 눈금으로 그린다 (0 이하의 값은 보내지 않는다)
+    """
+    values = []
+    for label, y in zip(labels, curves):
+        xd, yd = decimate(x, y, max_points)
+        if log_y:
+            keep = yd > 0
+            xd, yd = xd[keep], yd[keep]
+        values.extend({"x": a, "y": b, "series": label} for a, b in zip(xd.tolist(), yd.tolist()))
+
+    spec = {
+        "data": {"values": values},
+        "mark": {"type": "line", "tooltip": True},
+        "encoding": {
+            "x": {"field": "x", "type": "quantitative", "title": x_title},
+            "y": {"field": "y", "type": "quantitative", "title": y_title},
+            "color": {"field": "series", "type": "nominal", "title": legend_title, "sort": None},
+        },
+        # 마우스 휠/드래그로 확대·이동 (브라우저에서 처리)
+        "params": [{"name": "zoom", "select": "interval", "bind": "scales"}],
+    }
+    if log_y:
+        spec["encoding"]["y"]["scale"] = {"type": "log"}
+    if title:
+        spec["title"] = title
+    return spec
+
+
+def heatmap_spec(x_edges, y_edges, values, x_title, y_title, value_title, title=None, log_x=False, log_y=False):
+    """
+    칸 경계 x_edges, y_edges로 정해지는 격자 값의 Vega-Lite 색 지도 명세를 만든다.
+
+    values의 행은 y, 열은 x에 대응한다. 칸마다 레코드 하나를 보내므로 미리 줄인 격자(수만 칸 이하)를 넘긴다.
+    값이 NaN인 칸(예: 웨이퍼 밖)은 보내지 않는다.
+    """
+    x_edges = np.asarray(x_edges, dtype=float)
+    y_edges = np.asarray(y_edges, dtype=float)
+    values = np.asarray(values, dtype=float)
+    ny, nx = values.shape
+    x0, x1 = np.broadcast_to(x_edges[:-1], (ny, nx)), np.broadcast_to(x_edges[1:], (ny, nx))
+    y0, y1 = np.broadcast_to(y_edges[:-1, None], (ny, nx)), np.broadcast_to(y_edges[1:, None], (ny, nx))
+    finite = np.isfinite(values)
+    columns = [a[finite].tolist() for a in (x0, x1, y0, y1, values)]
+    records = [{"x": a, "x2": b, "y": c, "y2": d, "v": v} for a, b, c, d, v in zip(*columns)]
+
+    spec = {
+        "data": {"values": records},
+        "mark": {"type": "rect", "tooltip": True},
+        "encoding": {
+            "x": {"field": "x", "type": "quantitative", "title": x_title,
+                  "scale": {"type": "log" if log_x else "linear", "nice": False}},
+            "x2": {"field": "x2"},
+            "y": {"field": "y", "type": "quantitative", "title": y_title,
+                  "scale": {"type": "log" if log_y else "linear", "nice": False}},
+            "y2": {"field": "y2"},
+            "color": {"field": "v", "type": "quantitative", "title": value_title, "scale": {"scheme": "viridis"}},
+        },
+    }
+    if title:
+        spec["title"] = title
+    return spec
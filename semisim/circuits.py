@@ -0,0 +1,205 @@
+"""
+소자를 포함한 간단한 회로의 동작점 계산.
+
+바이어스 점마다 비선형 방정식을 풀어야 하므로, 수천 개의 바이어스 점을 한 번에 푸는 배치 Newton–Raphson
+풀이기를 사용한다. 자코비안은 소자 식의 해석적 미분으로 구하고, 원소마다 수렴 여부를 따로 추적하여 이미 수렴한
+점은 다음 반복에서 계산하지 않는다.
+
+    - mosfet_operating_point: 소스/드레인 저항(R_S, R_D)이 있는 공통 소스 MOSFET
+    - cb_bjt_operating_point: 이미터 저항(R_E)과 컬렉터 저항(R_C)이 있는 공통 베이스 BJT (Ebers–Moll)
+
+NumPy만 사용한다.
+"""
+from collections import namedtuple
+
+import numpy as np
+
+from semisim.bjt import EbersMoll
+from semisim.mosfet import VTH, calculate_id_derivatives, calculate_mobility_sic, effective_mobility
+
+NewtonResult = namedtuple("NewtonResult", ["x", "converged", "iterations", "residual"])
+MosfetOperatingPoint = namedtuple(
+    "MosfetOperatingPoint", ["Id", "Vgs", "Vds", "region", "converged", "iterations"])
+BjtOperatingPoint = namedtuple(
+    "BjtOperatingPoint", ["I_E", "I_C", "V_BE", "V_CB", "converged", "iterations"])
+
+# MosfetOperatingPoint.region 값의 의미
+REGIONS = ("cutoff", "linear", "saturation")
+
+
+def newton(fun, x0, args=(), atol=1e-15, rtol=1e-10, max_iter=50, bounds=None, max_step=None):
+    """
+    독립적인 비선형 방정식 n개를 동시에 푸는 배치 Newton–Raphson 풀이기.
+
+    Parameters:
+    - fun: fun(x, *args) -> (F, J). 원소마다 미지수가 하나이면 x, F, J의 모양은 (n,),
+      m개이면 x, F는 (n, m), J는 (n, m, m) (J[i, a, b] = ∂F_a/∂x_b).
+    - x0: 초기값 (모양 (n,) 또는 (n, m))
+    - args: 원소별 추가 인자. 각각 길이 n으로 브로드캐스트되며, 아직 수렴하지 않은 원소만 전달된다.
+    - atol, rtol: 수렴 조건 |Δx| <= atol + rtol·|x| (모든 성분)
+    - max_iter: 최대 반복 횟수
+    - bounds: (lo, hi). 미지수가 하나이고 F가 x에 대해 증가 함수일 때 해를 감싸는 구간.
+      Newton 단계가 구간을 벗어나면 이분법 단계로 대신하므로 항상 수렴한다.
+    - max_step: 한 번에 움직일 수 있는 최대 크기 (감쇠 Newton, 지수 함수 식의 발산 방지)
+
+    Returns:
+    - NewtonResult(x, converged 원소별 bool, iterations 원소별 반복 횟수, residual 마지막 |F|)
+    """
+    x = np.array(x0, dtype=float)
+    n = x.shape[0]
+    scalar = x.ndim == 1
+    args = [np.broadcast_to(np.asarray(a, dtype=float), (n,)) for a in args]
+    converged = np.zeros(n, dtype=bool)
+    iterations = np.zeros(n, dtype=int)
+    residual = np.full(n, np.nan)
+    if bounds is not None:
+        if not scalar:
+            raise ValueError("bounds are only supported for one unknown per element")
+        lo = np.broadcast_to(np.asarray(bounds[0], dtype=float), (n,)).copy()
+        hi = np.broadcast_to(np.asarray(bounds[1], dtype=float), (n,)).copy()
+
+    active = np.arange(n)
+    for _ in range(max_iter):
+        if active.size == 0:
+            break
+        xa = x[active]
+        F, J = fun(xa, *(a[active] for a in args))
+        if scalar:
+            step = F / J
+            residual[active] = np.abs(F)
+        else:
+            step = np.linalg.solve(J, F[..., None])[..., 0]
+            residual[active] = np.sqrt((F ** 2).sum(axis=-1))
+        if max_step is not None:
+            size = np.abs(step) if scalar else np.abs(step).max(axis=-1, keepdims=True)
+            step = step * np.minimum(1.0, max_step / np.maximum(size, 1e-300))
+        x_new = xa - step
+        if bounds is not None:
+            lo_a = np.where(F < 0, xa, lo[active])
+            hi_a = np.where(F > 0, xa, hi[active])
+            outside = ~((x_new > lo_a) & (x_new < hi_a)) & (F != 0)
+            x_new = np.where(outside, 0.5 * (lo_a + hi_a), x_new)
+            lo[active], hi[active] = lo_a, hi_a
+
+        change = np.abs(x_new - xa)
+        done = change <= atol + rtol * np.abs(x_new)
+        if not scalar:
+            done = done.all(axis=-1)
+        x[active] = x_new
+        iterations[active] += 1
+        converged[active[done]] = True
+        active = active[~done]
+    return NewtonResult(x, converged, iterations, residual)
+
+
+def _mosfet_residual(Id, V_G, V_DD, R_D, R_S, W, L, N_D, N_A, mu_eff):
+    # 소스 저항에 걸리는 전압만큼 Vgs가, 두 저항에 걸리는 전압만큼 Vds가 줄어든다
+    Vgs = V_G - Id * R_S
+    Vds = V_DD - Id * (R_D + R_S)
+    I, gm, gds = calculate_id_derivatives(Vgs, Vds, W, L, N_D, N_A, mu_eff=mu_eff)
+    return Id - I, 1 + gm * R_S + gds * (R_D + R_S)
+
+
+def mosfet_operating_point(V_G, V_DD, R_D, R_S, W, L, N_D, N_A, T=300, mu_eff=None, **newton_options):
+    """
+    소스 저항 R_S와 드레인 저항 R_D가 있는 공통 소스 MOSFET의 동작점을 계산한다.
+
+        Vgs = V_G - Id·R_S,  Vds = V_DD - Id·(R_D + R_S),  Id = calculate_id(Vgs, Vds, ...)
+
+    모든 인자는 브로드캐스트되어 바이어스 점 배열 하나로 풀린다 (예: V_G를 1000개 값의 배열로 주면 바이어스
+    스윕 전체를 한 번에 계산한다).
+
+    Parameters:
+    - V_G: 게이트 전압 (V)
+    - V_DD: 드레인 전원 전압 (V)
+    - R_D, R_S: 드레인/소스 저항 (Ω)
+    - W, L, N_D, N_A, T, mu_eff: calculate_id와 같다
+    - newton_options: newton()에 전달할 옵션 (atol, rtol, max_iter)
+
+    Returns:
+    - MosfetOperatingPoint(Id A, Vgs V, Vds V, region REGIONS 인덱스, converged, iterations),
+      각 항목은 브로드캐스트된 인자 모양의 배열
+    """
+    if mu_eff is None:
+        mu_eff = effective_mobility(*calculate_mobility_sic(np.asarray(N_D, dtype=float), N_A, T))
+    arrays = np.broadcast_arrays(*(np.asarray(a, dtype=float) for a in (V_G, V_DD, R_D, R_S, W, L, N_D, N_A, mu_eff)))
+    shape = arrays[0].shape
+    V_G, V_DD, R_D, R_S, W, L, N_D, N_A, mu_eff = (a.ravel() for a in arrays)
+
+    # 저항이 없을 때의 전류 I0로 해를 감싼다: g(Id) = Id - I(Id)에서 g(0) = -I0, g(I0) >= 0
+    I0, _, _ = calculate_id_derivatives(V_G, V_DD, W, L, N_D, N_A, mu_eff=mu_eff)
+    bounds = (np.minimum(I0, 0.0), np.maximum(I0, 0.0) * (1 + 1e-12) + 1e-30)
+    result = newton(_mosfet_residual, np.zeros_like(V_G), (V_G, V_DD, R_D, R_S, W, L, N_D, N_A, mu_eff),
+                    bounds=bounds, **newton_options)
+
+    Id = result.x
+    Vgs = V_G - Id * R_S
+    Vds = V_DD - Id * (R_D + R_S)
+    V_ov = Vgs - VTH
+    region = np.where(V_ov < 0, 0, np.where(Vds < V_ov, 1, 2))
+    return MosfetOperatingPoint(*(a.reshape(shape) for a in (
+        Id, Vgs, Vds, region, result.converged, result.iterations)))
+
+
+def _bjt_residual(x, V_EE, V_CC, R_E, R_C, I_ES, I_CS, alpha_F, alpha_R, V_T):
+    V_BE, V_BC = x[:, 0], x[:, 1]
+    # 반복 도중의 큰 시도값에서도 오버플로가 나지 않도록 지수를 제한한다 (해 근처에서는 영향 없음)
+    x_E = np.minimum(V_BE / V_T, 700.0)
+    x_C = np.minimum(V_BC / V_T, 700.0)
+    f_E, f_C = np.expm1(x_E), np.expm1(x_C)
+    g_E, g_C = I_ES / V_T * np.exp(x_E), I_CS / V_T * np.exp(x_C)
+    I_E = I_ES * f_E - alpha_R * I_CS * f_C
+    I_C = alpha_F * I_ES * f_E - I_CS * f_C
+
+    F = np.empty_like(x)
+    J = np.empty(x.shape + (2,))
+    # 이미터 루프: I_E = (V_EE - V_BE) / R_E
+    F[:, 0] = I_E - (V_EE - V_BE) / R_E
+    J[:, 0, 0] = g_E + 1 / R_E
+    J[:, 0, 1] = -alpha_R * g_C
+    # 컬렉터 루프: V_CB = -V_BC = V_CC - I_C·R_C
+    F[:, 1] = V_BC + V_CC - I_C * R_C
+    J[:, 1, 0] = -R_C * alpha_F * g_E
+    J[:, 1, 1] = 1 + R_C * g_C
+    return F, J
+
+
+def cb_bjt_operating_point(V_EE, V_CC, R_E, R_C, model=None, max_step=0.1, **newton_options):
+    """
+    공통 베이스 BJT 바이어스 회로의 동작점을 계산한다 (베이스 접지, NPN).
+
+    이미터는 저항 R_E를 거쳐 전원 -V_EE에, 컬렉터는 저항 R_C를 거쳐 전원 V_CC에 연결된다.
+    미지수 (V_BE, V_BC)에 대한 2×2 연립 방정식을 Ebers–Moll 식과 그 해석적 자코비안으로 푼다.
+
+    Parameters:
+    - V_EE: 이미터 전원 전압의 크기 (V, 이미터 쪽 전원은 -V_EE)
+    - V_CC: 컬렉터 전원 전압 (V)
+    - R_E: 이미터 저항 (Ω, 0보다 커야 한다)
+    - R_C: 컬렉터 저항 (Ω)
+    - model: EbersMoll 모델 (None이면 기본값)
+    - max_step: 한 반복에서 접합 전압이 바뀔 수 있는 최대 크기 (V)
+    - newton_options: newton()에 전달할 옵션 (atol, rtol, max_iter)
+
+    Returns:
+    - BjtOperatingPoint(I_E A, I_C A, V_BE V, V_CB V, converged, iterations), 각 항목은 브로드캐스트된 인자 모양의 배열
+    """
+    model = model or EbersMoll()
+    arrays = np.broadcast_arrays(*(np.asarray(a, dtype=float) for a in (V_EE, V_CC, R_E, R_C)))
+    shape = arrays[0].shape
+    V_EE, V_CC, R_E, R_C = (a.ravel() for a in arrays)
+    if np.any(R_E <= 0):
+        raise ValueError("R_E must be positive")
+
+    # 초기값: 이미터 전류가 모두 다이오드로 흐른다고 보고 V_BE를, 순방향 동작을 가정해 V_BC를 정한다
+    I_E0 = np.maximum(V_EE, 0.0) / R_E
+    V_BE0 = model.V_T * np.log1p(I_E0 / model.I_ES)
+    V_BC0 = np.minimum(-(V_CC - model.alpha_F * I_E0 * R_C), V_BE0)
+    params = (V_EE, V_CC, R_E, R_C, model.I_ES, model.I_CS, model.alpha_F, model.alpha_R, model.V_T)
+    result = newton(_bjt_residual, np.stack([V_BE0, V_BC0], axis=-1), params, max_step=max_step,
+                    **{"atol": 1e-12, **newton_options})
+
+    V_BE, V_BC = result.x[:, 0], result.x[:, 1]
+    I_E = model.emitter_current(V_BE, -V_BC).value()
+    I_C = model.collector_current(V_BE, -V_BC).value()
+    return BjtOperatingPoint(*(a.reshape(shape) for a in (
+        I_E, I_C, V_BE, -V_BC, result.converged, result.iterations)))
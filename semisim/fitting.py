@@ -0,0 +1,318 @@
+"""
+측정 I-V 데이터로부터 이동도 모델 상수와 임계 전압을 추출하는 배치 비선형 최소제곱 피팅.
+
+로트 하나의 다이 수천 개를 다이마다 따로 피팅하되, 파이썬 반복문 대신 모든 다이를 한 배열로 묶어
+Levenberg–Marquardt 반복을 동시에 진행한다. 다이마다 감쇠 계수와 수렴 여부를 따로 추적하고, 수렴한 다이는
+다음 반복에서 계산하지 않는다 (semisim.circuits.newton과 같은 방식). 자코비안은 calculate_mobility_sic →
+effective_mobility → calculate_id의 연쇄 법칙으로 해석적으로 구한다.
+
+- 피팅할 수 있는 파라미터: calculate_mobility_sic의 상수(mu_1_e, mu_0_e, mu_1_h, mu_0_h, N_ref, alpha_e,
+  alpha_h, gamma)와 임계 전압 Vth. 양수 상수(이동도, N_ref)는 로그 공간에서 갱신한다.
+- 식별 가능성: 다이 하나는 N_D, N_A가 고정되어 있으므로 I-V 곡선은 이동도를 μ_eff(T) 하나로만 본다.
+  여러 온도에서 측정한 데이터라야 격자 항(mu_1, alpha)을 분리할 수 있고, 불순물 항(mu_0, N_ref, gamma)과
+  전자/정공 항은 다이 하나의 데이터로는 서로 구분되지 않는다. 기본 피팅 대상은 ("mu_1_e", "alpha_e", "Vth")이다.
+- 잔차는 상대 오차 (Id_model - Id) / max(|Id|, floor)이다. floor는 다이별 최대 전류의 1e-3 배이다.
+
+    >>> result = fit_mosfet(Vgs, Vds, Id, W=10, L=10, N_D=N_D, N_A=N_A, T=T)   # Vgs, Vds, Id, T: (다이 수, 점 수)
+    >>> result.params["Vth"], result.converged.mean()
+
+NumPy만 사용한다.
+"""
+import inspect
+from collections import namedtuple
+
+import numpy as np
+
+from semisim.mosfet import COX, VTH, calculate_mobility_sic
+
+FitResult = namedtuple("FitResult", ["params", "stderr", "converged", "iterations", "cost", "rms"])
+
+# 파라미터 이름 -> 로그 공간에서 갱신하는지 (양수 상수)
+PARAMETERS = {
+    "mu_1_e": True,
+    "mu_0_e": True,
+    "mu_1_h": True,
+    "mu_0_h": True,
+    "N_ref": True,
+    "alpha_e": False,
+    "alpha_h": False,
+    "gamma": False,
+    "Vth": False,
+}
+# 기본값은 모델 함수의 기본 인자를 그대로 쓴다
+DEFAULTS = {
+    name: p.default for name, p in inspect.signature(calculate_mobility_sic).parameters.items() if name in PARAMETERS
+}
+DEFAULTS["Vth"] = VTH
+
+DEFAULT_FREE = ("mu_1_e", "alpha_e", "Vth")
+
+
+def mobility_jacobian(params, free, T, N_total):
+    """
+    효과적인 이동도와 이동도 상수에 대한 해석적 편미분 (calculate_mobility_sic → effective_mobility).
+
+    Parameters:
+    - params: 파라미터 이름 -> 값 (PARAMETERS의 이동도 상수, 서로 브로드캐스트되는 배열)
+    - free: 미분할 파라미터 이름 목록 (Vth는 건너뛴다). 로그 공간 파라미터 p는 ∂μ_eff/∂ln p 를 돌려준다.
+    - T: 온도 (K), N_total: N_D + N_A (cm^-3)
+
+    Returns:
+    - μ_eff, 이름 -> ∂μ_eff/∂θ dict
+    """
+    log_t = np.log(T / 300)
+    mu_L_e = params["mu_1_e"] * np.exp(-params["alpha_e"] * log_t)
+    mu_L_h = params["mu_1_h"] * np.exp(-params["alpha_h"] * log_t)
+    x = N_total / params["N_ref"]
+    x_gamma = x ** params["gamma"]
+    s = 1 + x_gamma
+    mu_I_e = params["mu_0_e"] / s
+    mu_I_h = params["mu_0_h"] / s
+    mu_e = 1 / (1 / mu_L_e + 1 / mu_I_e)
+    mu_h = 1 / (1 / mu_L_h + 1 / mu_I_h)
+    mu_sum = mu_e + mu_h
+    mu_eff = mu_e * mu_h / mu_sum
+
+    # ∂μ_eff/∂μ_e = (μ_h/(μ_e+μ_h))^2, Matthiessen 규칙: ∂μ/∂ln μ_L = μ^2/μ_L, ∂μ/∂ln μ_I = μ^2/μ_I
+    # (한 항이 매우 커도 0으로 잘 정의된다)
+    g_e = (mu_h / mu_sum * mu_e) ** 2
+    g_h = (mu_e / mu_sum * mu_h) ** 2
+    lattice_e = g_e / mu_L_e  # ∂μ_eff/∂ln μ_L,e
+    lattice_h = g_h / mu_L_h
+    impurity_e = g_e / mu_I_e  # ∂μ_eff/∂ln μ_I,e
+    impurity_h = g_h / mu_I_h
+    derivatives = {
+        "mu_1_e": lambda: lattice_e,
+        "mu_1_h": lambda: lattice_h,
+        "alpha_e": lambda: -lattice_e * log_t,
+        "alpha_h": lambda: -lattice_h * log_t,
+        "mu_0_e": lambda: impurity_e,
+        "mu_0_h": lambda: impurity_h,
+        "gamma": lambda: -(impurity_e + impurity_h) / s * x_gamma * np.log(x),
+        "N_ref": lambda: (impurity_e + impurity_h) / s * params["gamma"] * x_gamma,
+    }
+    return mu_eff, {name: derivatives[name]() for name in free if name != "Vth"}
+
+
+def model_jacobian(params, free, Vgs, Vds, W, L, N_D, N_A, T, Cox=COX, T_index=None):
+    """
+    드레인 전류와 피팅 파라미터에 대한 해석적 편미분.
+
+    Parameters:
+    - params: 파라미터 이름 -> 값 (PARAMETERS의 모든 이름, 다이별 값은 (n, 1) 모양)
+    - free: 미분할 파라미터 이름 목록. 로그 공간 파라미터 p는 ∂Id/∂ln p 를 돌려준다.
+    - Vgs, Vds: (n, m) 배열 (V), W, L: (n, 1) 배열 (cm), N_D, N_A, Cox: (n, 1) 배열
+    - T: 온도 (K). T_index가 없으면 (n, m)으로 브로드캐스트되는 배열.
+    - T_index: 주면 T는 서로 다른 온도 값들 (k,)이고, 점 (i, j)의 온도는 T[T_index[i, j]]이다
+      (모든 다이의 측정 순서가 같으면 (m,) 모양으로 T[T_index[j]]). 측정 온도가 몇 개뿐일 때 이동도 계산을
+      (n, m) 대신 (n, k)에서 한다.
+
+    Returns:
+    - Id (n, m), J (n, len(free), m)
+    """
+    n = Vgs.shape[0]
+    if T_index is None:
+        mu_eff, dmu = mobility_jacobian(params, free, T, N_D + N_A)
+    else:
+        mu_eff, dmu = mobility_jacobian(params, free, T[None, :], N_D + N_A)
+
+    def per_point(a):
+        # (n, k) 온도별 값을 (n, m) 측정 점으로 펼친다
+        if T_index is None:
+            return a
+        a = np.broadcast_to(a, (n, T.size))
+        return a[:, T_index] if T_index.ndim == 1 else np.take_along_axis(a, T_index, axis=1)
+
+    mu_eff = per_point(mu_eff)
+    # calculate_id와 같은 식: Id = μ_eff·k'·f, k' = (N_D/N_A)·Cox·W/L. 선형/포화 영역을 V_e = min(Vds, V_ov)로 합쳐
+    # f = V_e·(V_ov - V_e/2), ∂f/∂V_ov = V_e (선형: Vds, 포화: V_ov)로 쓴다. 차단 영역은 0.
+    k_per_mu = (N_D / N_A) * Cox * (W / L)
+    V_ov = Vgs - params["Vth"]
+    V_e = np.where(V_ov < 0, 0.0, np.minimum(Vds, V_ov))
+    dI_dmu = k_per_mu * V_e * (V_ov - V_e / 2)
+    Id = mu_eff * dI_dmu
+
+    J = np.empty((n, len(free), Vgs.shape[1]))
+    for j, name in enumerate(free):
+        if name == "Vth":
+            J[:, j] = -mu_eff * k_per_mu * V_e
+        else:
+            J[:, j] = per_point(dmu[name]) * dI_dmu
+    return Id, J
+
+
+def _initial_vth(Vgs, Vds, Id):
+    # 포화 영역(Vds >= Vgs - Vth, 보수적으로 Vds >= Vgs)에서 sqrt(Id)는 Vgs에 대해 직선이므로 그 절편을 쓴다
+    mask = (Id > 0) & (Vds >= Vgs)
+    y = np.sqrt(np.where(mask, Id, 0.0))
+    n = mask.sum(axis=1)
+    sx, sy = (Vgs * mask).sum(axis=1), y.sum(axis=1)
+    sxx, sxy = (Vgs ** 2 * mask).sum(axis=1), (Vgs * y).sum(axis=1)
+    denominator = n * sxx - sx ** 2
+    with np.errstate(divide="ignore", invalid="ignore"):
+        slope = (n * sxy - sx * sy) / denominator
+        vth = (sx - sy / slope) / n
+    ok = (n >= 2) & (denominator > 0) & (slope > 0) & np.isfinite(vth)
+    return np.where(ok, vth, VTH)
+
+
+def levenberg_marquardt(evaluate, theta, max_iter=100, ftol=1e-8, xtol=1e-8, gtol=1e-12):
+    """
+    독립적인 최소제곱 문제 n개를 동시에 푸는 배치 Levenberg–Marquardt 반복.
+
+    문제마다 감쇠 계수(Marquardt 척도 사용)와 수렴 여부를 따로 추적하고, 끝난 문제는 다음 반복에서
+    계산하지 않는다.
+
+    Parameters:
+    - evaluate: evaluate(idx, theta[idx]) -> (잔차 (k, m), 자코비안 (k, p, m)). idx는 계산할 문제 번호 배열.
+    - theta: 초기값 (n, p)
+    - max_iter, ftol, xtol, gtol: fit_mosfet과 같다
+
+    Returns:
+    - (theta, 잔차, 자코비안, cost 0.5·Σ잔차², converged, iterations)
+    """
+    n = theta.shape[0]
+    theta = theta.copy()
+    r, J = evaluate(np.arange(n), theta)
+    cost = 0.5 * (r ** 2).sum(axis=1)
+    damping = np.full(n, 1e-3)
+    diag = np.zeros_like(theta)
+    converged = np.zeros(n, dtype=bool)
+    iterations = np.zeros(n, dtype=int)
+    identity = np.eye(theta.shape[1])
+
+    active = np.arange(n)
+    for _ in range(max_iter):
+        if active.size == 0:
+            break
+        Ja = J[active]
+        A = Ja @ Ja.transpose(0, 2, 1)
+        g = (Ja @ r[active, :, None])[..., 0]
+        # Marquardt 척도: JᵀJ의 대각 성분 (지금까지의 최댓값, 0이 되지 않도록 하한을 둔다)
+        diag[active] = np.maximum(diag[active], np.diagonal(A, axis1=1, axis2=2))
+        D = np.maximum(diag[active], 1e-12 * diag[active].max(axis=1, keepdims=True) + 1e-300)
+        step = np.linalg.solve(A + damping[active, None, None] * D[:, None, :] * identity, -g[..., None])[..., 0]
+
+        theta_new = theta[active] + step
+        r_new, J_new = evaluate(active, theta_new)
+        cost_new = 0.5 * (r_new ** 2).sum(axis=1)
+        accept = (cost_new < cost[active]) & np.isfinite(J_new).all(axis=(1, 2))
+        iterations[active] += 1
+
+        # 받아들인 단계는 감쇠를 줄이고(가우스-뉴턴 쪽), 거절한 단계는 감쇠를 늘려(경사 하강 쪽) 다시 시도한다
+        idx = active[accept]
+        reduction = cost[idx] - cost_new[accept]
+        theta[idx], r[idx], J[idx], cost[idx] = theta_new[accept], r_new[accept], J_new[accept], cost_new[accept]
+        damping[idx] = np.maximum(damping[idx] / 3, 1e-12)
+        damping[active[~accept]] *= 4
+
+        small_step = (np.abs(step) <= xtol * (np.abs(theta[active]) + xtol)).all(axis=1)
+        small_gradient = np.abs(g).max(axis=1) <= gtol
+        done = small_step | small_gradient
+        done[accept] |= reduction <= ftol * (cost[idx] + reduction)
+        converged[active[done]] = True
+        # 감쇠가 너무 커지면 더 나아질 수 없으므로 (수렴하지 않은 채로) 멈춘다
+        stuck = damping[active] > 1e12
+        active = active[~(done | stuck)]
+
+    return theta, r, J, cost, converged, iterations
+
+
+def fit_mosfet(Vgs, Vds, Id, W, L, N_D, N_A, T=300, free=DEFAULT_FREE, initial=None, fixed=None, Cox=COX,
+               max_iter=100, ftol=1e-8, xtol=1e-8, gtol=1e-12, floor=1e-3, block_size=1024):
+    """
+    다이마다 측정한 I-V 점들에 MOSFET 모델을 동시에 피팅한다 (배치 Levenberg–Marquardt).
+
+    Parameters:
+    - Vgs, Vds, Id: 측정 점 (n 다이, m 점) 배열 (V, V, A). Id는 calculate_id와 같은 부호 (n형, 양수).
+    - W, L, N_D, N_A: 다이별 값 (스칼라 또는 길이 n 배열, calculate_id와 같은 단위)
+    - T: 측정 온도 (K). 스칼라, 다이별 (n,), 또는 점별 (n, m)
+    - free: 피팅할 파라미터 이름 (PARAMETERS 중에서)
+    - initial: 파라미터 이름 -> 초기값 (스칼라 또는 다이별). 주지 않은 파라미터는 DEFAULTS에서 시작하며,
+      Vth는 포화 영역 sqrt(Id)-Vgs 직선의 절편으로 다이마다 추정한다.
+    - fixed: 피팅하지 않는 파라미터 이름 -> 값 (주지 않으면 DEFAULTS)
+    - Cox: 산화막 캐패시턴스 (F/cm^2, 스칼라 또는 다이별)
+    - max_iter: 최대 반복 횟수
+    - ftol: 비용의 상대 감소가 이보다 작으면 수렴
+    - xtol: 파라미터 변화가 xtol·(|θ| + xtol) 이하이면 수렴
+    - gtol: 기울기 성분의 최댓값이 이보다 작으면 수렴
+    - floor: 상대 잔차의 분모 하한 (다이별 최대 |Id|에 대한 비율)
+    - block_size: 한 번에 반복하는 다이 수 (결과에는 영향이 없고 메모리와 속도만 바꾼다)
+
+    Returns:
+    - FitResult(params 이름 -> (n,) 추정값, stderr 이름 -> (n,) 표준 오차 (잔차 분산으로 추정),
+      converged (n,) bool, iterations (n,), cost (n,) 0.5·Σ상대 잔차², rms (n,) 상대 잔차의 RMS)
+    """
+    free = tuple(free)
+    unknown = set(free) - set(PARAMETERS)
+    if unknown:
+        raise ValueError(f"unknown parameters: {sorted(unknown)} (expected some of {list(PARAMETERS)})")
+    Id = np.asarray(Id, dtype=float)
+    if Id.ndim != 2:
+        raise ValueError("Vgs, Vds and Id must be (dies, points) arrays")
+    n, m = Id.shape
+    Vgs = np.broadcast_to(np.asarray(Vgs, dtype=float), (n, m))
+    Vds = np.broadcast_to(np.asarray(Vds, dtype=float), (n, m))
+    T = np.asarray(T, dtype=float)
+    T = np.broadcast_to(T[:, None] if T.ndim == 1 else T, (n, m))
+    # 측정 온도가 점 수보다 적으면 이동도는 서로 다른 온도에서만 계산한다
+    T_values, T_index = np.unique(T, return_inverse=True)
+    if T_values.size <= m:
+        T, T_index = T_values, T_index.reshape(n, m)
+        if (T_index == T_index[:1]).all():
+            T_index = T_index[0]  # 모든 다이의 측정 순서가 같다
+    else:
+        T_index = None
+    per_die = [np.broadcast_to(np.asarray(a, dtype=float), (n,))[:, None] for a in (W, L, N_D, N_A, Cox)]
+    W_cm, L_cm = per_die[0] * 1e-4, per_die[1] * 1e-4
+
+    values = dict(DEFAULTS, **(fixed or {}))
+    start = dict(initial or {})
+    if "Vth" in free and "Vth" not in start:
+        start["Vth"] = _initial_vth(Vgs, Vds, Id)
+    log_scaled = np.array([PARAMETERS[name] for name in free])
+    theta = np.stack([np.broadcast_to(np.asarray(start.get(name, values[name]), dtype=float), (n,)) for name in free],
+                     axis=-1).copy()
+    theta[:, log_scaled] = np.log(theta[:, log_scaled])
+    constants = {name: np.broadcast_to(np.asarray(v, dtype=float), (n,))[:, None]
+                 for name, v in values.items() if name not in free}
+    weight = 1 / np.maximum(np.abs(Id), floor * np.abs(Id).max(axis=1, keepdims=True) + 1e-300)
+
+    def evaluate(idx, th):
+        # 다이 idx의 (잔차, 자코비안). 로그 공간 파라미터는 지수를 취해 모델에 넘긴다
+        params = {name: c[idx] for name, c in constants.items()}
+        for j, name in enumerate(free):
+            params[name] = (np.exp(th[:, j]) if log_scaled[j] else th[:, j])[:, None]
+        # 너무 큰 단계에서의 지수 넘침은 유한하지 않은 결과가 되어 단계가 거절된다
+        with np.errstate(over="ignore", invalid="ignore", divide="ignore"):
+            Id_model, J = model_jacobian(
+                params, free, Vgs[idx], Vds[idx], W_cm[idx], L_cm[idx], per_die[2][idx], per_die[3][idx],
+                T if T_index is not None else T[idx], per_die[4][idx],
+                T_index[idx] if T_index is not None and T_index.ndim == 2 else T_index,
+            )
+        w = weight[idx]
+        return (Id_model - Id[idx]) * w, J * w[:, None, :]
+
+    # 다이 블록마다 따로 반복한다 (다이들은 서로 독립이며, 블록의 중간 배열이 캐시에 들어가 더 빠르다)
+    J = np.empty((n, len(free), m))
+    r = np.empty((n, m))
+    cost = np.empty(n)
+    converged = np.empty(n, dtype=bool)
+    iterations = np.empty(n, dtype=int)
+    for b in range(0, n, block_size):
+        block = slice(b, min(b + block_size, n))
+        result = levenberg_marquardt(lambda idx, th: evaluate(idx + b, th), theta[block], max_iter, ftol, xtol, gtol)
+        theta[block], r[block], J[block], cost[block], converged[block], iterations[block] = result
+
+    # 표준 오차: (JᵀJ)^-1 · (잔차 제곱합 / 자유도). 로그 공간 파라미터는 p·se(ln p)
+    A = J @ J.transpose(0, 2, 1)
+    variance = 2 * cost / max(m - len(free), 1)
+    covariance = np.linalg.pinv(A) * variance[:, None, None]
+    se = np.sqrt(np.maximum(np.diagonal(covariance, axis1=1, axis2=2), 0.0))
+    estimates = theta.copy()
+    estimates[:, log_scaled] = np.exp(theta[:, log_scaled])
+    se[:, log_scaled] *= estimates[:, log_scaled]
+
+    params = {name: estimates[:, j] for j, name in enumerate(free)}
+    stderr = {name: se[:, j] for j, name in enumerate(free)}
+    return FitResult(params, stderr, converged, iterations, cost, np.sqrt(2 * cost / m))
@@ -0,0 +1,293 @@
+"""
+동시 세션 부하 테스트.
+
+한 서버가 동시에 몇 명의 학생을 감당할 수 있는지 보기 위해, 앱을 로컬 Streamlit 서버로 띄우고 N개의 헤드리스
+세션(semisim.session_client)이 실제 사용 패턴을 흉내 낸 시나리오를 동시에 반복한다.
+
+- mosfet_drag: MOSFET 페이지에서 Vgs, W, 온도 슬라이더를 한 칸씩 끌어 옮긴다
+- process_steps: About MOSFET 페이지에서 27개 공정 단계를 "다음"으로 넘기고 (이온 주입 단계에서는 열처리 조건을
+  바꾼다) 몇 단계 되돌아간다
+- bjt_params: BJT 페이지에서 열전압, 포화 전류, V_CB 범위를 바꾼다
+
+세션은 동작 사이에 평균 think초(지수 분포)를 쉬며, 각 동작은 재실행 한 번이다. 동시 세션 수(예: 1, 10, 30)마다
+정해진 시간 동안 재실행 지연 시간의 백분위수, 처리량(재실행/초), 서버 프로세스(와 자식 프로세스)의 메모리를
+측정해 JSON으로 보고한다. 외부 네트워크 없이 로컬 서버만 사용한다.
+
+클라이언트는 이벤트 루프 하나에서 모든 세션을 구동하므로 서버와 같은 머신에서 실행하면 CPU를 조금 나눠 쓴다.
+
+    $ python -m semisim.loadtest --sessions 1,10,30 --duration 60 --output load.json
+    $ python -m semisim.loadtest --url http://127.0.0.1:8501 --pid 12345 --sessions 20 --scenario mosfet_drag
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import time
+from collections import namedtuple
+
+import numpy as np
+
+from semisim.bench import DEFAULT_APP, PAGES, environment_info
+
+# 재실행 한 번: 누를 버튼 라벨(없으면 None)과 바꿀 위젯 값 (라벨 -> 값)
+Action = namedtuple("Action", ["click", "values"])
+
+PERCENTILES = (50, 90, 95, 99)
+
+
+def _open(page):
+    return Action(PAGES[page], {})
+
+
+def _drag(label, start, stop, step, digits=6):
+    # 슬라이더를 start에서 stop까지 한 칸씩 끄는 동안 보내는 값들
+    n = int(round(abs(stop - start) / step))
+    direction = 1 if stop >= start else -1
+    return [Action(None, {label: round(start + direction * step * (i + 1), digits)}) for i in range(n)]
+
+
+def mosfet_drag(rng):
+    """MOSFET 페이지: Vgs, W, 온도 슬라이더 끌기."""
+    Vgs = rng.randrange(5, 46) / 10
+    W = 0.1 + 0.5 * rng.randrange(2, 38)
+    T = 10 * rng.randrange(20, 46)
+    return ([_open("MOSFET_3D")]
+            + _drag("Gate-Source Voltage (Vgs) [V]", 1.5, Vgs, 0.1)
+            + _drag("채널 폭 (W) [µm]", 0.1, W, 0.5)
+            + _drag("온도 (K)", 300, T, 10))
+
+
+def process_steps(rng):
+    """About MOSFET 페이지: 27개 공정 단계를 넘기고, 이온 주입 단계에서 열처리 조건을 바꾼다."""
+    from semisim.process_flow import IMPLANT_STEP, steps_description
+
+    actions = [_open("MOSFET_DESC")]
+    for step in range(1, len(steps_description)):
+        actions.append(Action("다음", {}))
+        if step == IMPLANT_STEP:
+            actions += _drag("열처리 시간 (분)", 30, rng.randrange(10, 60), 5, digits=0)
+            actions += _drag("열처리 온도 (°C)", 1000, 10 * rng.randrange(90, 110), 10, digits=0)
+    actions += [Action("이전", {})] * rng.randrange(1, 6)
+    return actions
+
+
+def bjt_params(rng):
+    """BJT 페이지: 열전압, 포화 전류, V_CB 범위 바꾸기."""
+    return ([_open("BJT")]
+            + _drag("Thermal Voltage (V_T, V)", 0.026, rng.randrange(20, 40) / 1000, 0.001)
+            + _drag("Saturation Current (I_S, pA)", 0.01, rng.randrange(5, 30) / 1000, 0.001)
+            + _drag("Max Collector-Base Voltage (V_CB, V)", 20, rng.randrange(5, 20), 1, digits=0))
+
+
+SCENARIOS = {
+    "mosfet_drag": mosfet_drag,
+    "process_steps": process_steps,
+    "bjt_params": bjt_params,
+}
+
+
+def process_memory(pid):
+    """
+    프로세스 pid와 그 자식 프로세스들(예: Monte Carlo 프로세스 풀)의 상주 메모리 합 (바이트).
+    /proc를 읽으므로 Linux에서만 동작하며, 그 밖에서는 None.
+    """
+    total = 0
+    pending = [pid]
+    while pending:
+        current = pending.pop()
+        try:
+            with open(f"/proc/{current}/statm") as f:
+                total += int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+            for task in os.listdir(f"/proc/{current}/task"):
+                with open(f"/proc/{current}/task/{task}/children") as f:
+                    pending.extend(int(child) for child in f.read().split())
+        except (OSError, ValueError, AttributeError):
+            # 서버 자신을 읽을 수 없으면 측정 불가, 측정하는 사이에 끝난 자식 프로세스는 건너뛴다
+            if current == pid:
+                return None
+    return total
+
+
+async def _sample_memory(pid, samples, interval):
+    while True:
+        value = process_memory(pid)
+        if value is not None:
+            samples.append(value)
+        await asyncio.sleep(interval)
+
+
+async def _session(base_url, scenario, rng, deadline, think, records, errors, exceptions):
+    from semisim.session_client import SessionClient
+
+    try:
+        async with SessionClient(base_url) as client:
+            await client.rerun()  # 첫 화면 (사이드바 버튼 ID를 얻는다)
+            while time.monotonic() < deadline:
+                for action in SCENARIOS[scenario](rng):
+                    if time.monotonic() >= deadline:
+                        break
+                    if think > 0:
+                        await asyncio.sleep(rng.expovariate(1 / think))
+                    result = await client.rerun(click=action.click, values=action.values)
+                    records.append((scenario, result.elapsed))
+            exceptions.update(client.exceptions)
+    except (OSError, KeyError, asyncio.TimeoutError) as exc:
+        # 연결 실패, 시간 초과, 화면에 없는 위젯 (앱과 시나리오가 맞지 않음)
+        errors.append(f"{scenario}: {type(exc).__name__}: {exc}")
+
+
+def _latency_stats(latencies):
+    latencies = np.asarray(latencies)
+    if latencies.size == 0:
+        return {f"p{p}_s": None for p in PERCENTILES} | {"mean_s": None, "max_s": None}
+    stats = {f"p{p}_s": float(np.percentile(latencies, p)) for p in PERCENTILES}
+    return stats | {"mean_s": float(latencies.mean()), "max_s": float(latencies.max())}
+
+
+async def run_level(base_url, n_sessions, duration, scenarios=tuple(SCENARIOS), think=0.2, ramp=2.0, pid=None,
+                    seed=0, memory_interval=0.5):
+    """
+    n_sessions개의 세션을 duration초 동안 동시에 구동하고 결과를 돌려준다.
+
+    세션 i는 scenarios[i % len(scenarios)] 시나리오를 반복하며, 시작 시각은 ramp초에 걸쳐 고르게 나눈다.
+    지연 시간은 재실행 요청을 보낸 시점부터 스크립트 종료 메시지를 받을 때까지이다.
+
+    Returns:
+    - dict: sessions, duration_s, reruns, throughput_per_s, latency (p50/p90/p95/p99/mean/max 초),
+      scenarios (시나리오별 reruns와 지연 시간), memory (서버 메모리 시작/최대/끝 바이트, pid가 없으면 None),
+      errors, exceptions
+    """
+    records = []
+    errors = []
+    exceptions = set()
+    memory = []
+    sampler = asyncio.ensure_future(_sample_memory(pid, memory, memory_interval)) if pid is not None else None
+
+    async def delayed(i):
+        await asyncio.sleep(ramp * i / max(n_sessions, 1))
+        rng = random.Random(seed * 100_003 + i)
+        await _session(base_url, scenarios[i % len(scenarios)], rng, deadline, think, records, errors, exceptions)
+
+    start = time.monotonic()
+    deadline = start + duration
+    await asyncio.gather(*(delayed(i) for i in range(n_sessions)))
+    elapsed = time.monotonic() - start
+    if sampler is not None:
+        sampler.cancel()
+        memory.append(process_memory(pid) or (memory[-1] if memory else 0))
+
+    per_scenario = {}
+    for name in scenarios:
+        latencies = [t for s, t in records if s == name]
+        per_scenario[name] = {"reruns": len(latencies), **_latency_stats(latencies)}
+    return {
+        "sessions": n_sessions,
+        "duration_s": elapsed,
+        "reruns": len(records),
+        "throughput_per_s": len(records) / elapsed,
+        "latency": _latency_stats([t for _, t in records]),
+        "scenarios": per_scenario,
+        "memory": {"start_bytes": memory[0], "peak_bytes": max(memory), "end_bytes": memory[-1]} if memory else None,
+        "errors": errors,
+        "exceptions": sorted(exceptions),
+    }
+
+
+async def _warm_up(base_url, scenarios, seed):
+    # 첫 import와 결과 캐시 채우기를 측정에서 빼기 위해 시나리오마다 한 번씩 끝까지 실행한다
+    from semisim.session_client import SessionClient
+
+    for name in scenarios:
+        async with SessionClient(base_url) as client:
+            await client.rerun()
+            for action in SCENARIOS[name](random.Random(seed)):
+                await client.rerun(click=action.click, values=action.values)
+
+
+def run_load_test(levels, duration=30.0, scenarios=tuple(SCENARIOS), think=0.2, ramp=2.0, app_path=DEFAULT_APP,
+                  url=None, pid=None, warm_up=True, seed=0, log=None):
+    """
+    동시 세션 수 levels마다 run_level을 차례로 실행한다.
+
+    Parameters:
+    - levels: 동시 세션 수 목록 (예: [1, 10, 30])
+    - duration: 단계마다 세션을 구동하는 시간 (초)
+    - scenarios: 사용할 시나리오 이름 (세션마다 돌아가며 배정된다)
+    - think: 동작 사이의 평균 대기 시간 (초)
+    - ramp: 세션 시작을 나누어 배치하는 시간 (초)
+    - app_path: url이 없을 때 띄울 Streamlit 앱 경로
+    - url: 이미 실행 중인 로컬 서버 주소. 주면 서버를 띄우지 않는다.
+    - pid: 메모리를 측정할 서버 프로세스 ID (서버를 직접 띄우면 자동으로 정해진다)
+    - warm_up: 측정 전에 시나리오마다 한 번씩 실행할지
+    - log: 진행 상황을 출력할 함수 (None이면 출력하지 않음)
+
+    Returns:
+    - 단계별 결과 dict의 리스트
+    """
+    from semisim.session_client import local_server
+
+    async def run_all(base_url, server_pid):
+        if warm_up:
+            await _warm_up(base_url, scenarios, seed)
+        results = []
+        for n in levels:
+            result = await run_level(base_url, n, duration, scenarios, think, ramp, server_pid, seed)
+            results.append(result)
+            if log is not None:
+                latency = result["latency"]
+                peak = result["memory"]["peak_bytes"] / 2**20 if result["memory"] else float("nan")
+                log(f"sessions={n:<4d} reruns={result['reruns']:<6d} "
+                    f"throughput={result['throughput_per_s']:7.1f}/s "
+                    f"p50={(latency['p50_s'] or 0) * 1e3:8.1f} ms p95={(latency['p95_s'] or 0) * 1e3:8.1f} ms "
+                    f"p99={(latency['p99_s'] or 0) * 1e3:8.1f} ms peak={peak:7.0f} MiB errors={len(result['errors'])}")
+        return results
+
+    if url is not None:
+        return asyncio.run(run_all(url, pid))
+    with local_server(app_path) as (base_url, proc):
+        return asyncio.run(run_all(base_url, proc.pid))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m semisim.loadtest", description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sessions", default="1,5,10", help="쉼표로 구분한 동시 세션 수 (기본: 1,5,10)")
+    parser.add_argument("--duration", type=float, default=30.0, help="동시 세션 수마다 측정할 시간 (초)")
+    parser.add_argument("--scenario", default=None,
+                        help="사용할 시나리오 (쉼표로 구분, 기본: 전체). 가능한 값: " + ", ".join(SCENARIOS))
+    parser.add_argument("--think", type=float, default=0.2, help="동작 사이의 평균 대기 시간 (초)")
+    parser.add_argument("--ramp", type=float, default=2.0, help="세션 시작을 나누어 배치하는 시간 (초)")
+    parser.add_argument("--app", default=DEFAULT_APP, help="띄울 Streamlit 앱 경로")
+    parser.add_argument("--url", default=None, help="이미 실행 중인 로컬 서버 주소 (주면 서버를 띄우지 않는다)")
+    parser.add_argument("--pid", type=int, default=None, help="--url 서버의 프로세스 ID (메모리 측정용)")
+    parser.add_argument("--no-warm-up", action="store_true", help="측정 전의 시나리오 예열 실행을 건너뛴다")
+    parser.add_argument("--seed", type=int, default=0, help="시나리오 난수 시드")
+    parser.add_argument("--output", "-o", default="-", help="결과 JSON 파일 (기본: 표준 출력)")
+    args = parser.parse_args(argv)
+
+    def log(line):
+        print(line, file=sys.stderr)
+
+    levels = [int(n) for n in args.sessions.split(",")]
+    scenarios = tuple(args.scenario.split(",")) if args.scenario else tuple(SCENARIOS)
+    unknown = set(scenarios) - set(SCENARIOS)
+    if unknown:
+        parser.error(f"알 수 없는 시나리오: {', '.join(sorted(unknown))}")
+
+    settings = {"levels": levels, "duration_s": args.duration, "scenarios": list(scenarios), "think_s": args.think,
+                "ramp_s": args.ramp, "seed": args.seed}
+    results = run_load_test(levels, args.duration, scenarios, args.think, args.ramp, args.app, args.url, args.pid,
+                            warm_up=not args.no_warm_up, seed=args.seed, log=log)
+    report = {"environment": environment_info(), "settings": settings, "levels": results}
+
+    text = json.dumps(report, indent=2, ensure_ascii=False)
+    if args.output == "-":
+        print(text)
+    else:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+
+
+if __name__ == "__main__":
+    main()
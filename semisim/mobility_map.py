@@ -0,0 +1,153 @@
+"""
+도핑·온도 설계 공간 전체의 이동도 지도.
+
+calculate_mobility_sic를 (N_D, T) 평면 또는 (N_A, N_D) 평면의 격자(축당 최대 수천 점)에서 계산한다.
+격자는 행(y축) 청크 단위로 계산하므로 최대 메모리는 청크 크기로 제한되며, 화면에 표시할 해상도를 주면
+각 청크를 계산하는 즉시 블록 평균으로 줄이기 때문에 전체 해상도 배열을 만들지 않는다. 최솟값/최댓값은
+줄이기 전의 전체 해상도 값에서 구한다.
+
+float32로 계산하면 메모리와 시간이 약 절반이 된다 (이동도의 상대 오차 ~1e-7, 표시용으로 충분하다).
+
+    >>> m = mobility_map("N_D-T", (1e13, 1e20), (100, 500), shape=(2000, 2000), fixed=1e16, display_shape=(400, 400))
+    >>> m.values.shape, m.minimum, m.maximum
+
+NumPy만 사용한다.
+"""
+from collections import namedtuple
+
+import numpy as np
+
+from semisim.mosfet import calculate_mobility_sic, effective_mobility
+
+# 평면 이름 -> (x축 변수, y축 변수, 고정 변수, (x축 로그 여부, y축 로그 여부))
+PLANES = {
+    "N_D-T": ("N_D", "T", "N_A", (True, False)),
+    "N_A-N_D": ("N_A", "N_D", "T", (True, True)),
+}
+QUANTITIES = ("mu_eff", "mu_e", "mu_h")
+
+# 청크 하나의 기본 최대 크기 (바이트, 중간 배열 포함)
+DEFAULT_CHUNK_BYTES = 32 * 2**20
+# 청크 계산에 필요한 격자 한 칸당 중간 배열 수 (calculate_mobility_sic + effective_mobility)
+_TEMPORARIES = 8
+
+MobilityMap = namedtuple("MobilityMap", ["x_edges", "y_edges", "values", "minimum", "maximum", "shape"])
+
+
+def axis_values(value_range, n, log):
+    """축의 격자 값 (log이면 로그 균등, 아니면 선형 균등)."""
+    low, high = value_range
+    return np.logspace(np.log10(low), np.log10(high), n) if log else np.linspace(low, high, n)
+
+
+def block_starts(n, blocks):
+    """
+    길이 n인 축을 최대 blocks개의 같은 크기 블록(마지막 블록은 더 짧을 수 있다)으로 나눈다.
+
+    Returns:
+    - (블록 시작 인덱스 배열 (np.add.reduceat에 쓸 수 있다), 블록 크기)
+    """
+    factor = -(-n // blocks)
+    return np.arange(0, n, factor), factor
+
+
+def _evaluate(plane, x, y, fixed, quantity):
+    # 행: y, 열: x. 브로드캐스트되므로 거듭제곱은 축 길이만큼만 계산된다
+    if plane == "N_D-T":
+        mu_e, mu_h = calculate_mobility_sic(x[None, :], fixed, y[:, None])
+    else:
+        mu_e, mu_h = calculate_mobility_sic(y[:, None], x[None, :], fixed)
+    if quantity == "mu_e":
+        return mu_e
+    if quantity == "mu_h":
+        return mu_h
+    return effective_mobility(mu_e, mu_h)
+
+
+def mobility_map(plane, x_range, y_range, shape=(1000, 1000), fixed=1e16, quantity="mu_eff", dtype=np.float64,
+                 display_shape=None, chunk_bytes=DEFAULT_CHUNK_BYTES):
+    """
+    이동도 지도를 계산한다.
+
+    Parameters:
+    - plane: "N_D-T" (x: N_D, y: T, 고정: N_A) 또는 "N_A-N_D" (x: N_A, y: N_D, 고정: T)
+    - x_range, y_range: 축 범위 (농도 cm^-3는 로그 균등, 온도 K는 선형 균등 격자)
+    - shape: (x 점 수, y 점 수)
+    - fixed: 고정 변수의 값 (N_A cm^-3 또는 T K)
+    - quantity: "mu_eff", "mu_e", "mu_h"
+    - dtype: 계산과 결과의 부동소수점 형식 (np.float64 또는 np.float32)
+    - display_shape: (x 칸 수, y 칸 수). 주면 각 칸이 전체 격자의 블록 평균인 줄인 지도를 돌려준다.
+    - chunk_bytes: 한 번에 계산할 청크의 최대 크기 (바이트). 최대 메모리를 제한한다.
+
+    Returns:
+    - MobilityMap(x_edges, y_edges 칸 경계 (길이 칸 수 + 1), values (행: y, 열: x) cm^2/V·s,
+      minimum, maximum 전체 해상도 값의 최솟값/최댓값, shape 계산한 전체 격자의 (x 점 수, y 점 수))
+    """
+    if plane not in PLANES:
+        raise ValueError(f"unknown plane: {plane!r} (expected one of {sorted(PLANES)})")
+    if quantity not in QUANTITIES:
+        raise ValueError(f"unknown quantity: {quantity!r} (expected one of {QUANTITIES})")
+    dtype = np.dtype(dtype)
+    nx, ny = shape
+    x_log, y_log = PLANES[plane][3]
+    x = axis_values(x_range, nx, x_log).astype(dtype)
+    y = axis_values(y_range, ny, y_log).astype(dtype)
+    fixed = dtype.type(fixed)
+
+    if display_shape is None:
+        x_starts, fx = np.arange(nx), 1
+        y_starts, fy = np.arange(ny), 1
+    else:
+        x_starts, fx = block_starts(nx, display_shape[0])
+        y_starts, fy = block_starts(ny, display_shape[1])
+    x_counts = np.diff(np.append(x_starts, nx))
+
+    # 청크 행 수는 y 블록 크기의 배수로 맞춰 블록이 청크 경계에 걸치지 않게 한다
+    rows = max(1, chunk_bytes // (nx * dtype.itemsize * _TEMPORARIES))
+    rows = max(fy, rows // fy * fy)
+
+    values = np.empty((len(y_starts), len(x_starts)), dtype=dtype)
+    minimum, maximum = np.inf, -np.inf
+    for start in range(0, ny, rows):
+        chunk = _evaluate(plane, x, y[start:start + rows], fixed, quantity).astype(dtype, copy=False)
+        minimum = min(minimum, float(chunk.min()))
+        maximum = max(maximum, float(chunk.max()))
+        first = start // fy
+        if fx == 1 and fy == 1:
+            values[first:first + chunk.shape[0]] = chunk
+            continue
+        # 블록 합을 구한 뒤 블록의 원소 수로 나눈다 (마지막 블록은 작을 수 있다)
+        row_starts = np.arange(0, chunk.shape[0], fy)
+        sums = np.add.reduceat(np.add.reduceat(chunk, x_starts, axis=1), row_starts, axis=0)
+        row_counts = np.diff(np.append(row_starts, chunk.shape[0]))
+        values[first:first + len(row_starts)] = sums / (row_counts[:, None] * x_counts[None, :])
+
+    return MobilityMap(_edges(x, x_starts, x_log), _edges(y, y_starts, y_log), values, minimum, maximum, (nx, ny))
+
+
+def _edges(axis, starts, log):
+    # 칸 경계: 블록 시작 점들의 가운데 (첫/마지막 경계는 축 끝에서 반 칸 바깥)
+    axis = np.asarray(axis, dtype=float)
+    if starts.size == axis.size:
+        centers = np.log10(axis) if log else axis
+    else:
+        ends = np.append(starts[1:], axis.size) - 1
+        centers = ((np.log10(axis[starts]) + np.log10(axis[ends])) / 2 if log else (axis[starts] + axis[ends]) / 2)
+    if centers.size == 1:
+        edges = np.array([centers[0] - 0.5, centers[0] + 0.5])
+    else:
+        middle = (centers[1:] + centers[:-1]) / 2
+        edges = np.concatenate([[2 * centers[0] - middle[0]], middle, [2 * centers[-1] - middle[-1]]])
+    return 10 ** edges if log else edges
+
+
+def downsample(mobility, display_shape):
+    """이미 계산한 MobilityMap을 더 작은 (x 칸 수, y 칸 수)로 블록 평균한다 (예: 브라우저 차트용)."""
+    ny, nx = mobility.values.shape
+    x_starts, _ = block_starts(nx, display_shape[0])
+    y_starts, _ = block_starts(ny, display_shape[1])
+    sums = np.add.reduceat(np.add.reduceat(mobility.values, x_starts, axis=1), y_starts, axis=0)
+    counts = np.diff(np.append(y_starts, ny))[:, None] * np.diff(np.append(x_starts, nx))[None, :]
+    x_edges = mobility.x_edges[np.append(x_starts, nx)]
+    y_edges = mobility.y_edges[np.append(y_starts, ny)]
+    return mobility._replace(x_edges=x_edges, y_edges=y_edges, values=(sums / counts).astype(mobility.values.dtype))
@@ -0,0 +1,152 @@
+"""
+MOSFET 소자 모델 (SiC 이동도 모델 및 드레인 전류).
+
+NumPy만 사용하며 Streamlit/matplotlib 없이 import 할 수 있다.
+"""
+import numpy as np
+
+COX = 2.3e-8  # 산화막 캐패시턴스 기본값 (F/cm^2)
+VTH = 1.0  # 임계 전압 기본값 (V)
+
+
+# 이동도 계산 함수
+def calculate_mobility_sic(N_D, N_A, T, mu_1_e=950, mu_0_e=950, mu_1_h=120, mu_0_h=120,
+                           N_ref=1e17, alpha_e=2.5, alpha_h=2.1, gamma=1.5):
+    """
+    SiC의 전자 및 정공 이동도 계산 함수.
+
+    Parameters:
+    - N_D: n형 도핑 농도 (cm^-3)
+    - N_A: p형 도핑 농도 (cm^-3)
+    - T: 온도 (K)
+    - mu_1_e: 전자 격자 이동도 상수 (cm^2/V·s)
+    - mu_0_e: 전자 최대 이동도 (cm^2/V·s)
+    - mu_1_h: 정공 격자 이동도 상수 (cm^2/V·s)
+    - mu_0_h: 정공 최대 이동도 (cm^2/V·s)
+    - N_ref: 불순물 산란 기준 농도 (cm^-3)
+    - alpha_e: 전자 격자 산란 온도 계수
+    - alpha_h: 정공 격자 산란 온도 계수
+    - gamma: 불순물 산란 계수
+
+    Returns:
+    - 전자 이동도 (μ_e)와 정공 이동도 (μ_h)
+    """
+    N_total = N_D + N_A  # 총 도핑 농도
+
+    # 격자 산란과 불순물 산란 이동도를 Matthiessen 규칙으로 합친다
+    mu_lattice_e, mu_lattice_h = lattice_mobility_sic(T, mu_1_e, mu_1_h, alpha_e, alpha_h)
+    mu_impurity_e, mu_impurity_h = impurity_mobility_sic(N_total, mu_0_e, mu_0_h, N_ref, gamma)
+
+    # 전자 이동도 계산
+    mu_e = 1 / (1 / mu_lattice_e + 1 / mu_impurity_e)
+
+    # 정공 이동도 계산
+    mu_h = 1 / (1 / mu_lattice_h + 1 / mu_impurity_h)
+
+    return mu_e, mu_h
+
+
+def lattice_mobility_sic(T, mu_1_e=950, mu_1_h=120, alpha_e=2.5, alpha_h=2.1):
+    """격자 산란에 의한 전자/정공 이동도 (calculate_mobility_sic의 온도 의존 항)."""
+    mu_lattice_e = mu_1_e * (T / 300) ** (-alpha_e)
+    mu_lattice_h = mu_1_h * (T / 300) ** (-alpha_h)
+    return mu_lattice_e, mu_lattice_h
+
+
+def impurity_mobility_sic(N_total, mu_0_e=950, mu_0_h=120, N_ref=1e17, gamma=1.5):
+    """불순물 산란에 의한 전자/정공 이동도 (calculate_mobility_sic의 도핑 의존 항)."""
+    scattering = 1 + (N_total / N_ref) ** gamma
+    mu_impurity_e = mu_0_e / scattering
+    mu_impurity_h = mu_0_h / scattering
+    return mu_impurity_e, mu_impurity_h
+
+
+# 효과적인 이동도 계산 함수 (전자의 이동도와 정공의 이동도를 이용)
+def effective_mobility(mu_e, mu_h):
+    """
+    전자 이동도(mu_e)와 정공 이동도(mu_h)를 입력받아,
+    효과적인 이동도(mu_eff)를 계산하는 함수.
+    """
+    mu_eff = (mu_e * mu_h) / (mu_e + mu_h)
+    return mu_eff
+
+
+def _gain_factor(W, L, N_D, N_A, T, mu_eff, Cox):
+    """이득 계수 k = μ_eff · Cox · W / L (A/V^2)."""
+    W_cm = np.asarray(W, dtype=float) * 1e-4  # µm to cm
+    L_cm = np.asarray(L, dtype=float) * 1e-4  # µm to cm
+    N_D = np.asarray(N_D, dtype=float)
+    N_A = np.asarray(N_A, dtype=float)
+
+    if mu_eff is None:
+        mu_e, mu_h = calculate_mobility_sic(N_D, N_A, T)
+        mu_eff = effective_mobility(mu_e, mu_h)
+    mu_eff = mu_eff * (N_D / N_A)  # 이동도에 농도 영향을 반영
+    return mu_eff * Cox * (W_cm / L_cm)
+
+
+# 드레인 전류 계산 함수
+# 모든 인자는 NumPy 브로드캐스팅 규칙을 따르므로 스칼라 한 점부터 (Vgs, Vds) 격자 전체까지 한 번에 계산한다.
+# 차단/선형/포화 영역은 분기 대신 마스크로 선택한다.
+def calculate_id(Vgs, Vds, W, L, N_D, N_A, T=300, mu_eff=None, Vth=VTH, Cox=COX):
+    """
+    드레인 전류 Id (A)를 계산하는 함수.
+
+    Parameters:
+    - Vgs: 게이트-소스 전압 (V)
+    - Vds: 드레인-소스 전압 (V)
+    - W: 채널 폭 (µm)
+    - L: 채널 길이 (µm)
+    - N_D: n형 도핑 농도 (cm^-3)
+    - N_A: p형 도핑 농도 (cm^-3)
+    - T: 온도 (K)
+    - mu_eff: 미리 계산한 효과적인 이동도 (cm^2/V·s). None이면 N_D, N_A, T로부터 계산한다.
+    - Vth: 임계 전압 (V)
+    - Cox: 산화막 캐패시턴스 (F/cm^2)
+    """
+    Vgs = np.asarray(Vgs, dtype=float)
+    Vds = np.asarray(Vds, dtype=float)
+    k = _gain_factor(W, L, N_D, N_A, T, mu_eff, Cox)
+
+    V_ov = Vgs - Vth
+    Id_linear = k * (V_ov * Vds - (Vds ** 2) / 2)
+    Id_sat = 0.5 * k * V_ov ** 2
+    Id = np.where(Vds < V_ov, Id_linear, Id_sat)
+    return np.where(V_ov < 0, 0.0, Id)
+
+
+def calculate_id_derivatives(Vgs, Vds, W, L, N_D, N_A, T=300, mu_eff=None, Vth=VTH, Cox=COX):
+    """
+    드레인 전류와 그 해석적 편미분을 계산하는 함수 (회로 동작점의 Newton 풀이용).
+
+    Parameters: calculate_id와 같다.
+
+    Returns:
+    - Id (A), gm = ∂Id/∂Vgs (A/V), gds = ∂Id/∂Vds (A/V)
+    """
+    Vgs = np.asarray(Vgs, dtype=float)
+    Vds = np.asarray(Vds, dtype=float)
+    k = _gain_factor(W, L, N_D, N_A, T, mu_eff, Cox)
+
+    V_ov = Vgs - Vth
+    linear = Vds < V_ov
+    off = V_ov < 0
+    Id = np.where(linear, k * (V_ov * Vds - (Vds ** 2) / 2), 0.5 * k * V_ov ** 2)
+    gm = np.where(linear, k * Vds, k * V_ov)
+    gds = np.where(linear, k * (V_ov - Vds), 0.0)
+    return np.where(off, 0.0, Id), np.where(off, 0.0, gm), np.where(off, 0.0, gds)
+
+
+# 출력/전달 특성 곡선군 계산 함수
+def calculate_iv_family(Vgs_values, Vds_values, W, L, N_D, N_A, T=300):
+    """
+    Vgs 값들과 Vds 값들의 모든 조합에 대한 드레인 전류를 한 번의 호출로 계산하는 함수.
+
+    Returns:
+    - 출력 특성 (len(Vgs_values), len(Vds_values)) 배열: 각 행이 하나의 Vgs에 대한 Id-Vds 곡선
+    - 전달 특성 (len(Vds_values), len(Vgs_values)) 배열: 각 행이 하나의 Vds에 대한 Id-Vgs 곡선
+    """
+    Vgs_values = np.asarray(Vgs_values, dtype=float)
+    Vds_values = np.asarray(Vds_values, dtype=float)
+    output = calculate_id(Vgs_values[:, None], Vds_values[None, :], W, L, N_D, N_A, T)
+    return output, output.T
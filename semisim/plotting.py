@@ -0,0 +1,228 @@
+"""
+소자 특성 곡선의 matplotlib 그래프 생성 함수.
+
+matplotlib은 이 모듈을 처음 사용할 때만 import 된다 (semisim 패키지는 이 모듈을 지연 로딩한다).
+
+그림은 pyplot을 거치지 않고 matplotlib.figure.Figure로 직접 만든다. pyplot의 전역 그림 레지스트리에
+등록되지 않으므로 참조가 없어지면 메모리가 회수되고, 여러 세션의 스레드가 pyplot 전역 상태를 공유하지 않는다.
+더 이상 쓰지 않는 그림은 close_figure()로 즉시 정리할 수 있으며, figure_stats()로 살아 있는 그림 수와
+프로세스 메모리를 확인할 수 있다.
+"""
+import os
+import sys
+import weakref
+from collections import namedtuple
+
+import numpy as np
+from matplotlib.figure import Figure
+
+FigureStats = namedtuple("FigureStats", ["live", "pyplot_open", "rss_bytes"])
+
+# 이 모듈이 만든 그림 중 아직 회수되지 않은 것
+_live_figures = weakref.WeakSet()
+
+
+def new_figure():
+    """pyplot 레지스트리에 등록되지 않는 그림과 축을 만든다."""
+    fig = Figure()
+    ax = fig.subplots()
+    _live_figures.add(fig)
+    return fig, ax
+
+
+def close_figure(fig):
+    """그림의 축과 아티스트를 정리하고, pyplot으로 만든 그림이면 레지스트리에서도 제거한다."""
+    fig.clear()
+    if "matplotlib.pyplot" in sys.modules:
+        sys.modules["matplotlib.pyplot"].close(fig)
+
+
+def figure_stats():
+    """살아 있는 그림 수, pyplot에 열려 있는 그림 수, 프로세스 상주 메모리(바이트, 알 수 없으면 None)."""
+    pyplot = sys.modules.get("matplotlib.pyplot")
+    pyplot_open = len(pyplot.get_fignums()) if pyplot is not None else 0
+    return FigureStats(len(_live_figures), pyplot_open, _rss_bytes())
+
+
+def _rss_bytes():
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        pass
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+    # /proc가 없는 플랫폼에서는 최대 상주 메모리로 대신한다 (macOS는 바이트, 그 외는 KiB 단위)
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def plot_mosfet_output(Vds_values, Id_values, Vgs, W, L):
+    """MOSFET 출력 특성 (Id-Vds) 그래프를 생성한다."""
+    fig, ax = new_figure()
+    ax.plot(Vds_values, Id_values, label=f"Vgs = {Vgs} V, W = {W:.1f} µm, L = {L:.1f} µm")
+    ax.set_xlabel("Drain-Source Voltage (Vds) [V]")
+    ax.set_ylabel("Drain Current (Id) [A]")
+    ax.set_title("MOSFET Output Characteristics")
+    ax.grid(True, which='both', linestyle='--', linewidth=0.5)
+    ax.legend()
+    return fig
+
+
+def plot_bjt_input(V_BE_values, V_CB_values, I_E_curves):
+    """BJT 입력 특성 (V_BE-I_E) 그래프를 생성한다. I_E_curves의 각 행은 V_CB_values의 한 값에 대응한다."""
+    fig, ax = new_figure()
+    for V_CB, I_E_values in zip(V_CB_values, I_E_curves):
+        ax.plot(V_BE_values, I_E_values * 1e3, label=f"V_CB = {V_CB:.1f} V")
+    ax.set_xlabel("V_BE (V)")
+    ax.set_ylabel("I_E (mA)")
+    ax.set_title("V_BE - I_E Curve")
+    ax.legend()
+    ax.grid()
+    return fig
+
+
+def plot_bjt_output(V_CB_values, I_E_values, I_C_curves):
+    """BJT 출력 특성 (V_CB-I_C) 그래프를 생성한다. I_C_curves의 각 행은 I_E_values의 한 값에 대응한다."""
+    fig, ax = new_figure()
+    for I_E, I_C_values in zip(I_E_values, I_C_curves):
+        ax.plot(V_CB_values, I_C_values * 1e3, label=f"I_E = {I_E * 1e3:.1f} mA")
+    ax.set_xlabel("V_CB (V)")
+    ax.set_ylabel("I_C (mA)")
+    ax.set_title("V_CB - I_C Curve")
+    ax.legend()
+    ax.grid()
+    return fig
+
+
+def plot_log_contour(x_values, y_values, surface, xlabel, ylabel, title, colorbar_label, levels=30):
+    """
+    SignedLog 표면의 log10 |값| 등고선 지도를 생성한다. surface의 행은 y_values, 열은 x_values에 대응한다.
+    부호가 바뀌는 경계(값 = 0)는 흰 점선으로 표시한다.
+    """
+    fig, ax = new_figure()
+    z = surface.log10_abs()
+    finite = np.isfinite(z)
+    if finite.any():
+        # 값이 0인 점(-inf)은 가장 작은 유한 값으로 채운다
+        z = np.where(finite, z, z[finite].min())
+    filled = ax.contourf(x_values, y_values, z, levels=levels, cmap="viridis")
+    fig.colorbar(filled, ax=ax, label=colorbar_label)
+    if (surface.sign > 0).any() and (surface.sign < 0).any():
+        ax.contour(x_values, y_values, surface.sign, levels=[0], colors="white", linestyles="--", linewidths=1)
+    ax.set_xlabel(xlabel)
+    ax.set_ylabel(ylabel)
+    ax.set_title(title)
+    return fig
+
+
+def plot_curves(x_values, curves, labels, xlabel, ylabel, title, point=None):
+    """
+    x 값을 공유하는 여러 곡선을 한 그래프에 그린다 (부하선, 바이어스 스윕 등).
+
+    Parameters:
+    - curves: 곡선별 y 값 (각 행이 labels의 한 항목에 대응)
+    - point: (x, y, label). 주어지면 동작점을 점으로 표시한다.
+    """
+    fig, ax = new_figure()
+    for label, y_values in zip(labels, curves):
+        ax.plot(x_values, y_values, label=label)
+    if point is not None:
+        ax.plot([point[0]], [point[1]], "o", color="black", label=point[2])
+    ax.set_xlabel(xlabel)
+    ax.set_ylabel(ylabel)
+    ax.set_title(title)
+    ax.legend()
+    ax.grid(True, linestyle='--', linewidth=0.5)
+    return fig
+
+
+def plot_doping_profile(depth_um, curves, labels, N_A, junction_depth_um=None, floor=1e12):
+    """
+    깊이에 따른 도펀트 농도 분포를 로그 눈금으로 그린다. 기판 농도 N_A와 접합 깊이를 점선으로 표시한다.
+
+    Parameters:
+    - depth_um: 깊이 (µm)
+    - curves: 곡선별 농도 (cm^-3, 각 행이 labels의 한 항목에 대응)
+    - floor: 표시할 최소 농도 (cm^-3)
+    """
+    fig, ax = new_figure()
+    for label, concentration in zip(labels, curves):
+        ax.semilogy(depth_um, np.maximum(concentration, floor), label=label)
+    ax.axhline(N_A, color="gray", linestyle=":", label=f"N_A = {N_A:.1e}")
+    if junction_depth_um is not None and np.isfinite(junction_depth_um):
+        ax.axvline(junction_depth_um, color="black", linestyle="--", linewidth=1, label=f"x_j = {junction_depth_um:.3f} µm")
+    ax.set_ylim(bottom=floor)
+    ax.set_xlabel("Depth (µm)")
+    ax.set_ylabel("Concentration (cm^-3)")
+    ax.set_title("Implant / Drive-in Profile")
+    ax.legend()
+    ax.grid(True, which='both', linestyle='--', linewidth=0.5)
+    return fig
+
+
+def plot_doping_section(x_um, depth_um, concentration, N_A, window_um=None, floor=1e12):
+    """
+    2차원 단면의 도펀트 농도를 log10 등고선 지도로 그린다. 금속학적 접합(N_D = N_A)은 흰 실선으로 표시한다.
+    concentration의 행은 depth_um, 열은 x_um에 대응하며 깊이가 아래로 커지도록 y축을 뒤집는다.
+    """
+    fig, ax = new_figure()
+    z = np.log10(np.maximum(concentration, floor))
+    filled = ax.contourf(x_um, depth_um, z, levels=30, cmap="viridis")
+    fig.colorbar(filled, ax=ax, label="log10 N_D (cm^-3)")
+    if concentration.max() > N_A:
+        ax.contour(x_um, depth_um, concentration, levels=[N_A], colors="white", linewidths=1.5)
+    if window_um is not None:
+        ax.plot(window_um, [0, 0], color="red", linewidth=4, solid_capstyle="butt", label="implant window")
+        ax.legend(loc="lower right")
+    ax.invert_yaxis()
+    ax.set_xlabel("x (µm)")
+    ax.set_ylabel("Depth (µm)")
+    ax.set_title("Doping Cross-Section")
+    return fig
+
+
+def plot_heatmap(x_edges, y_edges, values, xlabel, ylabel, title, colorbar_label, log_x=False, log_y=False, point=None):
+    """
+    칸 경계 x_edges, y_edges로 정해지는 격자 값의 색 지도를 그린다. values의 행은 y, 열은 x에 대응한다.
+    point = (x, y)를 주면 현재 설계점을 표시한다.
+    """
+    fig, ax = new_figure()
+    mesh = ax.pcolormesh(x_edges, y_edges, values, cmap="viridis", shading="flat")
+    fig.colorbar(mesh, ax=ax, label=colorbar_label)
+    if point is not None:
+        ax.plot([point[0]], [point[1]], marker="x", color="red", markersize=10, markeredgewidth=2)
+    if log_x:
+        ax.set_xscale("log")
+    if log_y:
+        ax.set_yscale("log")
+    ax.set_xlabel(xlabel)
+    ax.set_ylabel(ylabel)
+    ax.set_title(title)
+    return fig
+
+
+def plot_wafer_map(x_edges, y_edges, values, failed, radius, zone_radii, title, colorbar_label):
+    """
+    웨이퍼 지도를 그린다. values와 failed의 행은 y, 열은 x에 대응하며 다이가 없는 칸은 NaN이다.
+    불합격 다이(failed)는 빨간색으로 덮어 표시하고, 사용 영역 경계(radius)와 구역 경계(zone_radii)를 점선 원으로 그린다.
+    """
+    fig, ax = new_figure()
+    # 다이 격자는 균일하므로 (수십만 칸의) pcolormesh 대신 이미지로 그린다
+    extent = (x_edges[0], x_edges[-1], y_edges[0], y_edges[-1])
+    image = ax.imshow(np.ma.masked_invalid(values), cmap="viridis", origin="lower", extent=extent,
+                      interpolation="nearest")
+    fig.colorbar(image, ax=ax, label=colorbar_label)
+    overlay = np.ma.masked_where(~(np.asarray(failed) > 0), np.ones_like(values))
+    ax.imshow(overlay, cmap="autumn", alpha=0.6, vmin=0, vmax=1, origin="lower", extent=extent,
+              interpolation="nearest")
+    angle = np.linspace(0, 2 * np.pi, 361)
+    for r in (*zone_radii, radius):
+        ax.plot(r * np.cos(angle), r * np.sin(angle), color="white" if r < radius else "black",
+                linestyle="--", linewidth=0.8)
+    ax.set_xlabel("x (mm)")
+    ax.set_ylabel("y (mm)")
+    ax.set_title(title)
+    return fig
@@ -0,0 +1,230 @@
+"""
+MOSFET 제조 공정 단계의 선언적 정의.
+
+각 공정 단계는 3D 장면에 대한 층(layer) 추가/제거 연산의 목록이다. 층은 이름, 크기 (가로, 높이, 세로),
+색상, 중심 위치로 정의되는 직육면체이다. 어떤 단계의 장면은 0단계부터 그 단계까지의 연산을 차례로 적용한
+결과이다 (두 장면 사이의 전환에서 바뀐 층만 다시 그리는 일은 프런트엔드 컴포넌트가 한다).
+"""
+from collections import namedtuple
+
+Layer = namedtuple("Layer", ["name", "size", "color", "position"])
+
+# 색상
+WAFER = 0x87CEFA
+OXIDE = 0xA9A9A9
+GATE_OXIDE = 0x7F7F7F
+POLY = 0x0000FF
+PR = 0xFF0000
+MASK = 0x000000
+DOPED = 0x4682B4
+ILD = 0x8F8F8F
+METAL = 0x800080
+
+
+def add(name, size, color, position):
+    return ("add", Layer(name, tuple(size), color, tuple(position)))
+
+
+def remove(*names):
+    return [("remove", name) for name in names]
+
+
+# (설명, 연산 목록)
+STEPS = [
+    ("1. 웨이퍼(P-Silicon) 준비", [
+        add("wafer", (4, 1, 3), WAFER, (0, -0.5, 0)),
+    ]),
+    ("2. 산화막 형성", [
+        add("oxide", (4, 0.5, 3), OXIDE, (0, 0.25, 0)),
+    ]),
+    ("3. 포토레지스트(PR) 층 추가", [
+        add("pr", (4, 0.2, 3), PR, (0, 0.6, 0)),
+    ]),
+    ("4. 소스/드레인 마스크, 노광 공정", [
+        add("leftPart", (0.5, 0.2, 3), MASK, (-1.75, 1, 0)),
+        add("rightPart", (0.5, 0.2, 3), MASK, (1.75, 1, 0)),
+        add("topPart", (4, 0.2, 1.2), MASK, (0, 1, -0.9)),
+    ]),
+    ("5. 현상(develope)", [
+        *remove("pr", "leftPart", "rightPart", "topPart"),
+        add("leftPartp", (0.5, 0.2, 3), PR, (-1.75, 0.6, 0)),
+        add("rightPartp", (0.5, 0.2, 3), PR, (1.75, 0.6, 0)),
+        add("topPartp", (4, 0.2, 1.2), PR, (0, 0.6, -0.9)),
+    ]),
+    ("6. 식각(etching)을 통해 산화막 제거", [
+        *remove("oxide"),
+        add("leftParto", (0.5, 0.5, 3), OXIDE, (-1.75, 0.25, 0)),
+        add("rightParto", (0.5, 0.5, 3), OXIDE, (1.75, 0.25, 0)),
+        add("topParto", (4, 0.5, 1.2), OXIDE, (0, 0.25, -0.9)),
+    ]),
+    ("7. 애싱(ashing)을 통해 PR 제거", [
+        *remove("leftPartp", "rightPartp", "topPartp"),
+    ]),
+    ("8. Gate 산화막 형성", [
+        add("leftParto8", (0.5, 0.25, 3), GATE_OXIDE, (-1.75, 0.625, 0)),
+        add("rightParto8", (0.5, 0.25, 3), GATE_OXIDE, (1.75, 0.625, 0)),
+        add("topParto8", (4, 0.25, 1.2), GATE_OXIDE, (0, 0.625, -0.9)),
+        add("middleParto8", (3, 0.25, 1.8), GATE_OXIDE, (0, 0.125, 0.6)),
+    ]),
+    ("9. Poly-Si 형성", [
+        add("leftPartp9", (0.5, 0.25, 3), POLY, (-1.75, 0.875, 0)),
+        add("rightPartp9", (0.5, 0.25, 3), POLY, (1.75, 0.875, 0)),
+        add("topPartp9", (4, 0.25, 1.2), POLY, (0, 0.875, -0.9)),
+        add("middlePartp9", (3, 0.25, 1.8), POLY, (0, 0.375, 0.6)),
+    ]),
+    ("10. PR 도포", [
+        add("leftPartp10", (0.5, 0.1, 3), PR, (-1.75, 1.05, 0)),
+        add("rightPartp10", (0.5, 0.1, 3), PR, (1.75, 1.05, 0)),
+        add("topPartp10", (4, 0.1, 1.2), PR, (0, 1.05, -0.9)),
+        add("middlePartp10", (3, 0.1, 1.8), PR, (0, 0.55, 0.6)),
+    ]),
+    ("11. Mask 추가 후 노광 공정", [
+        add("mask11", (1, 0.2, 1.8), MASK, (0, 1.3, 0.6)),
+    ]),
+    ("12. 현상", [
+        *remove("mask11", "leftPartp10", "rightPartp10", "topPartp10", "middlePartp10"),
+        add("PR12", (1, 0.1, 1.8), PR, (0, 0.55, 0.6)),
+    ]),
+    ("13. 식각(etching)을 통해 산화막과 Poly-Si 제거", [
+        *remove("leftParto8", "rightParto8", "topParto8", "middleParto8"),
+        *remove("leftPartp9", "rightPartp9", "topPartp9", "middlePartp9"),
+        add("Si12", (1, 0.25, 1.8), GATE_OXIDE, (0, 0.125, 0.6)),
+        add("Poly12", (1, 0.25, 1.8), POLY, (0, 0.375, 0.6)),
+    ]),
+    ("14. 애싱(ashing)을 통해 PR 제거", [
+        *remove("PR12"),
+    ]),
+    ("15. 이온 주입후 확산", [
+        *remove("wafer"),
+        add("waferunder", (4, 0.5, 3), WAFER, (0, -0.75, 0)),
+        add("waferleft", (0.25, 0.5, 3), WAFER, (-1.875, -0.25, 0)),
+        add("waferright", (0.25, 0.5, 3), WAFER, (1.875, -0.25, 0)),
+        add("wafertop", (4, 0.5, 1), WAFER, (0, -0.25, -1)),
+        add("wafermiddle", (0.5, 0.5, 3), WAFER, (0, -0.25, 0)),
+        add("doppingNP", (1.5, 0.5, 2), DOPED, (-1, -0.25, 0.5)),
+        add("doppingN", (1.5, 0.5, 2), DOPED, (1, -0.25, 0.5)),
+    ]),
+    ("16. ILD(SiO2) 증착 후 CMP", [
+        add("ILDL", (1, 0.5, 1.8), ILD, (-1, 0.25, 0.6)),
+        add("ILDR", (1, 0.5, 1.8), ILD, (1, 0.25, 0.6)),
+        add("ILD", (4, 1, 3), ILD, (0, 1, 0)),
+    ]),
+    ("17. PR 도포", [
+        add("PR17", (4, 0.2, 3), PR, (0, 1.6, 0)),
+    ]),
+    ("18. Mask 추가 후 노광 공정", [
+        add("ML18", (0.6, 0.2, 3), MASK, (-1.7, 2, 0)),
+        add("MR18", (0.6, 0.2, 3), MASK, (1.7, 2, 0)),
+        add("MML18", (0.2, 0.2, 3), MASK, (-0.5, 2, 0)),
+        add("MMR18", (0.2, 0.2, 3), MASK, (0.5, 2, 0)),
+        add("MT18", (4, 0.2, 1.2), MASK, (0, 2, -0.9)),
+    ]),
+    ("19. 현상", [
+        *remove("ML18", "MR18", "MML18", "MMR18", "MT18", "PR17"),
+        add("ML19", (0.6, 0.2, 3), PR, (-1.7, 1.6, 0)),
+        add("MR19", (0.6, 0.2, 3), PR, (1.7, 1.6, 0)),
+        add("MML19", (0.2, 0.2, 3), PR, (-0.5, 1.6, 0)),
+        add("MMR19", (0.2, 0.2, 3), PR, (0.5, 1.6, 0)),
+        add("MT19", (4, 0.2, 1.2), PR, (0, 1.6, -0.9)),
+    ]),
+    ("20. 식각(etching)을 통해 ILD 제거", [
+        *remove("ILDL", "ILDR", "ILD"),
+        add("ILDL19", (0.6, 1, 3), ILD, (-1.7, 1, 0)),
+        add("ILDR19", (0.6, 1, 3), ILD, (1.7, 1, 0)),
+        add("ILDT19", (4, 1, 1.2), ILD, (0, 1, -0.9)),
+        add("ILDML19", (0.2, 1, 3), ILD, (-0.5, 1, 0)),
+        add("ILDMR19", (0.2, 1, 3), ILD, (0.5, 1, 0)),
+        add("ILDUL", (0.1, 0.5, 1.8), ILD, (-1.45, 0.25, 0.6)),
+        add("ILDUR", (0.1, 0.5, 1.8), ILD, (1.45, 0.25, 0.6)),
+        add("ILDUML", (0.1, 0.5, 1.8), ILD, (-0.55, 0.25, 0.6)),
+        add("ILDUMR", (0.1, 0.5, 1.8), ILD, (0.55, 0.25, 0.6)),
+    ]),
+    ("21. 애싱(ashing)을 통해 PR 제거", [
+        *remove("ML19", "MR19", "MML19", "MMR19", "MT19"),
+    ]),
+    ("22. Metal(Al) 증착 후 CMP", [
+        add("ML22", (0.8, 1.5, 1.8), METAL, (-1, 0.75, 0.6)),
+        add("MR22", (0.8, 1.5, 1.8), METAL, (1, 0.75, 0.6)),
+        add("MM22", (0.8, 1, 1.8), METAL, (0, 1, 0.6)),
+        add("M22", (4, 0.4, 3), METAL, (0, 1.7, 0)),
+    ]),
+    ("23. PR 도포", [
+        add("PR23", (4, 0.2, 3), PR, (0, 2, 0)),
+    ]),
+    ("24. Mask 추가 후 노광 공정", [
+        add("ML24", (0.3, 0.2, 3), MASK, (-1.85, 2.4, 0)),
+        add("MR24", (0.3, 0.2, 3), MASK, (1.85, 2.4, 0)),
+        add("MML24", (0.1, 0.2, 3), MASK, (-0.5, 2.4, 0)),
+        add("MMR24", (0.1, 0.2, 3), MASK, (0.5, 2.4, 0)),
+        add("MT24", (4, 0.2, 1.2), MASK, (0, 2.4, -0.9)),
+    ]),
+    ("25. 현상", [
+        *remove("ML24", "MR24", "MML24", "MMR24", "MT24", "PR23"),
+        add("PRL25", (1.15, 0.2, 1.8), PR, (-1.125, 2, 0.6)),
+        add("PRR25", (1.15, 0.2, 1.8), PR, (1.125, 2, 0.6)),
+        add("PRM25", (0.9, 0.2, 1.8), PR, (0, 2, 0.6)),
+    ]),
+    ("26. 식각(etching)을 통해 Metal 제거", [
+        *remove("M22"),
+        add("ML25", (1.15, 0.4, 1.8), METAL, (-1.125, 1.7, 0.6)),
+        add("MR25", (1.15, 0.4, 1.8), METAL, (1.125, 1.7, 0.6)),
+        add("MM25", (0.9, 0.4, 1.8), METAL, (0, 1.7, 0.6)),
+    ]),
+    ("27. 애싱(ashing)을 통해 PR 제거", [
+        *remove("PRL25", "PRR25", "PRM25"),
+    ]),
+]
+
+steps_description = [description for description, _ in STEPS]
+
+# "15. 이온 주입후 확산" 단계의 번호 (0부터 시작)
+IMPLANT_STEP = 14
+
+
+def _build_scenes():
+    scenes = []
+    layers = {}  # 이름 -> Layer (추가된 순서 유지)
+    for _, ops in STEPS:
+        for op, arg in ops:
+            if op == "add":
+                layers[arg.name] = arg
+            else:
+                del layers[arg]
+        scenes.append(tuple(layers.values()))
+    return scenes
+
+
+# 각 단계가 끝난 뒤의 장면 (모듈을 불러올 때 한 번만 계산)
+_SCENES = _build_scenes()
+
+
+# 이온 주입으로 도핑되는 층 (15단계). 장면에서 y = -0.5 ~ 0 구간을 차지하며, 이 0.5 단위를 1 µm로 본다.
+DOPED_LAYERS = ("doppingNP", "doppingN")
+DOPED_SLAB_DEPTH_UM = 1.0
+
+
+def _with_doped_depth(layers, depth_um):
+    # 도핑 층의 깊이를 접합 깊이에 맞추고, 그 아래 빈 곳은 기판으로 채운다
+    fraction = round(min(max(depth_um / DOPED_SLAB_DEPTH_UM, 0.02), 1.0), 2)
+    result = []
+    for layer in layers:
+        if layer.name not in DOPED_LAYERS:
+            result.append(layer)
+            continue
+        width, height, length = layer.size
+        x, _, z = layer.position
+        result.append(layer._replace(size=(width, height * fraction, length), position=(x, -height * fraction / 2, z)))
+        if fraction < 1.0:
+            filler = height * (1 - fraction)
+            result.append(Layer(layer.name + "Under", (width, filler, length), WAFER, (x, -height + filler / 2, z)))
+    return tuple(result)
+
+
+def scene_at(step, doped_depth=None):
+    """
+    step 단계(0부터 시작)까지 진행한 뒤 장면에 있는 층 목록.
+    doped_depth (µm)를 주면 도핑 층의 깊이를 그 값(예: 확산 계산의 접합 깊이)에 맞춘다.
+    """
+    if doped_depth is None:
+        return _SCENES[step]
+    return _with_doped_depth(_SCENES[step], doped_depth)
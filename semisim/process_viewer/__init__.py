@@ -0,0 +1,36 @@
+"""
+MOSFET 공정 3D 뷰어 (Streamlit 컴포넌트).
+
+뷰어 iframe은 페이지에 처음 나타날 때 한 번만 로드되어 three.js와 WebGL 렌더러를 유지한다.
+단계가 바뀌면 Streamlit이 새 인자(해당 단계의 층 목록)를 같은 iframe에 메시지로 보내고,
+뷰어는 현재 장면과의 차이만 추가/제거한다.
+
+three.js와 OrbitControls는 frontend/vendor/ 에 포함되어 있어 외부 CDN 없이 동작한다. vendor/ 아래 경로는
+라이브러리 버전을 포함하므로(예: vendor/three-r129dev/) 버전을 바꾸면 URL도 바뀐다. 따라서 Streamlit이 정적 파일에
+붙이는 기본 캐시 헤더(Cache-Control: public, ETag)로 브라우저가 캐시한 파일을 그대로 재사용할 수 있다.
+
+이 모듈은 Streamlit을 import 하므로 UI에서만 사용한다.
+"""
+import os
+
+import streamlit.components.v1 as components
+
+from semisim.process_flow import scene_at
+
+_FRONTEND_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "frontend")
+_component = components.declare_component("process_viewer", path=_FRONTEND_DIR)
+
+
+def process_viewer(step, on_demand=True, key="process_viewer", doped_depth=None):
+    """
+    step 단계(0부터 시작)의 공정 장면을 표시한다.
+
+    Parameters:
+    - step: 공정 단계 번호 (0부터 시작)
+    - on_demand: True이면 카메라 조작, 조작 후 감쇠, 단계 변경 때에만 다시 그린다.
+      False이면 매 프레임 그린다. 어느 쪽이든 iframe이 보이지 않을 때는 그리지 않는다.
+    - key: Streamlit 위젯 키
+    - doped_depth: 도핑 층의 깊이 (µm, 예: 확산 계산의 접합 깊이). None이면 기본 장면을 그대로 쓴다.
+    """
+    layers = [layer._asdict() for layer in scene_at(step, doped_depth)]
+    _component(layers=layers, step=step, on_demand=on_demand, key=key, default=None)
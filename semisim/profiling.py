@@ -0,0 +1,134 @@
+"""
+스크립트 재실행 단위의 구간별 시간 측정.
+
+Profiler는 한 번의 재실행(run) 동안 이름 붙은 구간(이동도 계산, I-V 생성, 그림 생성, 컴포넌트 출력 등)의
+시간을 모으고, 페이지별로 최근 실행 기록을 보관해 구간별 백분위수를 계산한다. 기록은 CSV로 내보낼 수 있다.
+
+    >>> profiler = Profiler()
+    >>> profiler.begin_run("MOSFET_3D")
+    >>> with profiler.timer("mosfet.iv"):
+    ...     ...
+    >>> profiler.end_run()
+    >>> profiler.percentiles("MOSFET_3D")
+
+측정을 끈 경우에는 null_timer를 대신 넘겨 호출 코드를 바꾸지 않고도 비용 없이 건너뛸 수 있다.
+"""
+import contextlib
+import csv
+import io
+import time
+from collections import OrderedDict, deque, namedtuple
+
+import numpy as np
+
+RunRecord = namedtuple("RunRecord", ["run_id", "timestamp", "page", "timings"])
+
+# 전체 재실행 시간을 기록하는 구간 이름
+TOTAL = "total"
+
+
+@contextlib.contextmanager
+def _null_context():
+    yield
+
+
+def null_timer(name):
+    """측정하지 않는 타이머 (Profiler.timer와 같은 방식으로 호출한다)."""
+    return _null_context()
+
+
+class Profiler:
+    """
+    재실행별 구간 시간 기록기.
+
+    Parameters:
+    - window: 페이지마다 보관할 최근 실행 수 (백분위수 계산 범위)
+    """
+
+    def __init__(self, window=200):
+        self.window = window
+        self._runs = {}  # 페이지 -> deque[RunRecord]
+        self._next_id = 0
+        self._page = None
+        self._start = None
+        self._timings = None
+
+    def begin_run(self, page):
+        """새 재실행 측정을 시작한다. 끝나지 않은 이전 측정은 버린다."""
+        self._page = page
+        self._timings = OrderedDict()
+        self._start = time.perf_counter()
+
+    def end_run(self):
+        """현재 재실행 측정을 끝내고 기록한다. 측정 중이 아니면 None을 돌려준다."""
+        if self._timings is None:
+            return None
+        self._timings[TOTAL] = time.perf_counter() - self._start
+        record = RunRecord(self._next_id, time.time(), self._page, self._timings)
+        self._next_id += 1
+        runs = self._runs.setdefault(self._page, deque(maxlen=self.window))
+        runs.append(record)
+        self._timings = None
+        return record
+
+    @contextlib.contextmanager
+    def timer(self, name):
+        """with 블록의 실행 시간을 name 구간에 더한다 (같은 실행에서 여러 번 측정하면 합산)."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            if self._timings is not None:
+                self._timings[name] = self._timings.get(name, 0.0) + time.perf_counter() - start
+
+    @property
+    def pages(self):
+        return list(self._runs)
+
+    def last_run(self, page=None):
+        """가장 최근 기록 (page를 주면 그 페이지의 최근 기록). 기록이 없으면 None."""
+        if page is not None:
+            runs = self._runs.get(page)
+            return runs[-1] if runs else None
+        records = [runs[-1] for runs in self._runs.values() if runs]
+        return max(records, key=lambda r: r.run_id, default=None)
+
+    def runs(self, page=None):
+        """보관 중인 기록 목록 (실행 순서)."""
+        if page is not None:
+            return list(self._runs.get(page, ()))
+        return sorted((r for runs in self._runs.values() for r in runs), key=lambda r: r.run_id)
+
+    def percentiles(self, page, q=(50, 90, 99)):
+        """
+        page의 최근 실행들에 대한 구간별 시간 백분위수.
+
+        Returns:
+        - 구간 이름 -> {"count": 측정된 실행 수, "p50": 초, ...}. 구간은 처음 나타난 순서, total은 마지막.
+        """
+        samples = OrderedDict()
+        for record in self._runs.get(page, ()):
+            for name, seconds in record.timings.items():
+                samples.setdefault(name, []).append(seconds)
+        if TOTAL in samples:
+            samples.move_to_end(TOTAL)
+        stats = OrderedDict()
+        for name, values in samples.items():
+            row = {"count": len(values)}
+            for p, value in zip(q, np.percentile(values, q)):
+                row[f"p{p}"] = float(value)
+            stats[name] = row
+        return stats
+
+    def to_csv(self):
+        """모든 기록을 (run_id, timestamp, page, stage, seconds) 행의 CSV 문자열로 만든다."""
+        out = io.StringIO()
+        writer = csv.writer(out)
+        writer.writerow(["run_id", "timestamp", "page", "stage", "seconds"])
+        for record in self.runs():
+            for name, seconds in record.timings.items():
+                writer.writerow([record.run_id, f"{record.timestamp:.3f}", record.page, name, f"{seconds:.6f}"])
+        return out.getvalue()
+
+    def clear(self):
+        self._runs.clear()
@@ -0,0 +1,181 @@
+"""
+헤드리스 Streamlit 세션 클라이언트.
+
+브라우저 없이 Streamlit 서버의 웹소켓(/_stcore/stream)에 접속해 스크립트 재실행을 요청하고, 실행이 끝날
+때까지 걸린 시간을 잰다. 벤치마크와 부하 테스트에서 앱의 각 페이지를 구동하는 데 사용한다.
+
+브라우저와 같은 방식으로 BackMsg(rerun_script)를 보내고 ForwardMsg를 받는다. 버튼과 입력 위젯(슬라이더,
+체크박스, 라디오)은 화면에 그려진 요소(delta)에서 라벨과 위젯 ID를 읽어 두었다가, 버튼은 trigger_value로 누르고
+입력 위젯은 새 값을 위젯 상태로 보낸다. 보내지 않은 위젯은 서버 세션에 남아 있는 이전 값을 유지한다.
+
+이 모듈은 Streamlit과 tornado를 import 하므로 벤치마크/부하 테스트 도구에서만 사용한다.
+"""
+import asyncio
+import contextlib
+import os
+import socket
+import subprocess
+import sys
+import time
+import urllib.request
+from collections import namedtuple
+
+import tornado.websocket
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+
+RerunResult = namedtuple("RerunResult", ["elapsed", "messages", "bytes", "status"])
+
+_FINISHED_STATUSES = {
+    ForwardMsg.FINISHED_SUCCESSFULLY: "ok",
+    ForwardMsg.FINISHED_WITH_COMPILE_ERROR: "compile_error",
+}
+
+
+class SessionClient:
+    """
+    웹소켓 하나로 연결된 Streamlit 세션.
+
+    Parameters:
+    - base_url: 서버 주소 (예: "http://localhost:8501")
+    - timeout: 메시지 하나를 기다리는 최대 시간 (초)
+    """
+
+    def __init__(self, base_url, timeout=60.0):
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self.buttons = {}  # 라벨 -> 위젯 ID (마지막 실행에서 그려진 버튼)
+        self.widgets = {}  # 라벨 -> (위젯 ID, 종류) (마지막 실행에서 그려진 슬라이더/체크박스/라디오)
+        self.exceptions = []  # 스크립트에서 발생해 화면에 표시된 예외 메시지
+        self._ws = None
+
+    async def connect(self):
+        url = "ws" + self.base_url[len("http"):] + "/_stcore/stream"
+        self._ws = await tornado.websocket.websocket_connect(url, max_message_size=1 << 30)
+        return self
+
+    def close(self):
+        if self._ws is not None:
+            self._ws.close()
+            self._ws = None
+
+    async def __aenter__(self):
+        return await self.connect()
+
+    async def __aexit__(self, *exc_info):
+        self.close()
+
+    async def rerun(self, click=None, values=None):
+        """
+        스크립트를 한 번 재실행하고 끝날 때까지 기다린다.
+
+        Parameters:
+        - click: 이번 실행에서 누를 버튼의 라벨 (None이면 버튼을 누르지 않음)
+        - values: 위젯 라벨 -> 새 값. 슬라이더는 숫자 (범위 슬라이더는 (시작, 끝), select_slider는 선택지의
+          인덱스), 체크박스는 bool, 라디오는 선택지의 인덱스.
+
+        Returns:
+        - RerunResult(elapsed 초, 받은 메시지 수, 받은 바이트 수, 종료 상태 "ok"/"compile_error")
+        """
+        msg = BackMsg()
+        msg.rerun_script.query_string = ""
+        msg.rerun_script.page_script_hash = ""
+        if click is not None:
+            widget = msg.rerun_script.widget_states.widgets.add()
+            widget.id = self.buttons[click]
+            widget.trigger_value = True
+        for label, value in (values or {}).items():
+            widget_id, kind = self.widgets[label]
+            widget = msg.rerun_script.widget_states.widgets.add()
+            widget.id = widget_id
+            if kind == "slider":
+                widget.double_array_value.data.extend(value if isinstance(value, (tuple, list)) else [value])
+            elif kind == "checkbox":
+                widget.bool_value = bool(value)
+            else:
+                widget.int_value = int(value)
+
+        start = time.perf_counter()
+        await self._ws.write_message(msg.SerializeToString(), binary=True)
+        buttons = {}
+        widgets = {}
+        messages = n_bytes = 0
+        while True:
+            data = await asyncio.wait_for(self._ws.read_message(), self.timeout)
+            if data is None:
+                raise ConnectionError("Streamlit 서버와의 연결이 끊어졌습니다.")
+            messages += 1
+            n_bytes += len(data)
+            fmsg = ForwardMsg()
+            fmsg.ParseFromString(data)
+            kind = fmsg.WhichOneof("type")
+            if kind == "delta":
+                self._record_element(fmsg.delta, buttons, widgets)
+            elif kind == "script_finished":
+                status = _FINISHED_STATUSES.get(fmsg.script_finished)
+                if status is not None:
+                    self.buttons = buttons
+                    self.widgets = widgets
+                    return RerunResult(time.perf_counter() - start, messages, n_bytes, status)
+
+    def _record_element(self, delta, buttons, widgets):
+        if delta.WhichOneof("type") != "new_element":
+            return
+        element = delta.new_element
+        kind = element.WhichOneof("type")
+        if kind == "button":
+            buttons[element.button.label] = element.button.id
+        elif kind in ("slider", "checkbox", "radio"):
+            proto = getattr(element, kind)
+            widgets[proto.label] = (proto.id, kind)
+        elif kind == "exception":
+            self.exceptions.append(f"{element.exception.type}: {element.exception.message}")
+
+
+def _free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@contextlib.contextmanager
+def local_server(app_path, port=None, startup_timeout=60.0, env=None):
+    """
+    app_path를 별도 프로세스의 Streamlit 서버로 실행하고, 준비되면 (기본 URL, 프로세스)를 돌려준다.
+    with 블록이 끝나면 서버를 종료한다.
+    """
+    port = port or _free_port()
+    cmd = [
+        sys.executable, "-m", "streamlit", "run", os.path.abspath(app_path),
+        "--server.headless", "true",
+        "--server.port", str(port),
+        "--server.address", "127.0.0.1",
+        "--browser.gatherUsageStats", "false",
+    ]
+    proc = subprocess.Popen(
+        cmd, cwd=os.path.dirname(os.path.abspath(app_path)), env=env,
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    base_url = f"http://127.0.0.1:{port}"
+    try:
+        deadline = time.monotonic() + startup_timeout
+        while True:
+            if proc.poll() is not None:
+                raise RuntimeError(f"Streamlit 서버가 시작되지 못했습니다 (종료 코드 {proc.returncode}).")
+            try:
+                with urllib.request.urlopen(base_url + "/_stcore/health", timeout=1) as response:
+                    if response.status == 200:
+                        break
+            except OSError:
+                pass
+            if time.monotonic() > deadline:
+                raise TimeoutError("Streamlit 서버가 제시간에 준비되지 않았습니다.")
+            time.sleep(0.2)
+        yield base_url, proc
+    finally:
+        proc.terminate()
+        try:
+            proc.wait(10)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.wait()
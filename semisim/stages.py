@@ -0,0 +1,679 @@
+"""
+증분 계산을 위한 단계(stage) 그래프.
+
+각 단계는 입력 파라미터 이름과 앞선 단계 이름을 선언한다. 파이프라인을 실행하면
+입력 값이 바뀐 단계와 그 하류 단계만 다시 계산하고 나머지는 이전 결과를 재사용한다.
+
+    mobility → mu_eff → iv → figure | chart                (MOSFET)
+    mu_eff → bias_point → load_line_figure | load_line_chart  (MOSFET 바이어스 회로의 동작점과 부하선)
+    mu_eff → bias_sweep → bias_sweep_figure | bias_sweep_chart (게이트 전압 스윕)
+    input_curves → input_figure | input_chart              (BJT 입력 특성)
+    output_curves → output_figure | output_chart           (BJT 출력 특성)
+    em_input_surface → em_input_figure | em_input_chart    (Ebers–Moll (V_BE, V_CB) 평면)
+    em_output_surface → em_output_figure | em_output_chart (Ebers–Moll (I_E, V_CB) 평면)
+    cb_bias_point → cb_load_line_figure | cb_load_line_chart (공통 베이스 바이어스 회로)
+    cb_bias_sweep → cb_bias_sweep_figure | cb_bias_sweep_chart (이미터 전원 스윕)
+    profile → profile_figure | profile_chart                (이온 주입/확산 1차원 깊이 분포)
+    section → section_figure                               (이온 주입/확산 2차원 단면)
+    map → map_figure | map_chart                            (도핑·온도 평면의 이동도 지도)
+    dies → process → id_sat → wafer_stats → wafer_figure | wafer_chart (웨이퍼 지도와 수율)
+
+이전 결과는 세션마다 하나씩 두는 상태 dict(예: st.session_state 안의 dict)에 저장된다.
+shared=True 인 단계의 결과는 semisim.cache.default_cache 에도 저장되어 다른 세션과 공유된다.
+persistent=True 인 단계(이동도 지도, Ebers–Moll 표면처럼 계산이 디스크 읽기보다 훨씬 비싼 결과)는
+semisim.store.default_store 에도 저장되어 다른 워커 프로세스, 그리고 재시작 이후의 프로세스와 공유된다.
+수 ms 안에 다시 계산되는 곡선, 스윕, 확산 분포는 결과 캐시에만 둔다.
+"""
+import contextlib
+
+import numpy as np
+
+from semisim.bjt import EbersMoll, calculate_ic, calculate_ie
+from semisim.cache import default_cache, normalize
+from semisim.circuits import cb_bjt_operating_point, mosfet_operating_point
+from semisim.diffusion import diffuse_1d, diffuse_2d
+from semisim.mobility_map import PLANES, block_starts, downsample, mobility_map
+from semisim.mosfet import calculate_id, calculate_mobility_sic, effective_mobility
+from semisim.store import default_store
+from semisim.wafer import ID_SAT_VDS, sample_wafer, wafer_dies, wafer_grid, wafer_id_sat, wafer_yield
+
+
+class Stage:
+    """
+    파이프라인의 한 계산 단계.
+
+    Parameters:
+    - name: 단계 이름
+    - func: 계산 함수. inputs 순서대로 값을 인자로 받는다.
+    - inputs: 입력 이름 목록. 앞선 단계 이름이면 그 단계의 결과가, 아니면 같은 이름의 파라미터 값이 전달된다.
+    - shared: True이면 결과를 세션 간에 공유되는 결과 캐시에도 저장한다 (그림처럼 변경 가능한 객체는 False).
+    - persistent: True이면 (shared와 함께) 결과를 프로세스 간에 공유되는 디스크 저장소에도 저장한다.
+      배열과 그 튜플/namedtuple로 된 결과만 저장할 수 있다.
+    - dispose: 결과가 새 값으로 바뀌어 더 이상 쓰이지 않을 때 이전 결과를 정리하는 함수 (예: 그림 닫기)
+    """
+
+    def __init__(self, name, func, inputs, shared=False, persistent=False, dispose=None):
+        if persistent and not shared:
+            raise ValueError(f"persistent stage {name!r} must also be shared")
+        self.name = name
+        self.func = func
+        self.inputs = tuple(inputs)
+        self.shared = shared
+        self.persistent = persistent
+        self.dispose = dispose
+
+    def __repr__(self):
+        return f"Stage({self.name!r}, inputs={self.inputs!r})"
+
+
+class Pipeline:
+    """
+    순서가 정해진 단계들의 그래프.
+
+    단계는 자신보다 앞에 있는 단계만 입력으로 참조할 수 있다. 각 단계가 (직·간접적으로) 의존하는
+    파라미터 집합을 미리 구해 두고, 그 파라미터 값들만으로 단계 결과의 유효성을 판단한다.
+
+    Parameters:
+    - name: 파이프라인 이름 (결과 캐시와 저장소 키에 포함된다)
+    - stages: Stage 목록
+    - cache: shared 단계의 결과 캐시 (None이면 사용하지 않는다)
+    - store: persistent 단계의 디스크 저장소 (None이면 사용하지 않는다)
+    """
+
+    def __init__(self, name, stages, cache=default_cache, store=default_store):
+        self.name = name
+        self.stages = list(stages)
+        self.cache = cache
+        self.store = store
+        self._stages = {}
+        self._params = {}  # 단계 이름 -> 의존하는 파라미터 이름 (정렬된 튜플)
+        for stage in self.stages:
+            if stage.name in self._stages:
+                raise ValueError(f"duplicate stage name: {stage.name!r}")
+            params = set()
+            for name in stage.inputs:
+                if name in self._stages:
+                    params.update(self._params[name])
+                else:
+                    params.add(name)
+            self._stages[stage.name] = stage
+            self._params[stage.name] = tuple(sorted(params))
+
+    @property
+    def parameters(self):
+        """파이프라인 전체가 사용하는 파라미터 이름."""
+        return tuple(sorted(set().union(*self._params.values())))
+
+    def dependencies(self, stage_name):
+        """단계가 직·간접적으로 의존하는 파라미터 이름."""
+        return self._params[stage_name]
+
+    def affected_stages(self, changed_params):
+        """주어진 파라미터가 바뀌었을 때 다시 계산해야 하는 단계 이름."""
+        changed = set(changed_params)
+        return [s.name for s in self.stages if changed.intersection(self._params[s.name])]
+
+    def run(self, params, state=None, targets=None, timer=None):
+        """
+        파이프라인을 실행한다.
+
+        Parameters:
+        - params: 파라미터 이름 -> 값
+        - state: 세션별 이전 결과를 담는 dict. 호출 사이에 같은 dict를 넘기면 바뀌지 않은 단계를 재사용한다.
+        - targets: 결과가 필요한 단계 이름 목록. None이면 모든 단계를 실행한다.
+        - timer: 구간 이름을 받아 시간 측정 컨텍스트를 돌려주는 함수 (예: Profiler.timer).
+          주어지면 다시 계산하는 단계마다 "<파이프라인>.<단계>" 이름으로 측정한다.
+
+        Returns:
+        - 실행한 단계 이름 -> 결과 dict. 다시 계산된 단계 이름은 state["recomputed"]에 기록된다.
+        """
+        if state is None:
+            state = {}
+        entries = state.setdefault(self.name, {})
+        needed = self._closure(targets)
+        results = {}
+        recomputed = []
+        for stage in self.stages:
+            if stage.name not in needed:
+                continue
+            key = tuple(normalize(params[p]) for p in self._params[stage.name])
+            entry = entries.get(stage.name)
+            if entry is not None and entry[0] == key:
+                results[stage.name] = entry[1]
+                continue
+            args = [results[n] if n in self._stages else params[n] for n in stage.inputs]
+            with timer(f"{self.name}.{stage.name}") if timer is not None else contextlib.nullcontext():
+                if stage.shared and self.cache is not None:
+                    value = self.cache.get_or_compute((self.name, stage.name, key), self._compute(stage, key, args))
+                else:
+                    value = stage.func(*args)
+            if entry is not None and stage.dispose is not None:
+                stage.dispose(entry[1])
+            entries[stage.name] = (key, value)
+            results[stage.name] = value
+            recomputed.append(stage.name)
+        state["recomputed"] = recomputed
+        return results
+
+    def _compute(self, stage, key, args):
+        # 결과 캐시에 없을 때의 계산: persistent 단계는 디스크 저장소를 먼저 확인한다
+        if stage.persistent and self.store is not None:
+            return lambda: self.store.get_or_compute((self.name, stage.name, key), lambda: stage.func(*args))
+        return lambda: stage.func(*args)
+
+    def refine(self, params, target, resolution, levels):
+        """
+        target 단계를 해상도 파라미터 resolution의 값 levels 순서로 (거친 격자부터) 계산하는 제너레이터.
+        semisim.background의 점진적 작업에서 사용한다.
+
+        Yields:
+        - (해상도, target 결과)
+        """
+        for n in levels:
+            # 해상도마다 새 상태를 쓴다: 이전 해상도의 결과(그림)는 다른 스레드가 아직 그리는 중일 수 있으므로
+            # dispose 하지 않고 참조가 없어질 때 회수되게 둔다. shared 단계의 결과는 결과 캐시로 재사용된다.
+            yield n, self.run(dict(params, **{resolution: n}), {}, targets=[target])[target]
+
+    def _closure(self, targets):
+        if targets is None:
+            return set(self._stages)
+        needed = set()
+        pending = list(targets)
+        while pending:
+            name = pending.pop()
+            if name in needed:
+                continue
+            needed.add(name)
+            pending.extend(n for n in self._stages[name].inputs if n in self._stages)
+        return needed
+
+
+# MOSFET 파이프라인 단계 함수
+def _mosfet_iv(mu_eff, W, L, Vgs, N_D, N_A):
+    Vds_values = np.linspace(0, 5, 100)
+    return Vds_values, calculate_id(Vgs, Vds_values, W, L, N_D, N_A, mu_eff=mu_eff)
+
+
+def _mosfet_figure(iv, Vgs, W, L):
+    from semisim import plotting
+
+    Vds_values, Id_values = iv
+    return plotting.plot_mosfet_output(Vds_values, Id_values, Vgs, W, L)
+
+
+def _mosfet_chart(iv, Vgs, W, L):
+    from semisim import charts
+
+    Vds_values, Id_values = iv
+    return charts.line_chart_spec(
+        Vds_values, [Id_values], [f"Vgs = {Vgs} V, W = {W:.1f} µm, L = {L:.1f} µm"],
+        "Drain-Source Voltage (Vds) [V]", "Drain Current (Id) [A]", title="MOSFET Output Characteristics",
+    )
+
+
+# 바이어스 회로 스윕의 점 수 (모든 점을 semisim.circuits의 배치 Newton 풀이 한 번으로 계산한다)
+BIAS_SWEEP_POINTS = 1000
+
+
+def _mosfet_bias_point(mu_eff, W, L, Vgs, N_D, N_A, V_DD, R_D, R_S):
+    # 바이어스 회로에서는 Vgs 슬라이더 값을 게이트 전원 전압 V_G로 사용한다
+    return mosfet_operating_point(Vgs, V_DD, R_D, R_S, W, L, N_D, N_A, mu_eff=mu_eff)
+
+
+def _mosfet_bias_sweep(mu_eff, W, L, N_D, N_A, V_DD, R_D, R_S):
+    V_G_values = np.linspace(0, 5, BIAS_SWEEP_POINTS)
+    return V_G_values, mosfet_operating_point(V_G_values, V_DD, R_D, R_S, W, L, N_D, N_A, mu_eff=mu_eff)
+
+
+def _mosfet_load_line(op, mu_eff, W, L, N_D, N_A, V_DD, R_D, R_S):
+    # 동작점의 Vgs에서의 출력 특성과 부하선 Id = (V_DD - Vds) / (R_D + R_S)는 동작점에서 만난다
+    Vds_values = np.linspace(0, max(V_DD, 0.1), 200)
+    device = calculate_id(op.Vgs, Vds_values, W, L, N_D, N_A, mu_eff=mu_eff)
+    R = R_D + R_S
+    load = (V_DD - Vds_values) / R if R > 0 else np.full_like(Vds_values, np.nan)
+    return Vds_values, np.stack([device, load])
+
+
+def _mosfet_load_line_figure(bias_point, load_line):
+    from semisim import plotting
+
+    Vds_values, curves = load_line
+    return plotting.plot_curves(
+        Vds_values, curves * 1e6, [f"Vgs = {float(bias_point.Vgs):.3f} V", "Load line"],
+        "Drain-Source Voltage (Vds) [V]", "Drain Current (Id) [µA]", "MOSFET Load Line",
+        point=(float(bias_point.Vds), float(bias_point.Id) * 1e6, "Operating point"),
+    )
+
+
+def _mosfet_load_line_chart(bias_point, load_line):
+    from semisim import charts
+
+    Vds_values, curves = load_line
+    return charts.line_chart_spec(
+        Vds_values, curves * 1e6, [f"Vgs = {float(bias_point.Vgs):.3f} V", "Load line"],
+        "Drain-Source Voltage (Vds) [V]", "Drain Current (Id) [µA]", title="MOSFET Load Line",
+    )
+
+
+def _mosfet_bias_sweep_figure(sweep):
+    from semisim import plotting
+
+    V_G_values, op = sweep
+    return plotting.plot_curves(
+        V_G_values, [op.Id * 1e6], ["Id"], "Gate Voltage (V_G) [V]", "Drain Current (Id) [µA]", "MOSFET Bias Sweep",
+    )
+
+
+def _mosfet_bias_sweep_chart(sweep):
+    from semisim import charts
+
+    V_G_values, op = sweep
+    return charts.line_chart_spec(
+        V_G_values, [op.Id * 1e6], ["Id"], "Gate Voltage (V_G) [V]", "Drain Current (Id) [µA]",
+        title="MOSFET Bias Sweep",
+    )
+
+
+# BJT 파이프라인 단계 함수
+def _bjt_input_curves(I_S, V_T, V_CB_min, V_CB_max):
+    V_BE_values = np.linspace(0, 1, 200)
+    V_CB_values = np.linspace(V_CB_min, V_CB_max, 3)
+    # 각 V_CB 값에 대한 곡선을 한 번에 계산 (행: V_CB, 열: V_BE)
+    I_E_curves = calculate_ie(V_BE_values[None, :], V_CB_values[:, None], I_S * 1e-12, V_T)
+    return V_BE_values, V_CB_values, I_E_curves
+
+
+def _bjt_output_curves(V_T, I_E_min, I_E_max):
+    V_CB_values = np.linspace(0, 10, 200)
+    I_E_values = np.linspace(I_E_min, I_E_max, 3)
+    # 각 I_E 값에 대한 곡선을 한 번에 계산 (행: I_E, 열: V_CB)
+    I_C_curves = calculate_ic(I_E_values[:, None], V_CB_values[None, :], V_T)
+    return V_CB_values, I_E_values, I_C_curves
+
+
+def _bjt_input_figure(curves):
+    from semisim import plotting
+
+    return plotting.plot_bjt_input(*curves)
+
+
+def _bjt_output_figure(curves):
+    from semisim import plotting
+
+    return plotting.plot_bjt_output(*curves)
+
+
+def _close_figure(fig):
+    from semisim import plotting
+
+    plotting.close_figure(fig)
+
+
+def _em_input_surface(I_S, V_T, alpha_F, alpha_R, V_BE_max, surface_V_CB, surface_points):
+    model = EbersMoll(I_S * 1e-12, alpha_F, alpha_R, V_T)
+    V_BE_values = np.linspace(0, V_BE_max, surface_points)
+    V_CB_values = np.linspace(*surface_V_CB, surface_points)
+    return V_BE_values, V_CB_values, model.input_surface(V_BE_values, V_CB_values)
+
+
+def _em_output_surface(I_S, V_T, alpha_F, alpha_R, I_E_min, I_E_max, surface_V_CB, surface_points):
+    model = EbersMoll(I_S * 1e-12, alpha_F, alpha_R, V_T)
+    I_E_values = np.linspace(I_E_min, I_E_max, surface_points)
+    V_CB_values = np.linspace(*surface_V_CB, surface_points)
+    return I_E_values, V_CB_values, model.output_surface(I_E_values, V_CB_values)
+
+
+def _em_input_figure(surface):
+    from semisim import plotting
+
+    V_BE_values, V_CB_values, I_E = surface
+    return plotting.plot_log_contour(
+        V_BE_values, V_CB_values, I_E, "V_BE (V)", "V_CB (V)", "Ebers–Moll I_E(V_BE, V_CB)", "log10 |I_E| (A)",
+    )
+
+
+def _em_output_figure(surface):
+    from semisim import plotting
+
+    I_E_values, V_CB_values, I_C = surface
+    # 행이 I_E이므로 x축을 V_CB, y축을 I_E (mA)로 그린다
+    return plotting.plot_log_contour(
+        V_CB_values, I_E_values * 1e3, I_C, "V_CB (V)", "I_E (mA)", "Ebers–Moll I_C(I_E, V_CB)", "log10 |I_C| (A)",
+    )
+
+
+# Ebers–Moll 표면의 브라우저 차트는 격자(축당 최대 1000점)를 축당 100칸으로 블록 평균하여 보낸다
+EM_CHART_CELLS = 100
+
+
+def _log_surface_chart(x_values, y_values, surface, x_title, y_title, value_title, title):
+    from semisim import charts
+
+    # 격자 점을 칸 중심으로 보고 log10 |값|을 블록 평균한다 (값이 0인 점(-inf)은 평균에서 빼고, 모두 0이면 빈 칸)
+    z = surface.log10_abs()
+    ny, nx = z.shape
+    x_starts, _ = block_starts(nx, EM_CHART_CELLS)
+    y_starts, _ = block_starts(ny, EM_CHART_CELLS)
+    finite = np.isfinite(z)
+
+    def block_sum(a):
+        return np.add.reduceat(np.add.reduceat(a, x_starts, axis=1), y_starts, axis=0)
+
+    with np.errstate(invalid="ignore"):
+        coarse = block_sum(np.where(finite, z, 0.0)) / block_sum(finite.astype(float))
+
+    def edges(values, starts):
+        mid = (values[:-1] + values[1:]) / 2
+        return np.concatenate([values[:1], mid, values[-1:]])[np.append(starts, values.size)]
+
+    return charts.heatmap_spec(edges(x_values, x_starts), edges(y_values, y_starts), coarse,
+                               x_title, y_title, value_title, title=f"{title} ({nx}×{ny} grid)")
+
+
+def _em_input_chart(surface):
+    V_BE_values, V_CB_values, I_E = surface
+    return _log_surface_chart(V_BE_values, V_CB_values, I_E, "V_BE (V)", "V_CB (V)", "log10 |I_E| (A)",
+                              "Ebers–Moll I_E(V_BE, V_CB)")
+
+
+def _em_output_chart(surface):
+    I_E_values, V_CB_values, I_C = surface
+    return _log_surface_chart(V_CB_values, I_E_values * 1e3, I_C, "V_CB (V)", "I_E (mA)", "log10 |I_C| (A)",
+                              "Ebers–Moll I_C(I_E, V_CB)")
+
+
+def _cb_bias_point(I_S, V_T, alpha_F, alpha_R, V_EE, V_CC, R_E, R_C):
+    return cb_bjt_operating_point(V_EE, V_CC, R_E, R_C, EbersMoll(I_S * 1e-12, alpha_F, alpha_R, V_T))
+
+
+def _cb_bias_sweep(I_S, V_T, alpha_F, alpha_R, V_CC, R_E, R_C):
+    V_EE_values = np.linspace(0, 10, BIAS_SWEEP_POINTS)
+    model = EbersMoll(I_S * 1e-12, alpha_F, alpha_R, V_T)
+    return V_EE_values, cb_bjt_operating_point(V_EE_values, V_CC, R_E, R_C, model)
+
+
+def _cb_load_line(op, I_S, V_T, alpha_F, alpha_R, V_CC, R_C):
+    # 동작점의 I_E에서의 출력 특성과 부하선 I_C = (V_CC - V_CB) / R_C는 동작점에서 만난다
+    model = EbersMoll(I_S * 1e-12, alpha_F, alpha_R, V_T)
+    V_CB_values = np.linspace(-0.5, max(V_CC, 0.5), 200)
+    device = model.collector_current_from_ie(op.I_E, V_CB_values).value()
+    load = (V_CC - V_CB_values) / R_C if R_C > 0 else np.full_like(V_CB_values, np.nan)
+    return V_CB_values, np.stack([device, load])
+
+
+def _cb_load_line_figure(bias_point, load_line):
+    from semisim import plotting
+
+    V_CB_values, curves = load_line
+    return plotting.plot_curves(
+        V_CB_values, curves * 1e3, [f"I_E = {float(bias_point.I_E) * 1e3:.3f} mA", "Load line"],
+        "V_CB (V)", "I_C (mA)", "Common-Base Load Line",
+        point=(float(bias_point.V_CB), float(bias_point.I_C) * 1e3, "Operating point"),
+    )
+
+
+def _cb_load_line_chart(bias_point, load_line):
+    from semisim import charts
+
+    V_CB_values, curves = load_line
+    return charts.line_chart_spec(
+        V_CB_values, curves * 1e3, [f"I_E = {float(bias_point.I_E) * 1e3:.3f} mA", "Load line"],
+        "V_CB (V)", "I_C (mA)", title="Common-Base Load Line",
+    )
+
+
+def _cb_bias_sweep_figure(sweep):
+    from semisim import plotting
+
+    V_EE_values, op = sweep
+    return plotting.plot_curves(
+        V_EE_values, [op.I_C * 1e3, op.I_E * 1e3], ["I_C", "I_E"], "V_EE (V)", "Current (mA)",
+        "Common-Base Bias Sweep",
+    )
+
+
+def _cb_bias_sweep_chart(sweep):
+    from semisim import charts
+
+    V_EE_values, op = sweep
+    return charts.line_chart_spec(
+        V_EE_values, [op.I_C * 1e3, op.I_E * 1e3], ["I_C", "I_E"], "V_EE (V)", "Current (mA)",
+        title="Common-Base Bias Sweep",
+    )
+
+
+def _bjt_input_chart(curves):
+    from semisim import charts
+
+    V_BE_values, V_CB_values, I_E_curves = curves
+    return charts.line_chart_spec(
+        V_BE_values, I_E_curves * 1e3, [f"V_CB = {V_CB:.1f} V" for V_CB in V_CB_values],
+        "V_BE (V)", "I_E (mA)", title="V_BE - I_E Curve",
+    )
+
+
+def _bjt_output_chart(curves):
+    from semisim import charts
+
+    V_CB_values, I_E_values, I_C_curves = curves
+    return charts.line_chart_spec(
+        V_CB_values, I_C_curves * 1e3, [f"I_E = {I_E * 1e3:.1f} mA" for I_E in I_E_values],
+        "V_CB (V)", "I_C (mA)", title="V_CB - I_C Curve",
+    )
+
+
+# 확산 파이프라인 단계 함수 (dose cm^-2, energy keV, time 분, temperature °C)
+# 2차원 단면: 가로 0 ~ 2 µm 중 0 ~ 1 µm가 주입 창 (소스 영역), 나머지는 게이트 아래
+SECTION_WIDTH_UM = 2.0
+SECTION_WINDOW_UM = (0.0, 1.0)
+
+# 로그 눈금 그래프에 표시할 최소 농도 (cm^-3)
+PROFILE_FLOOR = 1e12
+
+
+def _diffusion_profile(dose, energy, time, temperature, N_A):
+    return diffuse_1d(dose, energy, time, temperature, N_A)
+
+
+def _diffusion_section(dose, energy, time, temperature, N_A):
+    window = tuple(w * 1e-4 for w in SECTION_WINDOW_UM)
+    return diffuse_2d(dose, energy, time, temperature, window, SECTION_WIDTH_UM * 1e-4, N_A)
+
+
+def _profile_figure(profile, N_A):
+    from semisim import plotting
+
+    return plotting.plot_doping_profile(
+        profile.depth * 1e4, [profile.as_implanted, profile.concentration], ["As implanted", "After drive-in"], N_A,
+        profile.junction_depth * 1e4, floor=PROFILE_FLOOR,
+    )
+
+
+def _profile_chart(profile, N_A):
+    from semisim import charts
+
+    curves = np.stack([profile.as_implanted, profile.concentration, np.full_like(profile.depth, N_A)])
+    return charts.line_chart_spec(
+        profile.depth * 1e4, np.where(curves >= PROFILE_FLOOR, curves, 0.0),
+        ["As implanted", "After drive-in", "N_A (substrate)"],
+        "Depth (µm)", "Concentration (cm^-3)", title="Implant / Drive-in Profile", log_y=True,
+    )
+
+
+def _section_figure(section, N_A):
+    from semisim import plotting
+
+    return plotting.plot_doping_section(
+        section.x * 1e4, section.depth * 1e4, section.concentration, N_A, SECTION_WINDOW_UM, floor=PROFILE_FLOOR,
+    )
+
+
+# 이동도 지도 단계 함수
+# 평면별 (x축 범위, y축 범위). 농도는 cm^-3, 온도는 K (MOSFET 페이지 슬라이더 범위를 포함한다)
+MAP_RANGES = {
+    "N_D-T": ((1e13, 1e20), (100, 500)),
+    "N_A-N_D": ((1e14, 1e19), (1e13, 1e20)),
+}
+# 표시 해상도: 전체 격자(축당 최대 수천 점)를 블록 평균으로 줄여 그림은 축당 400칸, 브라우저 차트는 100칸으로 보낸다
+MAP_FIGURE_CELLS = 400
+MAP_CHART_CELLS = 100
+
+_MAP_LABELS = {
+    "N_D": "N_D (cm^-3)", "N_A": "N_A (cm^-3)", "T": "T (K)",
+    "mu_eff": "mu_eff (cm^2/V·s)", "mu_e": "mu_e (cm^2/V·s)", "mu_h": "mu_h (cm^2/V·s)",
+}
+
+
+def _mobility_map(map_plane, map_quantity, map_points, map_float32, map_fixed):
+    x_range, y_range = MAP_RANGES[map_plane]
+    return mobility_map(
+        map_plane, x_range, y_range, shape=(map_points, map_points), fixed=map_fixed, quantity=map_quantity,
+        dtype=np.float32 if map_float32 else np.float64, display_shape=(MAP_FIGURE_CELLS, MAP_FIGURE_CELLS),
+    )
+
+
+def _map_titles(map_plane, map_quantity):
+    x_name, y_name, fixed_name, (log_x, log_y) = PLANES[map_plane]
+    return _MAP_LABELS[x_name], _MAP_LABELS[y_name], _MAP_LABELS[map_quantity], log_x, log_y
+
+
+def _map_figure(mobility, map_plane, map_quantity, map_point):
+    from semisim import plotting
+
+    x_title, y_title, value_title, log_x, log_y = _map_titles(map_plane, map_quantity)
+    nx, ny = mobility.shape
+    return plotting.plot_heatmap(
+        mobility.x_edges, mobility.y_edges, mobility.values, x_title, y_title,
+        f"{map_quantity} map ({nx}×{ny} grid)", value_title, log_x, log_y, point=map_point,
+    )
+
+
+def _map_chart(mobility, map_plane, map_quantity):
+    from semisim import charts
+
+    x_title, y_title, value_title, log_x, log_y = _map_titles(map_plane, map_quantity)
+    small = downsample(mobility, (MAP_CHART_CELLS, MAP_CHART_CELLS))
+    nx, ny = mobility.shape
+    return charts.heatmap_spec(
+        small.x_edges, small.y_edges, small.values, x_title, y_title, value_title,
+        title=f"{map_quantity} map ({nx}×{ny} grid)", log_x=log_x, log_y=log_y,
+    )
+
+
+# 웨이퍼 지도 단계 함수
+# 브라우저 차트는 다이 격자(축당 최대 수백 칸)를 축당 100칸으로 블록 평균하여 보낸다
+WAFER_CHART_CELLS = 100
+
+
+def _wafer_process(dies, N_A, N_D, wafer_variation, wafer_correlation, wafer_seed):
+    return sample_wafer(dies, {"N_A": N_A, "N_D": N_D}, wafer_variation, wafer_correlation, wafer_seed)
+
+
+def _wafer_yield(dies, id_sat, spec_window, wafer_zones):
+    low, high = spec_window
+    return wafer_yield(dies, id_sat, low, high, wafer_zones)
+
+
+def _wafer_title(dies, stats, Vgs):
+    # 규격 범위가 없으면(설계점이 차단 영역) 수율은 의미가 없으므로 표시하지 않는다
+    spec = "" if stats.low is None and stats.high is None else f", yield {stats.yield_ * 100:.1f}%"
+    return f"Id_sat at Vgs={Vgs:g} V, Vds={ID_SAT_VDS:g} V ({dies.x.size} dies{spec})"
+
+
+def _wafer_figure(dies, id_sat, stats, Vgs):
+    from semisim import plotting
+
+    x_edges, y_edges, values = wafer_grid(dies, id_sat * 1e6)
+    _, _, failed = wafer_grid(dies, ~stats.passed)
+    return plotting.plot_wafer_map(
+        x_edges, y_edges, values, np.nan_to_num(failed), dies.radius, stats.zones.r_outer[:-1],
+        _wafer_title(dies, stats, Vgs), "Id_sat (µA)",
+    )
+
+
+def _wafer_chart(dies, id_sat, stats, Vgs):
+    from semisim import charts
+
+    x_edges, y_edges, values = wafer_grid(dies, id_sat * 1e6, cells=WAFER_CHART_CELLS)
+    return charts.heatmap_spec(x_edges, y_edges, values, "x (mm)", "y (mm)", "Id_sat (µA)",
+                               title=_wafer_title(dies, stats, Vgs))
+
+
+# MOSFET: 이동도 → 효과적인 이동도 → I-V 곡선 → 그림 (matplotlib) / 차트 (브라우저),
+#         효과적인 이동도 → 바이어스 회로 동작점/스윕 → 그림/차트
+mosfet_pipeline = Pipeline("mosfet", [
+    Stage("mobility", calculate_mobility_sic, ["N_D", "N_A", "T"], shared=True),
+    Stage("mu_eff", lambda mobility: effective_mobility(*mobility), ["mobility"], shared=True),
+    Stage("iv", _mosfet_iv, ["mu_eff", "W", "L", "Vgs", "N_D", "N_A"], shared=True),
+    Stage("figure", _mosfet_figure, ["iv", "Vgs", "W", "L"], dispose=_close_figure),
+    Stage("chart", _mosfet_chart, ["iv", "Vgs", "W", "L"]),
+    Stage("bias_point", _mosfet_bias_point, ["mu_eff", "W", "L", "Vgs", "N_D", "N_A", "V_DD", "R_D", "R_S"],
+          shared=True),
+    Stage("load_line", _mosfet_load_line, ["bias_point", "mu_eff", "W", "L", "N_D", "N_A", "V_DD", "R_D", "R_S"],
+          shared=True),
+    Stage("load_line_figure", _mosfet_load_line_figure, ["bias_point", "load_line"], dispose=_close_figure),
+    Stage("load_line_chart", _mosfet_load_line_chart, ["bias_point", "load_line"]),
+    Stage("bias_sweep", _mosfet_bias_sweep, ["mu_eff", "W", "L", "N_D", "N_A", "V_DD", "R_D", "R_S"], shared=True),
+    Stage("bias_sweep_figure", _mosfet_bias_sweep_figure, ["bias_sweep"], dispose=_close_figure),
+    Stage("bias_sweep_chart", _mosfet_bias_sweep_chart, ["bias_sweep"]),
+])
+
+# BJT: 입력 특성 곡선 → 그림/차트, 출력 특성 곡선 → 그림/차트, Ebers–Moll 표면 → 등고선 지도,
+#      바이어스 회로 동작점/스윕 → 그림/차트 (각 갈래는 서로 독립)
+bjt_pipeline = Pipeline("bjt", [
+    Stage("input_curves", _bjt_input_curves, ["I_S", "V_T", "V_CB_min", "V_CB_max"], shared=True),
+    Stage("input_figure", _bjt_input_figure, ["input_curves"], dispose=_close_figure),
+    Stage("input_chart", _bjt_input_chart, ["input_curves"]),
+    Stage("output_curves", _bjt_output_curves, ["V_T", "I_E_min", "I_E_max"], shared=True),
+    Stage("output_figure", _bjt_output_figure, ["output_curves"], dispose=_close_figure),
+    Stage("output_chart", _bjt_output_chart, ["output_curves"]),
+    Stage("em_input_surface", _em_input_surface,
+          ["I_S", "V_T", "alpha_F", "alpha_R", "V_BE_max", "surface_V_CB", "surface_points"], shared=True,
+          persistent=True),
+    Stage("em_input_figure", _em_input_figure, ["em_input_surface"], dispose=_close_figure),
+    Stage("em_input_chart", _em_input_chart, ["em_input_surface"]),
+    Stage("em_output_surface", _em_output_surface,
+          ["I_S", "V_T", "alpha_F", "alpha_R", "I_E_min", "I_E_max", "surface_V_CB", "surface_points"], shared=True,
+          persistent=True),
+    Stage("em_output_figure", _em_output_figure, ["em_output_surface"], dispose=_close_figure),
+    Stage("em_output_chart", _em_output_chart, ["em_output_surface"]),
+    Stage("cb_bias_point", _cb_bias_point, ["I_S", "V_T", "alpha_F", "alpha_R", "V_EE", "V_CC", "R_E", "R_C"],
+          shared=True),
+    Stage("cb_load_line", _cb_load_line, ["cb_bias_point", "I_S", "V_T", "alpha_F", "alpha_R", "V_CC", "R_C"],
+          shared=True),
+    Stage("cb_load_line_figure", _cb_load_line_figure, ["cb_bias_point", "cb_load_line"], dispose=_close_figure),
+    Stage("cb_load_line_chart", _cb_load_line_chart, ["cb_bias_point", "cb_load_line"]),
+    Stage("cb_bias_sweep", _cb_bias_sweep, ["I_S", "V_T", "alpha_F", "alpha_R", "V_CC", "R_E", "R_C"], shared=True),
+    Stage("cb_bias_sweep_figure", _cb_bias_sweep_figure, ["cb_bias_sweep"], dispose=_close_figure),
+    Stage("cb_bias_sweep_chart", _cb_bias_sweep_chart, ["cb_bias_sweep"]),
+])
+
+# 확산: 주입/확산 분포 → 그림/차트. 결과는 (dose, energy, time, temperature, N_A)마다 결과 캐시에 저장되며,
+# profile의 N_D_mean은 MOSFET 파이프라인의 N_D로 사용할 수 있다.
+diffusion_pipeline = Pipeline("diffusion", [
+    Stage("profile", _diffusion_profile, ["dose", "energy", "time", "temperature", "N_A"], shared=True),
+    Stage("profile_figure", _profile_figure, ["profile", "N_A"], dispose=_close_figure),
+    Stage("profile_chart", _profile_chart, ["profile", "N_A"]),
+    Stage("section", _diffusion_section, ["dose", "energy", "time", "temperature", "N_A"], shared=True),
+    Stage("section_figure", _section_figure, ["section", "N_A"], dispose=_close_figure),
+])
+
+# 이동도 지도: (N_D, T) 또는 (N_A, N_D) 평면 전체의 이동도 → 그림/차트
+mobility_map_pipeline = Pipeline("mobility_map", [
+    Stage("map", _mobility_map, ["map_plane", "map_quantity", "map_points", "map_float32", "map_fixed"], shared=True,
+          persistent=True),
+    Stage("map_figure", _map_figure, ["map", "map_plane", "map_quantity", "map_point"], dispose=_close_figure),
+    Stage("map_chart", _map_chart, ["map", "map_plane", "map_quantity"]),
+])
+
+# 웨이퍼 지도: 다이 배치 → 다이별 공정 파라미터 → Id_sat → 규격 수율/구역 통계 → 그림/차트.
+# 규격 범위만 바꾸면 수율과 그림만, 바이어스(Vgs, W, L, T)만 바꾸면 공정 파라미터는 재사용한다.
+wafer_pipeline = Pipeline("wafer", [
+    Stage("dies", wafer_dies, ["wafer_diameter", "die_size", "edge_exclusion"], shared=True),
+    Stage("process", _wafer_process, ["dies", "N_A", "N_D", "wafer_variation", "wafer_correlation", "wafer_seed"],
+          shared=True),
+    Stage("id_sat", wafer_id_sat, ["process", "Vgs", "W", "L", "T"], shared=True),
+    Stage("wafer_stats", _wafer_yield, ["dies", "id_sat", "spec_window", "wafer_zones"], shared=True),
+    Stage("wafer_figure", _wafer_figure, ["dies", "id_sat", "wafer_stats", "Vgs"], dispose=_close_figure),
+    Stage("wafer_chart", _wafer_chart, ["dies", "id_sat", "wafer_stats", "Vgs"]),
+])
@@ -0,0 +1,304 @@
+"""
+여러 서버 프로세스가 공유하는 디스크 결과 저장소.
+
+프로세스 메모리 캐시(semisim.cache)는 워커 프로세스마다 따로 있고 재시작하면 비워진다. ResultStore는 이동도 지도,
+BJT 표면처럼 계산이 비싼 결과를 디렉터리에 저장하여, 같은 디렉터리를 쓰는 모든 워커와 재배포 이후의
+프로세스가 재사용할 수 있게 한다.
+
+- 키: 파라미터 키의 해시. 모델 버전 태그(MODEL_VERSION)가 경로에 포함되므로 모델 식이 바뀌면 버전을 올려
+  이전 결과를 무효화한다 (이전 버전의 항목은 LRU 정리로 지워진다).
+- 형식: 항목마다 디렉터리 하나에 배열을 .npy 파일로, 구조(튜플/namedtuple/스칼라)를 meta.json으로 저장한다.
+  배열은 np.load(mmap_mode="r")로 열므로 복사 없이 페이지 캐시를 공유한다.
+- 동시 쓰기: 임시 디렉터리에 모두 쓴 뒤 rename 한 번으로 공개하므로 읽는 쪽은 완성된 항목만 본다. 같은 키를
+  여러 프로세스가 동시에 쓰면 먼저 공개한 쪽이 남고 나머지는 버려진다.
+- 크기 제한: 읽을 때 meta.json의 수정 시각을 갱신하고, 전체 크기가 max_bytes를 넘으면 가장 오래 사용되지 않은
+  항목부터 지운다. 지울 항목은 먼저 다른 이름으로 옮기므로 읽는 중인 프로세스는 실패 대신 캐시 실패로 처리한다.
+  전체 크기는 프로세스마다 마지막으로 디렉터리를 훑은 값에 자신이 쓴 크기를 더해 추적하며, 디렉터리는 그 값이
+  max_bytes를 넘거나 마지막으로 훑은 지 _RESYNC_SECONDS가 지났을 때만 다시 훑는다 (다른 프로세스의 쓰기 반영).
+
+환경 변수로 기본 저장소를 설정한다.
+- SEMISIM_STORE_DIR: 저장 디렉터리 (기본 SEMISIM_CACHE_DIR/store 또는 ~/.cache/semisim/store, "off"이면 사용 안 함)
+- SEMISIM_STORE_MAX_BYTES: 최대 크기 (바이트, 기본 1 GiB)
+"""
+import hashlib
+import importlib
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+import uuid
+from collections import namedtuple
+
+import numpy as np
+
+from semisim.cache import env_number, normalize
+
+# 저장 결과에 영향을 주는 모델 식이나 결과 구조가 바뀌면 올린다
+MODEL_VERSION = "1"
+
+StoreStats = namedtuple("StoreStats", ["hits", "misses", "writes", "evictions", "entries", "bytes", "max_bytes"])
+
+_META = "meta.json"
+# 중단된 쓰기/지우기가 남긴 임시 디렉터리를 정리하기까지의 시간 (초)
+_STALE_SECONDS = 3600
+# 다른 프로세스의 쓰기/정리를 반영하도록 디렉터리를 다시 훑어 전체 크기를 맞추는 간격 (초)
+_RESYNC_SECONDS = 60
+
+
+def default_store_dir():
+    """기본 저장 디렉터리. SEMISIM_STORE_DIR이 "off"이면 None."""
+    path = os.environ.get("SEMISIM_STORE_DIR")
+    if path:
+        return None if path.lower() == "off" else path
+    base = os.environ.get("SEMISIM_CACHE_DIR") or os.path.join(os.path.expanduser("~"), ".cache", "semisim")
+    return os.path.join(base, "store")
+
+
+class ResultStore:
+    """
+    디스크 결과 저장소.
+
+    Parameters:
+    - directory: 저장 디렉터리 (여러 프로세스가 같은 경로를 쓰면 결과를 공유한다)
+    - max_bytes: 저장소 전체의 최대 크기 (바이트)
+    - version: 모델 버전 태그
+    """
+
+    def __init__(self, directory, max_bytes=2**30, version=MODEL_VERSION):
+        self.directory = os.path.abspath(directory)
+        self.max_bytes = max_bytes
+        self.version = str(version)
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._writes = 0
+        self._evictions = 0
+        # 마지막으로 훑은 항목 수·크기 + 이 프로세스가 그 뒤에 쓴 항목 (None이면 아직 훑지 않음)
+        self._entry_count = 0
+        self._bytes = None
+        self._synced = 0.0
+
+    def key_digest(self, key):
+        """키의 해시 (파일 이름에 쓰인다)."""
+        return hashlib.blake2b(repr(normalize(key)).encode(), digest_size=16).hexdigest()
+
+    def _entry_dir(self, digest):
+        return os.path.join(self.directory, self.version, digest[:2], digest)
+
+    def get(self, key, default=None):
+        """저장된 결과 (배열은 읽기 전용 메모리 매핑). 없거나 읽을 수 없으면 default."""
+        entry = self._entry_dir(self.key_digest(key))
+        try:
+            with open(os.path.join(entry, _META), encoding="utf-8") as f:
+                meta = json.load(f)
+            value = _decode(meta["value"], entry)
+            os.utime(os.path.join(entry, _META))  # LRU 순서 갱신
+        except (OSError, ValueError, KeyError, TypeError, ImportError, AttributeError):
+            # 없는 항목, 다른 프로세스가 지우는 중인 항목, 구조를 복원할 수 없는 항목은 모두 실패로 처리한다
+            with self._lock:
+                self._misses += 1
+            return default
+        with self._lock:
+            self._hits += 1
+        return value
+
+    def put(self, key, value):
+        """
+        결과를 저장한다. 배열, 숫자/문자열/None, 그리고 이들로 이루어진 튜플·리스트·dict·namedtuple만
+        저장할 수 있으며, 그 밖의 값이면 TypeError를 낸다. 이미 같은 키의 항목이 있으면 그대로 둔다.
+        """
+        entry = self._entry_dir(self.key_digest(key))
+        if os.path.exists(os.path.join(entry, _META)):
+            return
+        tmp_root = os.path.join(self.directory, ".tmp")
+        os.makedirs(tmp_root, exist_ok=True)
+        os.makedirs(os.path.dirname(entry), exist_ok=True)
+        tmp = tempfile.mkdtemp(dir=tmp_root)
+        try:
+            arrays = []
+            meta = {"key": repr(normalize(key)), "created": time.time(), "value": _encode(value, arrays)}
+            for i, array in enumerate(arrays):
+                np.save(os.path.join(tmp, f"{i}.npy"), array, allow_pickle=False)
+            with open(os.path.join(tmp, _META), "w", encoding="utf-8") as f:
+                json.dump(meta, f)
+            size = sum(f.stat().st_size for f in os.scandir(tmp))
+            try:
+                os.rename(tmp, entry)
+            except OSError:
+                # 다른 프로세스가 먼저 같은 항목을 공개했다
+                if not os.path.exists(os.path.join(entry, _META)):
+                    raise
+            else:
+                with self._lock:
+                    self._writes += 1
+                    if self._bytes is not None:
+                        self._entry_count += 1
+                        self._bytes += size
+        finally:
+            shutil.rmtree(tmp, ignore_errors=True)
+        with self._lock:
+            due = (self._bytes is None or self._bytes > self.max_bytes
+                   or time.monotonic() - self._synced > _RESYNC_SECONDS)
+        if due:
+            self.evict()
+
+    def get_or_compute(self, key, compute):
+        """저장된 결과가 있으면 그것을, 없으면 compute()를 호출해 저장한 뒤 돌려준다 (저장할 수 없는 값이면 저장하지 않는다)."""
+        marker = object()
+        value = self.get(key, marker)
+        if value is not marker:
+            return value
+        value = compute()
+        try:
+            self.put(key, value)
+        except TypeError:
+            pass
+        return value
+
+    def _entries(self):
+        # (마지막 사용 시각, 크기, 경로) 목록. 다른 프로세스가 지우는 중인 항목은 건너뛴다
+        entries = []
+        for version in _scandir(self.directory):
+            if version.name.startswith(".") or not version.is_dir():
+                continue
+            for bucket in _scandir(version.path):
+                for entry in _scandir(bucket.path):
+                    try:
+                        used = os.stat(os.path.join(entry.path, _META)).st_mtime
+                        size = sum(f.stat().st_size for f in os.scandir(entry.path))
+                    except OSError:
+                        continue
+                    entries.append((used, size, entry.path))
+        return entries
+
+    def evict(self):
+        """
+        디렉터리를 훑어 전체 크기가 max_bytes 이하가 되도록 가장 오래 사용되지 않은 항목부터 지운다.
+        지운 항목 수를 돌려준다. put은 추적한 전체 크기가 max_bytes를 넘거나 동기화 간격이 지났을 때만 호출한다.
+        """
+        synced = time.monotonic()
+        entries = self._entries()
+        total = sum(size for _, size, _ in entries)
+        removed = 0
+        trash = os.path.join(self.directory, ".trash")
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            os.makedirs(trash, exist_ok=True)
+            target = os.path.join(trash, uuid.uuid4().hex)
+            try:
+                os.rename(path, target)  # 다른 프로세스가 이미 지웠으면 실패한다
+            except OSError:
+                continue
+            shutil.rmtree(target, ignore_errors=True)
+            total -= size
+            removed += 1
+        self._remove_stale()
+        with self._lock:
+            self._evictions += removed
+            self._entry_count = len(entries) - removed
+            self._bytes = total
+            self._synced = synced
+        return removed
+
+    def _remove_stale(self):
+        # 중단된 프로세스가 남긴 임시/삭제 대기 디렉터리
+        now = time.time()
+        for name in (".tmp", ".trash"):
+            for entry in _scandir(os.path.join(self.directory, name)):
+                try:
+                    if now - entry.stat().st_mtime > _STALE_SECONDS:
+                        shutil.rmtree(entry.path, ignore_errors=True)
+                except OSError:
+                    pass
+
+    def clear(self):
+        """모든 항목을 지운다."""
+        for _, _, path in self._entries():
+            shutil.rmtree(path, ignore_errors=True)
+        with self._lock:
+            self._bytes = None
+
+    def stats(self, refresh=False):
+        """
+        이 프로세스의 적중/실패/쓰기/정리 횟수와 저장소 전체의 항목 수·크기.
+
+        항목 수·크기는 마지막으로 디렉터리를 훑은 값에 이 프로세스가 그 뒤에 쓴 항목을 더한 추정치이다 (다른
+        프로세스의 쓰기는 다음 동기화 때 반영된다). 아직 훑은 적이 없거나 refresh가 True이면 디렉터리를 훑는다.
+        """
+        with self._lock:
+            scan = refresh or self._bytes is None
+        if scan:
+            synced = time.monotonic()
+            entries = self._entries()
+            with self._lock:
+                self._entry_count = len(entries)
+                self._bytes = sum(size for _, size, _ in entries)
+                self._synced = synced
+        with self._lock:
+            return StoreStats(self._hits, self._misses, self._writes, self._evictions,
+                              self._entry_count, self._bytes, self.max_bytes)
+
+
+def _scandir(path):
+    try:
+        return list(os.scandir(path))
+    except OSError:
+        return []
+
+
+def _encode(value, arrays):
+    # 값을 JSON 구조로 바꾸고, 배열은 arrays에 모아 번호로 참조한다
+    if isinstance(value, np.ndarray):
+        if value.dtype.hasobject:
+            raise TypeError("object arrays cannot be stored")
+        arrays.append(value)
+        return {"array": len(arrays) - 1}
+    if isinstance(value, np.generic):
+        value = value.item()
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return {"value": value}
+    if isinstance(value, tuple) and hasattr(value, "_fields"):
+        cls = type(value)
+        return {"namedtuple": f"{cls.__module__}:{cls.__qualname__}", "items": [_encode(v, arrays) for v in value]}
+    if isinstance(value, (tuple, list)):
+        return {"tuple" if isinstance(value, tuple) else "list": [_encode(v, arrays) for v in value]}
+    if isinstance(value, dict) and all(isinstance(k, str) for k in value):
+        return {"dict": [[k, _encode(v, arrays)] for k, v in value.items()]}
+    raise TypeError(f"cannot store value of type {type(value).__name__}")
+
+
+def _decode(node, directory):
+    if "array" in node:
+        return np.load(os.path.join(directory, f"{node['array']}.npy"), mmap_mode="r", allow_pickle=False)
+    if "value" in node:
+        return node["value"]
+    if "namedtuple" in node:
+        module, qualname = node["namedtuple"].split(":")
+        # 임의의 모듈을 import 하지 않도록 이 패키지의 결과 형식만 복원한다
+        if module.split(".")[0] != __name__.split(".")[0]:
+            raise TypeError(f"refusing to restore {node['namedtuple']}")
+        cls = importlib.import_module(module)
+        for part in qualname.split("."):
+            cls = getattr(cls, part)
+        return cls(*(_decode(v, directory) for v in node["items"]))
+    if "tuple" in node:
+        return tuple(_decode(v, directory) for v in node["tuple"])
+    if "list" in node:
+        return [_decode(v, directory) for v in node["list"]]
+    if "dict" in node:
+        return {k: _decode(v, directory) for k, v in node["dict"]}
+    raise ValueError(f"unknown store node: {sorted(node)}")
+
+
+def _default_store():
+    directory = default_store_dir()
+    if directory is None:
+        return None
+    return ResultStore(directory, max_bytes=env_number("SEMISIM_STORE_MAX_BYTES", int, 2**30))
+
+
+# 프로세스 기본 저장소 (같은 디렉터리를 쓰는 모든 프로세스가 공유, 비활성화하면 None)
+default_store = _default_store()
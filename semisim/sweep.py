@@ -0,0 +1,220 @@
+"""
+공정 변동(Monte Carlo) 스윕 엔진.
+
+N_A, N_D, T, W, L을 주어진 분포에서 샘플링하여 MOSFET 드레인 전류의 통계를 구한다.
+샘플 공간을 고정 크기 청크로 나누어 프로세스 풀에서 병렬로 계산하고, 청크가 끝날 때마다
+부분 히스토그램과 백분위수를 담은 진행 상황을 돌려준다.
+
+각 청크는 SeedSequence(seed).spawn()으로 만든 고유 시드를 사용하므로, 워커 수나 청크 완료 순서와
+관계없이 같은 seed에서는 항상 같은 결과가 나온다.
+
+    >>> from semisim.sweep import LogNormal, Normal, monte_carlo
+    >>> for progress in monte_carlo({"N_A": LogNormal(1e16, 0.05), "L": Normal(10, 0.2)}, n_samples=10**5):
+    ...     print(progress.n_done, progress.percentiles[50])
+"""
+import multiprocessing
+import os
+from collections import namedtuple
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+import numpy as np
+
+from semisim.mosfet import calculate_id
+
+# 분포를 지정하지 않은 파라미터의 기본값 (앱의 기본 슬라이더 값)
+DEFAULT_PARAMS = {"N_A": 1e16, "N_D": 1e19, "T": 300.0, "W": 10.0, "L": 10.0}
+
+# 히스토그램 구간을 정하는 예비 샘플 수
+PILOT_SIZE = 2000
+
+MonteCarloProgress = namedtuple(
+    "MonteCarloProgress",
+    ["n_done", "n_total", "counts", "edges", "percentiles", "mean", "std", "values"],
+)
+
+
+class Fixed:
+    """고정 값."""
+
+    def __init__(self, value):
+        self.value = value
+
+    def sample(self, rng, n):
+        return np.full(n, self.value, dtype=float)
+
+
+class Normal:
+    """정규 분포 (mean, std)."""
+
+    def __init__(self, mean, std):
+        self.mean = mean
+        self.std = std
+
+    def sample(self, rng, n):
+        return rng.normal(self.mean, self.std, n)
+
+
+class LogNormal:
+    """로그 정규 분포. median 주변에서 log10 값이 표준편차 sigma_decades로 변동한다 (도핑 농도용)."""
+
+    def __init__(self, median, sigma_decades):
+        self.median = median
+        self.sigma_decades = sigma_decades
+
+    def sample(self, rng, n):
+        return self.median * 10.0 ** rng.normal(0.0, self.sigma_decades, n)
+
+
+class Uniform:
+    """균등 분포 [low, high)."""
+
+    def __init__(self, low, high):
+        self.low = low
+        self.high = high
+
+    def sample(self, rng, n):
+        return rng.uniform(self.low, self.high, n)
+
+
+def sample_parameters(distributions, n, rng):
+    """DEFAULT_PARAMS의 각 파라미터에 대해 n개의 샘플을 만든다. 분포가 없는 파라미터는 기본값으로 채운다."""
+    unknown = set(distributions) - set(DEFAULT_PARAMS)
+    if unknown:
+        raise ValueError(f"unknown parameters: {sorted(unknown)}")
+    samples = {}
+    # 파라미터 순서를 고정해야 같은 시드에서 같은 샘플이 나온다
+    for name, default in DEFAULT_PARAMS.items():
+        dist = distributions.get(name)
+        if dist is None:
+            dist = Fixed(default)
+        elif not hasattr(dist, "sample"):
+            dist = Fixed(dist)
+        samples[name] = dist.sample(rng, n)
+    return samples
+
+
+def _run_chunk(seed_seq, n, distributions, Vgs, Vds):
+    rng = np.random.default_rng(seed_seq)
+    p = sample_parameters(distributions, n, rng)
+    return calculate_id(Vgs, Vds, p["W"], p["L"], p["N_D"], p["N_A"], p["T"])
+
+
+class _Summary:
+    """
+    청크마다 갱신하는 요약: 고정 구간 히스토그램과 평균/분산을 위한 합계.
+
+    구간은 작은 예비 샘플의 범위에 양쪽 여유를 두어 정하고 이후에는 바꾸지 않는다 (범위 밖의 값은 양 끝 구간에
+    더한다). 예비 샘플도 seed로 정해지므로 구간은 워커 수나 청크 완료 순서와 관계없다.
+    중간 결과의 백분위수는 히스토그램에서 보간한 근사값이다.
+    """
+
+    def __init__(self, pilot, bins):
+        low, high = float(pilot.min()), float(pilot.max())
+        margin = 0.1 * (high - low) or 0.5 * abs(high) or 1.0
+        self.edges = np.linspace(low - margin, high + margin, bins + 1)
+        self.counts = np.zeros(bins, dtype=np.int64)
+        self.shift = float(pilot.mean())  # 합계의 자릿수 손실을 줄이기 위해 뺀다
+        self.n = 0
+        self.sum = 0.0
+        self.sum_sq = 0.0
+
+    def add(self, values):
+        index = np.clip(np.searchsorted(self.edges, values, side="right") - 1, 0, self.counts.size - 1)
+        self.counts += np.bincount(index, minlength=self.counts.size)
+        d = values - self.shift
+        self.n += values.size
+        self.sum += float(d.sum())
+        self.sum_sq += float((d * d).sum())
+
+    def progress(self, n_total, percentiles):
+        mean = self.sum / self.n
+        cumulative = np.concatenate([[0], np.cumsum(self.counts)])
+        approx = np.interp(np.asarray(percentiles) / 100 * self.n, cumulative, self.edges)
+        return MonteCarloProgress(
+            n_done=self.n,
+            n_total=n_total,
+            counts=self.counts.copy(),
+            edges=self.edges,
+            percentiles=dict(zip(percentiles, approx)),
+            mean=self.shift + mean,
+            std=float(np.sqrt(max(self.sum_sq / self.n - mean * mean, 0.0))),
+            values=None,
+        )
+
+
+def _final_progress(summary, chunks, n_total, percentiles):
+    # 마지막 결과: 전체 샘플에서 정확한 백분위수/평균/표준편차를 구한다
+    values = np.concatenate(chunks)
+    return summary.progress(n_total, percentiles)._replace(
+        percentiles=dict(zip(percentiles, np.percentile(values, percentiles))),
+        mean=float(values.mean()),
+        std=float(values.std()),
+        values=values,
+    )
+
+
+def monte_carlo(distributions, n_samples, Vgs=1.5, Vds=5.0, seed=0, chunk_size=50_000,
+                workers=None, bins=50, percentiles=(1, 5, 50, 95, 99), mp_context=None):
+    """
+    공정 변동에 따른 드레인 전류 분포를 계산하는 제너레이터.
+
+    Parameters:
+    - distributions: 파라미터 이름 (N_A, N_D, T, W, L) -> 분포 객체(sample(rng, n) 메서드) 또는 고정 값
+    - n_samples: 총 샘플 수 (1 이상)
+    - Vgs, Vds: 바이어스 (V)
+    - seed: 난수 시드
+    - chunk_size: 한 작업 단위의 샘플 수 (1 이상)
+    - workers: 프로세스 수. None이면 CPU 코어 수, 1이면 현재 프로세스에서 순차 실행한다.
+    - bins: 히스토그램 구간 수
+    - percentiles: 계산할 백분위수
+    - mp_context: multiprocessing 컨텍스트. 기본은 "spawn" (Streamlit 서버처럼 스레드가 있는 프로세스에서도 안전).
+
+    Yields:
+    - 청크가 하나 끝날 때마다 그때까지의 MonteCarloProgress. 히스토그램 구간은 시작 전에 별도 시드로 뽑은
+      예비 샘플(최대 PILOT_SIZE개)의 범위로 정한 뒤 고정되므로 청크가 끝나는 순서와 관계없다. 중간 결과의
+      백분위수는 히스토그램에서 구한 근사값이고 values는 None이다. 마지막 값이 최종 결과이며
+      백분위수/평균/표준편차는 전체 샘플에서 구한 정확한 값, values는 청크 순서대로 이어 붙인 전체 Id 샘플이다.
+    """
+    if n_samples < 1:
+        raise ValueError(f"n_samples must be at least 1, got {n_samples}")
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be at least 1, got {chunk_size}")
+    sizes = [chunk_size] * (n_samples // chunk_size)
+    if n_samples % chunk_size:
+        sizes.append(n_samples % chunk_size)
+    # 마지막 시드는 히스토그램 구간을 정하는 예비 샘플용이다 (앞의 청크 시드는 개수와 관계없이 같다)
+    *seeds, pilot_seed = np.random.SeedSequence(seed).spawn(len(sizes) + 1)
+    chunks = [None] * len(sizes)
+    summary = _Summary(_run_chunk(pilot_seed, min(PILOT_SIZE, n_samples), distributions, Vgs, Vds), bins)
+
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(sizes) == 1:
+        for i, (seed_seq, n) in enumerate(zip(seeds, sizes)):
+            chunks[i] = _run_chunk(seed_seq, n, distributions, Vgs, Vds)
+            summary.add(chunks[i])
+            if i + 1 < len(sizes):
+                yield summary.progress(n_samples, percentiles)
+        yield _final_progress(summary, chunks, n_samples, percentiles)
+        return
+
+    if mp_context is None:
+        mp_context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=min(workers, len(sizes)), mp_context=mp_context) as pool:
+        pending = {
+            pool.submit(_run_chunk, seed_seq, n, distributions, Vgs, Vds): i
+            for i, (seed_seq, n) in enumerate(zip(seeds, sizes))
+        }
+        try:
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    i = pending.pop(future)
+                    chunks[i] = future.result()
+                    summary.add(chunks[i])
+                if pending:
+                    yield summary.progress(n_samples, percentiles)
+            yield _final_progress(summary, chunks, n_samples, percentiles)
+        finally:
+            # 소비자가 중간에 멈추면 남은 작업을 취소한다
+            for future in pending:
+                future.cancel()
@@ -0,0 +1,218 @@
+"""
+웨이퍼 지도 시뮬레이션: 공간적으로 상관된 공정 변동을 가진 웨이퍼 한 장의 다이 전체(10^4~10^5개)를 계산한다.
+
+- 다이 배치: 지름과 다이 크기로 정한 정사각 격자에서, 가장자리 제외 영역 안에 완전히 들어가는 다이만 쓴다.
+- 공정 변동: 다이마다 N_A, N_D, Cox, Vth를 정하며, 각 파라미터의 변동은 세 성분의 합이다.
+  (1) 공간 상관 성분: 상관 길이 correlation (mm)의 가우시안 무작위 장. 백색 잡음을 FFT로 가우시안 필터링하여
+      만들며, 두 다이 사이의 상관은 exp(-d²/(2·correlation²))이다.
+  (2) 방사형 성분: 웨이퍼 중심에서 가장자리로 (r/R)²에 비례하여 변하는 체계적 변화 (증착/주입 균일도).
+  (3) 국소 성분: 다이마다 독립인 변동.
+  단위는 VARIATION_UNITS를 따른다 (도핑은 log10 decade, Cox는 상대 비율, Vth는 V).
+- 평가: 모든 다이의 Id_sat를 calculate_id 한 번의 호출로 계산한다.
+- 수율: Id_sat가 규격 범위 [low, high] 안에 있는 다이의 비율과, 같은 면적의 동심원 구역별 통계.
+
+    >>> dies = wafer_dies(diameter=150, die_size=1.0)
+    >>> process = sample_wafer(dies, {"N_A": 1e16, "N_D": 1e19, "Cox": COX, "Vth": VTH},
+    ...                        {"Vth": Variation(sigma=0.03, radial=0.05)}, correlation=20, seed=0)
+    >>> Id = wafer_id_sat(process, Vgs=2.0, W=10, L=10)
+    >>> wafer_yield(dies, Id, 20e-6, 40e-6).yield_
+
+NumPy만 사용한다.
+"""
+from collections import namedtuple
+
+import numpy as np
+
+from semisim.mobility_map import block_starts
+from semisim.mosfet import COX, VTH, calculate_id
+
+# 변동 파라미터 -> 변동 값의 단위
+VARIATION_UNITS = {"N_A": "decade", "N_D": "decade", "Cox": "fraction", "Vth": "V"}
+# Id_sat를 계산하는 드레인 전압 (V). 앱의 Vgs 범위(0~5 V)에서 항상 포화 영역이다.
+ID_SAT_VDS = 5.0
+
+WaferDies = namedtuple("WaferDies", ["x", "y", "row", "col", "x_edges", "y_edges", "radius"])
+WaferProcess = namedtuple("WaferProcess", ["N_A", "N_D", "Cox", "Vth"])
+ZoneStats = namedtuple(
+    "ZoneStats", ["r_inner", "r_outer", "count", "passed", "yield_", "mean", "std", "p05", "p50", "p95"])
+WaferYield = namedtuple("WaferYield", ["passed", "yield_", "low", "high", "zones"])
+
+
+class Variation(namedtuple("Variation", ["sigma", "radial", "local"], defaults=(0.0, 0.0, 0.0))):
+    """
+    파라미터 하나의 변동 (단위는 VARIATION_UNITS).
+
+    - sigma: 공간 상관 성분의 표준편차
+    - radial: 중심 대비 가장자리(r = R)의 체계적 변화
+    - local: 다이마다 독립인 성분의 표준편차
+    """
+
+
+def wafer_dies(diameter=150.0, die_size=1.0, edge_exclusion=3.0):
+    """
+    웨이퍼의 다이 배치.
+
+    Parameters:
+    - diameter: 웨이퍼 지름 (mm)
+    - die_size: 정사각 다이 한 변 (mm)
+    - edge_exclusion: 가장자리 제외 폭 (mm)
+
+    Returns:
+    - WaferDies(x, y 다이 중심 (mm), row, col 격자 인덱스, x_edges, y_edges 격자 칸 경계 (mm),
+      radius 사용 영역 반지름 (mm))
+    """
+    radius = diameter / 2 - edge_exclusion
+    if radius <= 0 or die_size <= 0:
+        raise ValueError("wafer has no usable area")
+    n = int(np.ceil(2 * radius / die_size))
+    edges = (np.arange(n + 1) - n / 2) * die_size
+    centers = (edges[:-1] + edges[1:]) / 2
+    # 다이 중심에서 가장 먼 모서리까지의 거리가 반지름 이하인 다이만 쓴다
+    far = np.abs(centers) + die_size / 2
+    inside = far[:, None] ** 2 + far[None, :] ** 2 <= radius ** 2
+    row, col = np.nonzero(inside)
+    return WaferDies(centers[col], centers[row], row, col, edges, edges, radius)
+
+
+def correlated_field(shape, correlation, rng, count=1):
+    """
+    평균 0, 분산 1인 2차원 가우시안 무작위 장 count개 (count, ny, nx).
+
+    Parameters:
+    - shape: (ny, nx) 격자 크기
+    - correlation: 상관 길이 (격자 칸 단위). 0이면 백색 잡음.
+    - rng: np.random.Generator
+    """
+    ny, nx = shape
+    # 주기 경계로 반대편 가장자리끼리 상관되지 않도록 상관 길이의 3배만큼 덧붙여 계산한다
+    pad = int(np.ceil(3 * correlation))
+    py, px = _fft_size(ny + pad), _fft_size(nx + pad)
+    noise = rng.standard_normal((count, py, px))
+    if correlation <= 0:
+        return noise[:, :ny, :nx]
+    # 표준편차 correlation/√2인 가우시안 필터의 주파수 응답 (필터링한 장의 상관: exp(-d²/(2·correlation²)))
+    fy, fx = np.fft.fftfreq(py)[:, None], np.fft.fftfreq(px)[None, :]
+    response = np.exp(-(np.pi * correlation) ** 2 * (fy ** 2 + fx ** 2))
+    norm = np.sqrt((response ** 2).mean())
+    half = response[:, : px // 2 + 1]
+    field = np.fft.irfft2(np.fft.rfft2(noise) * half, s=(py, px))
+    return field[:, :ny, :nx] / norm
+
+
+def _fft_size(n):
+    # n 이상인 가장 작은 2^a·3^b·5^c (소수 크기의 FFT는 수십 배 느리다)
+    size = n
+    while True:
+        m = size
+        for p in (2, 3, 5):
+            while m % p == 0:
+                m //= p
+        if m == 1:
+            return size
+        size += 1
+
+
+def sample_wafer(dies, nominal, variations, correlation=20.0, seed=0):
+    """
+    다이마다 공정 파라미터를 만든다.
+
+    Parameters:
+    - dies: WaferDies
+    - nominal: 파라미터 이름 -> 중심 값 (N_A, N_D cm^-3, Cox F/cm^2, Vth V). 빠진 Cox/Vth는 COX/VTH.
+    - variations: 파라미터 이름 -> Variation (또는 같은 순서의 튜플). 없는 파라미터는 변동하지 않는다.
+    - correlation: 공간 상관 성분의 상관 길이 (mm)
+    - seed: 난수 시드 (같은 시드와 다이 배치에서는 항상 같은 웨이퍼가 나온다)
+
+    Returns:
+    - WaferProcess(N_A, N_D, Cox, Vth) 다이별 배열
+    """
+    unknown = set(variations) - set(VARIATION_UNITS)
+    if unknown:
+        raise ValueError(f"unknown parameters: {sorted(unknown)} (expected some of {list(VARIATION_UNITS)})")
+    nominal = dict({"Cox": COX, "Vth": VTH}, **nominal)
+    rng = np.random.default_rng(seed)
+    die_size = dies.x_edges[1] - dies.x_edges[0]
+    shape = (len(dies.y_edges) - 1, len(dies.x_edges) - 1)
+    # 파라미터 순서대로 장을 만들어 변동을 주지 않은 파라미터가 있어도 같은 시드의 다른 파라미터는 그대로다
+    fields = correlated_field(shape, correlation / die_size, rng, count=len(VARIATION_UNITS))[:, dies.row, dies.col]
+    local = rng.standard_normal((len(VARIATION_UNITS), dies.x.size))
+    r2 = (dies.x ** 2 + dies.y ** 2) / dies.radius ** 2
+
+    values = {}
+    for i, (name, unit) in enumerate(VARIATION_UNITS.items()):
+        v = Variation(*variations.get(name, ()))
+        delta = v.sigma * fields[i] + v.radial * r2 + v.local * local[i]
+        if unit == "decade":
+            values[name] = nominal[name] * 10.0 ** delta
+        elif unit == "fraction":
+            values[name] = nominal[name] * (1 + delta)
+        else:
+            values[name] = nominal[name] + delta
+    return WaferProcess(**values)
+
+
+def wafer_id_sat(process, Vgs, W, L, T=300, Vds=ID_SAT_VDS):
+    """모든 다이의 포화 드레인 전류 Id_sat (A)를 calculate_id 한 번으로 계산한다."""
+    return calculate_id(Vgs, Vds, W, L, process.N_D, process.N_A, T, Vth=process.Vth, Cox=process.Cox)
+
+
+def wafer_yield(dies, values, low, high, zones=4):
+    """
+    규격 범위에 대한 수율과 구역별 통계.
+
+    Parameters:
+    - dies: WaferDies
+    - values: 다이별 값 (예: Id_sat)
+    - low, high: 규격 범위 (None이면 그쪽 한계 없음)
+    - zones: 같은 면적의 동심원 구역 수 (중심부터)
+
+    Returns:
+    - WaferYield(passed 다이별 bool, yield_ 전체 수율, low, high,
+      zones ZoneStats: 구역별 반지름 범위, 다이 수, 합격 다이 수, 수율, 평균, 표준편차, 5/50/95 백분위수)
+    """
+    values = np.asarray(values)
+    passed = np.isfinite(values)
+    if low is not None:
+        passed &= values >= low
+    if high is not None:
+        passed &= values <= high
+
+    bounds = dies.radius * np.sqrt(np.arange(zones + 1) / zones)
+    zone = np.minimum(np.searchsorted(bounds, np.hypot(dies.x, dies.y), side="right") - 1, zones - 1)
+    count = np.bincount(zone, minlength=zones)
+    n_passed = np.bincount(zone, weights=passed, minlength=zones).astype(int)
+    stats = np.full((5, zones), np.nan)
+    for k in range(zones):
+        v = values[zone == k]
+        if v.size:
+            stats[:, k] = (v.mean(), v.std(), *np.percentile(v, [5, 50, 95]))
+    with np.errstate(invalid="ignore", divide="ignore"):
+        zone_yield = n_passed / count
+    return WaferYield(passed, passed.mean() if passed.size else np.nan, low, high,
+                      ZoneStats(bounds[:-1], bounds[1:], count, n_passed, zone_yield, *stats))
+
+
+def wafer_grid(dies, values, cells=None):
+    """
+    다이별 값을 (ny, nx) 격자에 놓는다 (다이가 없는 칸은 NaN).
+
+    cells를 주면 축당 최대 cells칸으로 블록 평균한 격자를 돌려준다 (다이가 있는 칸만 평균한다).
+
+    Returns:
+    - (x_edges, y_edges, 격자 값)
+    """
+    shape = (len(dies.y_edges) - 1, len(dies.x_edges) - 1)
+    grid = np.full(shape, np.nan)
+    grid[dies.row, dies.col] = values
+    if cells is None or max(shape) <= cells:
+        return dies.x_edges, dies.y_edges, grid
+    x_starts, _ = block_starts(shape[1], cells)
+    y_starts, _ = block_starts(shape[0], cells)
+    finite = np.isfinite(grid)
+
+    def block_sum(a):
+        return np.add.reduceat(np.add.reduceat(a, x_starts, axis=1), y_starts, axis=0)
+
+    with np.errstate(invalid="ignore"):
+        coarse = block_sum(np.where(finite, grid, 0.0)) / block_sum(finite.astype(float))
+    return dies.x_edges[np.append(x_starts, shape[1])], dies.y_edges[np.append(y_starts, shape[0])], coarse
@@ -0,0 +1,26 @@
+"""
+앱 페이지 모듈.
+
+app.py는 매 재실행마다 위에서부터 다시 실행되므로, 모든 페이지의 코드와 의존성을 app.py에 두면 보고 있지 않은
+페이지의 import 비용까지 매번 치르게 된다. 각 페이지는 자신의 의존성만 import 하는 모듈로 나누고,
+선택된 페이지의 모듈만 처음 사용할 때 import 한다. 이후의 재실행에서는 이미 import 된 모듈의 render()만 호출한다.
+
+    >>> import views
+    >>> views.render("BJT", use_matplotlib=False, timer=null_timer)
+"""
+import importlib
+
+# st.session_state.selected_device 값 -> 페이지 모듈
+PAGES = {
+    "MOSFET_3D": "views.mosfet_3d",
+    "MOSFET_DESC": "views.mosfet_desc",
+    "BJT": "views.bjt",
+}
+
+
+def render(page, **kwargs):
+    """page의 모듈을 (처음이면 import 하여) render(**kwargs)를 호출한다. 알 수 없는 페이지(예: None)면 아무것도 하지 않는다."""
+    module = PAGES.get(page)
+    if module is None:
+        return
+    importlib.import_module(module).render(**kwargs)
@@ -0,0 +1,145 @@
+"""
+BJT 시뮬레이터 페이지: 공통 베이스 입력/출력 특성, Ebers–Moll 표면, 바이어스 회로.
+"""
+import streamlit as st
+
+from semisim.background import POLL_SECONDS, refinement_levels
+from semisim.stages import bjt_pipeline
+
+
+def render(use_matplotlib, timer):
+    """
+    페이지를 그린다.
+
+    Parameters:
+    - use_matplotlib: True이면 그래프를 matplotlib 이미지로, False이면 브라우저 차트로 그린다
+    - timer: 구간 이름을 받아 시간 측정 컨텍스트를 돌려주는 함수 (Profiler.timer 또는 null_timer)
+    """
+    st.title("BJT Common-Base Configuration Simulator")
+
+    default_params = {
+        "I_S": 1e-14,
+        "V_T": 0.026,
+        "V_CB_min": 0,
+        "V_CB_max": 20,
+        "I_E_min": 0.001,
+        "I_E_max": 0.005
+    }
+
+    # Reset 버튼
+    if st.sidebar.button("Reset to Defaults"):
+        I_S = default_params["I_S"]
+        V_T = default_params["V_T"]
+        V_CB_min = default_params["V_CB_min"]
+        V_CB_max = default_params["V_CB_max"]
+        I_E_min = default_params["I_E_min"]
+        I_E_max = default_params["I_E_max"]
+    else:
+        st.sidebar.header("Adjust Input Characteristics Parameters")
+        I_S = st.sidebar.slider("Saturation Current (I_S, pA)", 0.001, 1.0, default_params["I_S"], step=0.001)
+        V_T = st.sidebar.slider("Thermal Voltage (V_T, V)", 0.01, 0.05, default_params["V_T"], step=0.001)
+        V_CB_min = st.sidebar.slider("Min Collector-Base Voltage (V_CB, V)", 0, 20, default_params["V_CB_min"], step=1)
+        V_CB_max = st.sidebar.slider("Max Collector-Base Voltage (V_CB, V)", 0, 20, default_params["V_CB_max"], step=1)
+        I_E_min = st.sidebar.slider("Min Emitter Current (I_E, A)", 1e-4, 0.01, default_params["I_E_min"], step=1e-4, format="%.4f")
+        I_E_max = st.sidebar.slider("Max Emitter Current (I_E, A)", 1e-4, 0.01, default_params["I_E_max"], step=1e-4, format="%.4f")
+
+    results = bjt_pipeline.run(
+        dict(I_S=I_S, V_T=V_T, V_CB_min=V_CB_min, V_CB_max=V_CB_max, I_E_min=I_E_min, I_E_max=I_E_max),
+        st.session_state.pipeline_state,
+        targets=["input_figure", "output_figure"] if use_matplotlib else ["input_chart", "output_chart"],
+        timer=timer,
+    )
+
+    col1, col2 = st.columns(2)
+
+    # Input Characteristics
+    with col1:
+        st.subheader("Input Characteristics")
+        with timer("emit.pyplot" if use_matplotlib else "emit.vega_lite_chart"):
+            if use_matplotlib:
+                st.pyplot(results["input_figure"])
+            else:
+                st.vega_lite_chart(spec=results["input_chart"], use_container_width=True)
+
+    # Output Characteristics
+    with col2:
+        st.subheader("Output Characteristics")
+        with timer("emit.pyplot" if use_matplotlib else "emit.vega_lite_chart"):
+            if use_matplotlib:
+                st.pyplot(results["output_figure"])
+            else:
+                st.vega_lite_chart(spec=results["output_chart"], use_container_width=True)
+
+    # Ebers–Moll 표면: (V_BE, V_CB) 또는 (I_E, V_CB) 평면 전체를 계산해 등고선 지도로 그린다
+    with st.expander("Ebers–Moll 표면 (등고선 지도)"):
+        plane = st.radio("평면", ["(V_BE, V_CB) → I_E", "(I_E, V_CB) → I_C"], horizontal=True)
+        alpha_F = st.slider("순방향 전류 이득 (α_F)", 0.900, 0.999, 0.990, step=0.001, format="%.3f")
+        alpha_R = st.slider("역방향 전류 이득 (α_R)", 0.10, 0.90, 0.50, step=0.05)
+        V_BE_max = st.slider("최대 V_BE (V)", 0.5, 3.0, 1.0, step=0.1)
+        surface_V_CB = st.slider("V_CB 범위 (V)", -2.0, 20.0, (-0.5, 10.0), step=0.5)
+        surface_points = st.select_slider("격자 해상도 (축당 점 수)", [100, 200, 500, 1000], value=500)
+        # 표면 계산과 그리기는 무거우므로 요청한 경우에만 작업 스레드에서 실행한다.
+        # 거친 격자의 결과를 먼저 그리고 해상도를 높여 가며 갱신하며, 파라미터가 바뀌면 이전 작업은 취소된다.
+        if st.checkbox("표면 그리기"):
+            target = (("em_input_" if plane.startswith("(V_BE") else "em_output_")
+                      + ("figure" if use_matplotlib else "chart"))
+            surface_params = dict(I_S=I_S, V_T=V_T, alpha_F=alpha_F, alpha_R=alpha_R, V_BE_max=V_BE_max,
+                                  I_E_min=I_E_min, I_E_max=I_E_max, surface_V_CB=surface_V_CB)
+            surface_job = st.session_state.jobs.submit(
+                "em_surface", (target, surface_points, tuple(surface_params.items())), bjt_pipeline.refine,
+                (surface_params, target, "surface_points", refinement_levels(surface_points)),
+            )
+            surface_plot = st.empty()
+            surface_status = st.empty()
+            status = "격자 계산 중…"
+            for update in surface_job.updates(poll=POLL_SECONDS):
+                if update is not None:
+                    points, surface = update.value
+                    with timer("emit.pyplot" if use_matplotlib else "emit.vega_lite_chart"):
+                        if use_matplotlib:
+                            surface_plot.pyplot(surface)
+                        else:
+                            surface_plot.vega_lite_chart(spec=surface, use_container_width=True)
+                    refining = " · 더 세밀한 격자 계산 중…" if points < surface_points else ""
+                    status = f"격자 {points}×{points}{refining}"
+                # 새 값이 없어도 상태 줄을 다시 그려, 그 사이의 슬라이더 조작이 다음 해상도를 기다리지 않고 반영되게 한다
+                surface_status.caption(status)
+            if use_matplotlib:
+                st.caption("색: log10 |전류| · 흰 점선: 전류의 부호가 바뀌는 경계 (포화 영역)")
+            else:
+                st.caption("색: log10 |전류| (축당 최대 100칸으로 평균) · 빈 칸: 전류가 0인 점 · "
+                           "전류의 부호가 바뀌는 경계: Matplotlib 모드에서만 표시")
+        else:
+            st.session_state.jobs.cancel("em_surface")
+
+    # 바이어스 회로: 이미터 저항 R_E를 거쳐 -V_EE, 컬렉터 저항 R_C를 거쳐 V_CC에 연결한 공통 베이스 회로
+    # (α_F, α_R은 위의 Ebers–Moll 설정을 사용한다)
+    with st.expander("바이어스 회로 (R_E, R_C)"):
+        V_EE = st.slider("이미터 전원 전압 (V_EE) [V]", 0.0, 10.0, 5.0, step=0.1)
+        V_CC = st.slider("컬렉터 전원 전압 (V_CC) [V]", 0.0, 20.0, 10.0, step=0.5)
+        R_E = st.slider("이미터 저항 (R_E) [kΩ]", 0.1, 10.0, 1.0, step=0.1)
+        R_C = st.slider("컬렉터 저항 (R_C) [kΩ]", 0.0, 10.0, 2.0, step=0.1)
+        bias = bjt_pipeline.run(
+            dict(I_S=I_S, V_T=V_T, alpha_F=alpha_F, alpha_R=alpha_R, V_EE=V_EE, V_CC=V_CC, R_E=R_E * 1e3,
+                 R_C=R_C * 1e3),
+            st.session_state.pipeline_state,
+            targets=["cb_bias_point"] + (["cb_load_line_figure", "cb_bias_sweep_figure"] if use_matplotlib
+                                         else ["cb_load_line_chart", "cb_bias_sweep_chart"]),
+            timer=timer,
+        )
+        op = bias["cb_bias_point"]
+        st.caption(
+            f"동작점: I_E = {float(op.I_E) * 1e3:.3f} mA · I_C = {float(op.I_C) * 1e3:.3f} mA · "
+            f"V_BE = {float(op.V_BE):.3f} V · V_CB = {float(op.V_CB):.3f} V ({int(op.iterations)}회 반복)"
+        )
+        col1, col2 = st.columns(2)
+        with col1, timer("emit.pyplot" if use_matplotlib else "emit.vega_lite_chart"):
+            if use_matplotlib:
+                st.pyplot(bias["cb_load_line_figure"])
+            else:
+                st.vega_lite_chart(spec=bias["cb_load_line_chart"], use_container_width=True)
+        with col2, timer("emit.pyplot" if use_matplotlib else "emit.vega_lite_chart"):
+            if use_matplotlib:
+                st.pyplot(bias["cb_bias_sweep_figure"])
+            else:
+                st.vega_lite_chart(spec=bias["cb_bias_sweep_chart"], use_container_width=True)
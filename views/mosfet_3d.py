@@ -0,0 +1,247 @@
+"""
+MOSFET 3D 시뮬레이터 페이지: I-V 곡선, 공정 변동 Monte Carlo, 바이어스 회로, 이동도 지도, 웨이퍼 지도.
+"""
+import numpy as np
+import streamlit as st
+
+from semisim.background import POLL_SECONDS
+from semisim.mosfet import calculate_id
+from semisim.stages import diffusion_pipeline, mobility_map_pipeline, mosfet_pipeline, wafer_pipeline
+from semisim.wafer import ID_SAT_VDS
+
+
+def render(use_matplotlib, timer):
+    """
+    페이지를 그린다.
+
+    Parameters:
+    - use_matplotlib: True이면 그래프를 matplotlib 이미지로, False이면 브라우저 차트로 그린다
+    - timer: 구간 이름을 받아 시간 측정 컨텍스트를 돌려주는 함수 (Profiler.timer 또는 null_timer)
+    """
+    st.sidebar.header("⚙️ MOSFET 파라미터")
+    st.sidebar.markdown("---")
+    W = st.sidebar.slider("채널 폭 (W) [µm]", 0.1, 20.0, 1000.0, step=0.5)
+    L = st.sidebar.slider("채널 길이 (L) [µm]", 0.01, 20.0, 10.0, step=0.5)
+    Vgs = st.sidebar.slider("Gate-Source Voltage (Vgs) [V]", 0.0, 5.0, 1.5, step=0.1)
+   
+    N_A = st.sidebar.slider(
+    "p형 도핑 농도 (cm^-3)", 
+    min_value=1e15, max_value=1e17, value=1e16, format="%.1e"
+    )
+   
+    # 공정 15단계(이온 주입후 확산)의 조건을 정했으면, 그 확산 분포의 접합 내 평균 농도를 N_D로 쓸 수 있다
+    # (접합 깊이는 이 페이지의 p형 도핑 농도 N_A로 다시 계산한다). 이 N_A에서 접합이 생기지 않으면 선택할 수 없다.
+    profile = None
+    if 'implant' in st.session_state:
+        profile = diffusion_pipeline.run(
+            dict(st.session_state.implant, N_A=N_A), st.session_state.pipeline_state, targets=["profile"], timer=timer,
+        )["profile"]
+    has_junction = profile is not None and np.isfinite(profile.N_D_mean)
+    use_diffusion = profile is not None and st.sidebar.checkbox(
+        "확산 공정 결과를 N_D로 사용", value=False, disabled=not has_junction,
+        help=None if has_junction else "확산 결과의 표면 농도가 N_A보다 낮아 접합이 없습니다.",
+    ) and has_junction
+
+    # 특정 n형 도핑 농도 선택
+    N_D_selected = st.sidebar.slider(
+    "n형 도핑 농도 (cm^-3)", 
+    min_value=1e13, max_value=1e20, value=1e19, format="%.1e", disabled=use_diffusion
+    )
+    T = st.sidebar.slider("온도 (K)", min_value=100, max_value=500, value= 300, step=10)
+
+    if use_diffusion:
+        N_D_selected = profile.N_D_mean
+        st.sidebar.caption(f"확산 결과: N_D = {N_D_selected:.2e} cm^-3 (접합 깊이 {profile.junction_depth * 1e4:.3f} µm)")
+
+    # 드레인 전류 계산 및 그래프 생성
+    results = mosfet_pipeline.run(
+        dict(W=W, L=L, Vgs=Vgs, N_A=N_A, N_D=N_D_selected, T=T),
+        st.session_state.pipeline_state,
+        targets=["figure" if use_matplotlib else "chart"],
+        timer=timer,
+    )
+    if use_matplotlib:
+        with timer("emit.pyplot"):
+            st.pyplot(results["figure"])
+    else:
+        with timer("emit.vega_lite_chart"):
+            st.vega_lite_chart(spec=results["chart"], use_container_width=True)
+
+    # 공정 변동 Monte Carlo: 현재 파라미터를 중심으로 N_A, N_D, T, W, L을 샘플링한다
+    with st.expander("공정 변동 Monte Carlo"):
+        n_samples = st.number_input("샘플 수", min_value=10_000, max_value=1_000_000, value=100_000, step=10_000)
+        size_sigma = st.slider("W/L 변동 (1σ, %)", 0.0, 10.0, 2.0, step=0.5)
+        doping_sigma = st.slider("도핑 변동 (1σ, decade)", 0.0, 0.2, 0.05, step=0.01)
+        T_sigma = st.slider("온도 변동 (1σ, K)", 0.0, 20.0, 5.0, step=1.0)
+        seed = st.number_input("시드", min_value=0, value=0, step=1)
+        # 계산은 작업 스레드에서 실행되며, 결과는 파라미터가 바뀌기 전까지 재실행 사이에도 유지된다
+        mc_key = (W, L, Vgs, N_A, N_D_selected, T, int(n_samples), size_sigma, doping_sigma, T_sigma, int(seed))
+        if st.button("Monte Carlo 실행"):
+            from semisim.sweep import LogNormal, Normal, monte_carlo
+
+            distributions = {
+                "N_A": LogNormal(N_A, doping_sigma),
+                "N_D": LogNormal(N_D_selected, doping_sigma),
+                "T": Normal(T, T_sigma),
+                "W": Normal(W, W * size_sigma / 100),
+                "L": Normal(L, L * size_sigma / 100),
+            }
+            mc_job = st.session_state.jobs.submit(
+                "monte_carlo", mc_key, monte_carlo, (distributions, int(n_samples)), dict(Vgs=Vgs, seed=int(seed)))
+        else:
+            # 파라미터가 바뀌었으면 진행 중인 작업을 취소한다
+            mc_job = st.session_state.jobs.current("monte_carlo", mc_key)
+        if mc_job is not None:
+            progress_bar = st.progress(0.0)
+            histogram = st.empty()
+            summary = st.empty()
+            # 청크가 끝날 때마다 부분 히스토그램과 백분위수를 갱신한다. 새 청크가 없어도 진행 막대를 다시 그려
+            # 그 사이의 슬라이더 조작이 다음 청크를 기다리지 않고 반영되게 한다
+            fraction = 0.0
+            for update in mc_job.updates(poll=POLL_SECONDS):
+                if update is None:
+                    progress_bar.progress(fraction)
+                    continue
+                progress = update.value
+                fraction = progress.n_done / progress.n_total
+                progress_bar.progress(fraction)
+                centers = (progress.edges[:-1] + progress.edges[1:]) / 2
+                histogram.bar_chart({"Id (µA)": centers * 1e6, "count": progress.counts}, x="Id (µA)", y="count")
+                summary.write(
+                    f"{progress.n_done:,} / {progress.n_total:,} 샘플 · 평균 {progress.mean * 1e6:.3f} µA · σ {progress.std * 1e6:.3f} µA · "
+                    + " · ".join(f"P{p} {v * 1e6:.3f} µA" for p, v in progress.percentiles.items())
+                )
+
+    # 바이어스 회로: 게이트 전원 V_G(= 위의 Vgs 값)와 소스/드레인 저항이 있을 때의 동작점, 부하선, V_G 스윕
+    with st.expander("바이어스 회로 (R_S, R_D)"):
+        V_DD = st.slider("드레인 전원 전압 (V_DD) [V]", 0.5, 10.0, 5.0, step=0.5)
+        R_D = st.slider("드레인 저항 (R_D) [kΩ]", 0.0, 500.0, 100.0, step=5.0)
+        R_S = st.slider("소스 저항 (R_S) [kΩ]", 0.0, 100.0, 10.0, step=1.0)
+        bias = mosfet_pipeline.run(
+            dict(W=W, L=L, Vgs=Vgs, N_A=N_A, N_D=N_D_selected, T=T, V_DD=V_DD, R_D=R_D * 1e3, R_S=R_S * 1e3),
+            st.session_state.pipeline_state,
+            targets=["bias_point"] + (["load_line_figure", "bias_sweep_figure"] if use_matplotlib
+                                      else ["load_line_chart", "bias_sweep_chart"]),
+            timer=timer,
+        )
+        op = bias["bias_point"]
+        st.caption(
+            f"동작점: Id = {float(op.Id) * 1e6:.3f} µA · Vgs = {float(op.Vgs):.3f} V · Vds = {float(op.Vds):.3f} V · "
+            f"{('차단', '선형', '포화')[int(op.region)]} 영역 ({int(op.iterations)}회 반복)"
+        )
+        col1, col2 = st.columns(2)
+        with col1, timer("emit.pyplot" if use_matplotlib else "emit.vega_lite_chart"):
+            if use_matplotlib:
+                st.pyplot(bias["load_line_figure"])
+            else:
+                st.vega_lite_chart(spec=bias["load_line_chart"], use_container_width=True)
+        with col2, timer("emit.pyplot" if use_matplotlib else "emit.vega_lite_chart"):
+            if use_matplotlib:
+                st.pyplot(bias["bias_sweep_figure"])
+            else:
+                st.vega_lite_chart(spec=bias["bias_sweep_chart"], use_container_width=True)
+
+    # 이동도 지도: 현재 설계점 하나가 아니라 도핑·온도 평면 전체의 이동도를 본다
+    with st.expander("이동도 지도 (설계 공간)"):
+        map_plane = st.radio("평면", ["N_D-T", "N_A-N_D"], horizontal=True,
+                             format_func=lambda p: "(N_D, T), N_A 고정" if p == "N_D-T" else "(N_A, N_D), T 고정")
+        map_quantity = st.radio("이동도", ["mu_eff", "mu_e", "mu_h"], horizontal=True,
+                                format_func={"mu_eff": "효과적인 이동도", "mu_e": "전자", "mu_h": "정공"}.get)
+        map_points = st.select_slider("격자 해상도 (축당 점 수)", [250, 500, 1000, 2000], value=1000)
+        map_float32 = st.checkbox("float32로 계산 (메모리·시간 절반)", value=False)
+        # 격자는 청크 단위로 계산하면서 표시 해상도로 줄이므로 전체 해상도 배열을 메모리에 두지 않는다
+        if st.checkbox("지도 그리기"):
+            if map_plane == "N_D-T":
+                map_fixed, map_point = N_A, (N_D_selected, T)
+            else:
+                map_fixed, map_point = T, (N_A, N_D_selected)
+            mobility = mobility_map_pipeline.run(
+                dict(map_plane=map_plane, map_quantity=map_quantity, map_points=map_points,
+                     map_float32=map_float32, map_fixed=map_fixed, map_point=map_point),
+                st.session_state.pipeline_state,
+                targets=["map", "map_figure" if use_matplotlib else "map_chart"],
+                timer=timer,
+            )
+            with timer("emit.pyplot" if use_matplotlib else "emit.vega_lite_chart"):
+                if use_matplotlib:
+                    st.pyplot(mobility["map_figure"])
+                else:
+                    st.vega_lite_chart(spec=mobility["map_chart"], use_container_width=True)
+            st.caption(
+                f"{map_points}×{map_points} 격자 · 범위 {mobility['map'].minimum:.3g} ~ {mobility['map'].maximum:.3g} cm^2/V·s"
+                + (" · 빨간 ×: 현재 설계점" if use_matplotlib else "")
+            )
+
+    # 웨이퍼 지도: 현재 설계점을 중심으로 공간적으로 상관된 공정 변동을 가진 웨이퍼 한 장의 모든 다이를 계산한다
+    with st.expander("웨이퍼 지도 (공간 공정 변동, 수율)"):
+        col1, col2 = st.columns(2)
+        with col1:
+            wafer_diameter = st.select_slider("웨이퍼 지름 [mm]", [100, 150, 200, 300], value=150)
+            die_size = st.select_slider("다이 크기 [mm]", [0.8, 1.0, 1.5, 2.0, 3.0, 5.0], value=1.0)
+            wafer_correlation = st.slider("공간 상관 길이 [mm]", 5.0, 100.0, 20.0, step=5.0)
+            local_ratio = st.slider("다이별 독립 변동 (공간 변동 대비 비율)", 0.0, 1.0, 0.2, step=0.05)
+            wafer_seed = st.number_input("웨이퍼 시드", min_value=0, value=0, step=1)
+        with col2:
+            # 각 파라미터의 (공간 변동 1σ, 중심 대비 가장자리 변화)
+            acceptor_var = (st.slider("N_A 변동 (1σ, decade)", 0.0, 0.2, 0.03, step=0.01),
+                            st.slider("N_A 가장자리 변화 (decade)", -0.2, 0.2, 0.0, step=0.01))
+            donor_var = (st.slider("N_D 변동 (1σ, decade)", 0.0, 0.2, 0.03, step=0.01),
+                         st.slider("N_D 가장자리 변화 (decade)", -0.2, 0.2, -0.02, step=0.01))
+            cox_var = (st.slider("Cox 변동 (1σ, %)", 0.0, 10.0, 1.0, step=0.5) / 100,
+                       st.slider("Cox 가장자리 변화 (%)", -10.0, 10.0, 2.0, step=0.5) / 100)
+            vth_var = (st.slider("Vth 변동 (1σ, mV)", 0.0, 200.0, 20.0, step=5.0) / 1e3,
+                       st.slider("Vth 가장자리 변화 (mV)", -200.0, 200.0, 50.0, step=5.0) / 1e3)
+        spec = st.slider("Id_sat 규격 범위 (설계점 대비, %)", -50.0, 50.0, (-10.0, 10.0), step=1.0)
+        wafer_zones = st.slider("구역 수 (같은 면적의 동심원)", 2, 8, 4)
+        if st.checkbox("웨이퍼 지도 그리기"):
+            variation = {
+                name: (sigma, radial, sigma * local_ratio)
+                for name, (sigma, radial) in
+                {"N_A": acceptor_var, "N_D": donor_var, "Cox": cox_var, "Vth": vth_var}.items()
+            }
+            # 규격 범위는 변동이 없는 설계점 다이의 Id_sat 기준이다. 설계점이 차단 영역(Vgs ≤ Vth, Id_sat = 0)이면
+            # 규격 범위가 (0, 0)으로 줄어 수율이 의미가 없으므로 규격 없이 분포만 본다
+            Id_nominal = float(calculate_id(Vgs, ID_SAT_VDS, W, L, N_D_selected, N_A, T))
+            cut_off = Id_nominal <= 0
+            if cut_off:
+                spec_window = (None, None)
+            else:
+                spec_window = (Id_nominal * (1 + spec[0] / 100), Id_nominal * (1 + spec[1] / 100))
+            wafer = wafer_pipeline.run(
+                dict(wafer_diameter=wafer_diameter, die_size=die_size, edge_exclusion=3.0, N_A=N_A, N_D=N_D_selected,
+                     wafer_variation=variation, wafer_correlation=wafer_correlation, wafer_seed=int(wafer_seed),
+                     Vgs=Vgs, W=W, L=L, T=T, spec_window=spec_window, wafer_zones=wafer_zones),
+                st.session_state.pipeline_state,
+                targets=["wafer_stats", "wafer_figure" if use_matplotlib else "wafer_chart"],
+                timer=timer,
+            )
+            with timer("emit.pyplot" if use_matplotlib else "emit.vega_lite_chart"):
+                if use_matplotlib:
+                    st.pyplot(wafer["wafer_figure"])
+                else:
+                    st.vega_lite_chart(spec=wafer["wafer_chart"], use_container_width=True)
+            stats = wafer["wafer_stats"]
+            if cut_off:
+                st.caption(
+                    f"차단 영역: 설계점의 Vgs = {Vgs:g} V가 임계 전압 이하이므로 Id_sat 규격과 수율을 계산하지 않습니다 "
+                    "(지도와 구역 통계는 임계 전압이 낮은 다이의 전류를 보여 줍니다)."
+                )
+            else:
+                st.caption(
+                    f"수율 {stats.yield_ * 100:.2f}% ({int(stats.passed.sum()):,} / {stats.passed.size:,} 다이) · "
+                    f"규격 {spec_window[0] * 1e6:.3f} ~ {spec_window[1] * 1e6:.3f} µA (설계점 {Id_nominal * 1e6:.3f} µA)"
+                    + (" · 빨간색: 불합격 다이, 점선: 구역 경계" if use_matplotlib else "")
+                )
+            zones = stats.zones
+            table = {
+                "구역": [f"{k + 1}" for k in range(wafer_zones)],
+                "반지름 [mm]": [f"{a:.1f} ~ {b:.1f}" for a, b in zip(zones.r_inner, zones.r_outer)],
+                "다이 수": [f"{c:,}" for c in zones.count],
+            }
+            if not cut_off:
+                table["수율 [%]"] = [f"{y * 100:.2f}" for y in zones.yield_]
+            table["평균 [µA]"] = [f"{v * 1e6:.3f}" for v in zones.mean]
+            table["σ [µA]"] = [f"{v * 1e6:.3f}" for v in zones.std]
+            table["P5 / P50 / P95 [µA]"] = [f"{a * 1e6:.3f} / {b * 1e6:.3f} / {c * 1e6:.3f}"
+                                           for a, b, c in zip(zones.p05, zones.p50, zones.p95)]
+            st.table(table)
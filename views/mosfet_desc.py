@@ -0,0 +1,116 @@
+"""
+About MOSFET 페이지: 단계별 공정 설명과 3D 뷰어, 이온 주입/확산 조건.
+
+3D 뷰어 컴포넌트(streamlit.components.v1)는 이 페이지에서만 import 된다.
+"""
+import numpy as np
+import streamlit as st
+
+from semisim.process_flow import IMPLANT_STEP, steps_description
+from semisim.process_viewer import process_viewer
+from semisim.stages import diffusion_pipeline
+
+
+def render(use_matplotlib, timer):
+    """
+    페이지를 그린다.
+
+    Parameters:
+    - use_matplotlib: True이면 그래프를 matplotlib 이미지로, False이면 브라우저 차트로 그린다
+    - timer: 구간 이름을 받아 시간 측정 컨텍스트를 돌려주는 함수 (Profiler.timer 또는 null_timer)
+    """
+    # Streamlit 사이드바 설정
+    st.sidebar.title("MOSFET 공정 시뮬레이션")
+    st.sidebar.write("각 공정 단계를 순서대로 확인하세요.")
+
+    # 버튼 상태 관리
+    if 'step' not in st.session_state:
+        st.session_state['step'] = 0
+
+    # CSS와 HTML을 사용하여 스타일 설정
+    st.markdown("""
+        <style>
+            .main { background-color: #f9f9f9; }
+            .stTitle { color: #34495e; font-weight: bold; font-size: 26px; text-align: center; margin-top: 10px; margin-bottom: 10px; }
+            .button-container { display: flex; justify-content: space-between; align-items: center; padding: 5px 80px; margin-top: -10px; margin-bottom: 10px; }
+            .stButton button { background-color: #3498db; color: white; border: none; padding: 10px 20px; border-radius: 5px; font-size: 14px; font-weight: bold; cursor: pointer; transition: background-color 0.3s; }
+            .stButton button:hover { background-color: #2980b9; }
+            .step-display { text-align: center; font-size: 16px; color: #444444; font-weight: bold; margin-top: 5px; }
+            .three-js-container { display: flex; justify-content: center; border-radius: 10px; background-color: #ffffff; padding: 5px; box-shadow: 0px 4px 8px rgba(0, 0, 0, 0.2); margin-top: 10px; margin-bottom: 10px; }
+            .description-box { background-color: #ecf0f1; border-radius: 10px; padding: 15px; font-size: 16px; color: #2c3e50; margin-top: 10px; text-align: left; }
+        </style>
+    """, unsafe_allow_html=True)
+
+    # Streamlit에서 HTML 포함
+    with st.container():
+        st.markdown("<div class='stTitle'>MOSFET 3D 공정 시뮬레이션</div>", unsafe_allow_html=True)
+
+        # 버튼 영역 생성
+        st.write('<div class="button-container">', unsafe_allow_html=True)
+
+        def go_to_step(step):
+            st.session_state['step'] = min(max(step, 0), len(steps_description) - 1)
+
+        col1, col2, col3 = st.columns([1, 3, 1])
+        with col1:
+            st.button("이전", on_click=go_to_step, args=(st.session_state['step'] - 1,))
+
+        with col3:
+            st.button("다음", on_click=go_to_step, args=(st.session_state['step'] + 1,))
+
+        st.write('</div>', unsafe_allow_html=True)
+
+        # 현재 단계 표시 및 단계별 설명 박스
+        st.write(f'<div class="step-display">현재 단계: {st.session_state["step"] + 1}</div>', unsafe_allow_html=True)
+        st.write(f'<div class="description-box">{steps_description[st.session_state["step"]]}</div>', unsafe_allow_html=True)
+
+        # 이온 주입/확산 조건 (15단계에서 정하며, 이후 단계의 3D 장면과 MOSFET 시뮬레이터의 N_D에 반영된다)
+        if 'implant' not in st.session_state:
+            st.session_state.implant = dict(dose=1e15, energy=100, time=30, temperature=1000, N_A=1e16)
+        implant = st.session_state.implant
+        if st.session_state['step'] == IMPLANT_STEP:
+            dose_options = [1e13, 3e13, 1e14, 3e14, 1e15, 3e15, 1e16]
+            col1, col2 = st.columns(2)
+            with col1:
+                implant["dose"] = st.select_slider("주입량 (cm^-2)", dose_options, value=implant["dose"],
+                                                   format_func=lambda d: f"{d:.0e}")
+                implant["energy"] = st.slider("주입 에너지 (keV)", 10, 300, implant["energy"], step=10)
+            with col2:
+                implant["time"] = st.slider("열처리 시간 (분)", 1, 120, implant["time"])
+                implant["temperature"] = st.slider("열처리 온도 (°C)", 800, 1150, implant["temperature"], step=10)
+            implant["N_A"] = st.slider("기판 p형 도핑 농도 (cm^-3)", min_value=1e15, max_value=1e17,
+                                       value=implant["N_A"], format="%.1e")
+
+        doped_depth = None
+        if st.session_state['step'] >= IMPLANT_STEP:
+            diffusion = diffusion_pipeline.run(
+                implant,
+                st.session_state.pipeline_state,
+                targets=["profile", "profile_figure" if use_matplotlib else "profile_chart"],
+                timer=timer,
+            )
+            profile = diffusion["profile"]
+            doped_depth = profile.junction_depth * 1e4 if np.isfinite(profile.junction_depth) else None
+
+        # 3D 시뮬레이션 (뷰어는 한 번만 로드되고 단계가 바뀌면 변경된 층만 갱신된다)
+        with timer("emit.process_viewer"):
+            process_viewer(st.session_state['step'], doped_depth=doped_depth)
+
+        if st.session_state['step'] == IMPLANT_STEP:
+            if doped_depth is not None:
+                junction = f"접합 깊이 {doped_depth:.3f} µm · 접합 내 평균 N_D {profile.N_D_mean:.2e} cm^-3"
+            else:
+                junction = "접합 없음 (표면 N_D < N_A)"
+            st.caption(f"{junction} · 확산 길이 √(Dt) {profile.diffusion_length * 1e4:.3f} µm")
+            with timer("emit.pyplot" if use_matplotlib else "emit.vega_lite_chart"):
+                if use_matplotlib:
+                    st.pyplot(diffusion["profile_figure"])
+                else:
+                    st.vega_lite_chart(spec=diffusion["profile_chart"], use_container_width=True)
+            # 2차원 단면은 등고선 그리기가 무거우므로 요청한 경우에만 그린다
+            if st.checkbox("2차원 단면 보기 (게이트 가장자리의 가로 확산)"):
+                section = diffusion_pipeline.run(
+                    implant, st.session_state.pipeline_state, targets=["section_figure"], timer=timer,
+                )
+                with timer("emit.pyplot"):
+                    st.pyplot(section["section_figure"])